@@ -0,0 +1,122 @@
+"""Google A2A Protocol - Per-task event fan-out for SSE subscribers
+
+process_task publishes each event once; the broker encodes it as an SSE
+frame and copies the frame to every subscriber's queue, so any number of
+subscribers share a single agent run.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, Dict, Optional, Set
+
+from pydantic import BaseModel
+
+from config import settings
+from metrics import register_collector
+
+logger = logging.getLogger("a2a")
+
+# Marks the end of a task's stream in subscriber queues
+_CLOSED = None
+
+
+def sse_frame(event: str, payload: BaseModel) -> str:
+    """Encode one Server-Sent Events frame."""
+    return f"event: {event}\ndata: {payload.model_dump_json()}\n\n"
+
+
+class TaskEventBroker:
+    """Fans task events out to bounded per-subscriber asyncio queues.
+
+    A subscriber that falls `queue_size` frames behind is disconnected
+    rather than slowing down the task or growing memory without bound.
+    Must be used from the event loop thread.
+    """
+
+    def __init__(self, queue_size: int = 256):
+        self.queue_size = queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self.dropped = 0
+
+    def subscribe(self, task_id: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(task_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, task_id: str, queue: asyncio.Queue):
+        queues = self._subscribers.get(task_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[task_id]
+
+    def has_subscribers(self, task_id: str) -> bool:
+        return task_id in self._subscribers
+
+    def _drop(self, task_id: str, queue: asyncio.Queue):
+        """Disconnect a lagging subscriber (its stream ends after what it has)."""
+        self.unsubscribe(task_id, queue)
+        self.dropped += 1
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(_CLOSED)
+        logger.warning("Dropped slow SSE subscriber for task %s", task_id)
+
+    def publish(self, task_id: str, event: str, payload: BaseModel):
+        """Send an event to every subscriber of `task_id` (no-op without any)."""
+        queues = self._subscribers.get(task_id)
+        if not queues:
+            return
+        frame = sse_frame(event, payload)
+        for queue in list(queues):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._drop(task_id, queue)
+
+    def close(self, task_id: str):
+        """End the stream of every subscriber of `task_id`."""
+        for queue in self._subscribers.pop(task_id, set()):
+            try:
+                queue.put_nowait(_CLOSED)
+            except asyncio.QueueFull:
+                self._drop(task_id, queue)
+
+    async def stream(
+        self,
+        task_id: str,
+        queue: asyncio.Queue,
+        first: Optional[str] = None,
+        keepalive: float = settings.a2a_sse_keepalive_seconds,
+    ) -> AsyncIterator[str]:
+        """Yield SSE frames from `queue` until the task's stream is closed.
+
+        Sends a comment line every `keepalive` seconds of silence so
+        proxies keep the connection open.
+        """
+        try:
+            if first is not None:
+                yield first
+            while True:
+                try:
+                    frame = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if frame is _CLOSED:
+                    break
+                yield frame
+        finally:
+            self.unsubscribe(task_id, queue)
+
+    def stats(self) -> dict:
+        return {
+            "tasks": len(self._subscribers),
+            "subscribers": sum(len(q) for q in self._subscribers.values()),
+            "dropped": self.dropped,
+        }
+
+
+broker = TaskEventBroker(queue_size=settings.a2a_sse_queue_size)
+register_collector("a2a_streams", broker.stats)
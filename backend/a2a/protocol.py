@@ -128,26 +128,39 @@ class Task(BaseModel):
     completed_at: Optional[datetime] = None
     metadata: Optional[Dict[str, Any]] = None
 
+    @property
+    def is_final(self) -> bool:
+        """Completed, failed and cancelled are terminal states"""
+        return self.state in (TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELLED)
+
     def start(self):
         """Mark task as running"""
+        if self.is_final:
+            return
         self.state = TaskState.RUNNING
         self.updated_at = datetime.utcnow()
 
     def complete(self, output: TaskOutput):
-        """Mark task as completed"""
+        """Mark task as completed (no-op once the task is final)"""
+        if self.is_final:
+            return
         self.state = TaskState.COMPLETED
         self.output = output
         self.updated_at = datetime.utcnow()
         self.completed_at = datetime.utcnow()
 
     def fail(self, error: str):
-        """Mark task as failed"""
+        """Mark task as failed (no-op once the task is final)"""
+        if self.is_final:
+            return
         self.state = TaskState.FAILED
         self.error = error
         self.updated_at = datetime.utcnow()
 
     def cancel(self):
-        """Mark task as cancelled"""
+        """Mark task as cancelled (no-op once the task is final)"""
+        if self.is_final:
+            return
         self.state = TaskState.CANCELLED
         self.updated_at = datetime.utcnow()
 
@@ -179,3 +192,26 @@ class TaskStatusResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     completed_at: Optional[datetime] = None
+
+
+class TaskStatusUpdateEvent(BaseModel):
+    """Streamed when a task changes state (final=True on the last event)"""
+    id: str
+    state: TaskState
+    output: Optional[TaskOutput] = None
+    error: Optional[str] = None
+    final: bool = False
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+class TaskMessageDeltaEvent(BaseModel):
+    """Streamed piece of the agent's reply while the task runs"""
+    id: str
+    role: MessageRole = MessageRole.AGENT
+    delta: str
+
+
+class TaskArtifactUpdateEvent(BaseModel):
+    """Streamed when the task produces an artifact"""
+    id: str
+    artifact: Artifact
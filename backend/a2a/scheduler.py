@@ -0,0 +1,215 @@
+"""Google A2A Protocol - Bounded task scheduler
+
+Background tasks run on a fixed number of asyncio workers fed by a
+priority queue (lower number = sooner, by skill_id). Admission control
+rejects new tasks once the queue is full or a client already has too
+many tasks queued or running.
+"""
+
+import asyncio
+import itertools
+import logging
+import math
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from config import settings
+from metrics import Histogram, register_collector
+
+logger = logging.getLogger("a2a")
+
+
+class SchedulerBusy(Exception):
+    """Raised when a task cannot be admitted; retry after `retry_after` seconds."""
+
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TaskScheduler:
+    """Priority queue + worker pool for A2A task execution."""
+
+    def __init__(
+        self,
+        workers: int,
+        max_queue: int,
+        max_per_client: int,
+        skill_priorities: Dict[str, int],
+        default_priority: int = 5,
+    ):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.max_per_client = max_per_client
+        self.skill_priorities = skill_priorities
+        self.default_priority = default_priority
+        self._queue: Optional[asyncio.PriorityQueue] = None
+        self._workers: List[asyncio.Task] = []
+        self._seq = itertools.count()
+        # Per client: admitted (reserved), queued and running tasks
+        self._per_client: Dict[str, int] = {}
+        # Admitted tasks not submitted yet (their slot is already taken)
+        self.reserved = 0
+        # Running task_id -> asyncio.Task executing it
+        self._handles: Dict[str, asyncio.Task] = {}
+        # Task ids queued or running on this process
+        self._local: Set[str] = set()
+        self.running = 0
+        self.cancelled = 0
+        self.rejected_queue_full = 0
+        self.rejected_client_quota = 0
+        self.wait_ms = Histogram()
+        self.run_ms = Histogram()
+
+    def _ensure_started(self):
+        """Start the workers on the running event loop (first submit)."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.PriorityQueue()
+        self._workers = [
+            asyncio.create_task(self._worker(i), name=f"a2a-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info("A2A scheduler started with %d workers", self.workers)
+
+    async def stop(self):
+        """Cancel the workers (app shutdown). Queued tasks are not run."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    @property
+    def depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _retry_after(self, backlog: int) -> int:
+        """Seconds until roughly `backlog` tasks have drained."""
+        avg_run_s = (self.run_ms.snapshot()["avg"] or 1000) / 1000
+        return max(1, min(120, math.ceil(backlog / self.workers * avg_run_s)))
+
+    def priority_for(self, skill_id: Optional[str]) -> int:
+        return self.skill_priorities.get(skill_id or "", self.default_priority)
+
+    def admit(self, client_id: str):
+        """Reserve a queue slot for a new task from `client_id`.
+
+        Raises SchedulerBusy. The reservation is taken synchronously, so
+        concurrent requests cannot all pass the check while the first one
+        is still saving its task; follow with submit(), or release() if
+        the task cannot be submitted.
+        """
+        backlog = self.depth + self.reserved
+        if backlog >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise SchedulerBusy("Task queue is full", self._retry_after(backlog))
+        if self._per_client.get(client_id, 0) >= self.max_per_client:
+            self.rejected_client_quota += 1
+            raise SchedulerBusy("Too many tasks in progress for this client", self._retry_after(1))
+        self.reserved += 1
+        self._per_client[client_id] = self._per_client.get(client_id, 0) + 1
+
+    def release(self, client_id: str):
+        """Give back a slot reserved by admit() that will not be submitted."""
+        self.reserved -= 1
+        self._release(client_id)
+
+    def submit(
+        self,
+        task_id: str,
+        run: Callable[[str], Awaitable],
+        skill_id: Optional[str] = None,
+        client_id: str = "anonymous",
+    ):
+        """Queue `run(task_id)` for execution by a worker (slot reserved by admit)."""
+        self._ensure_started()
+        self._local.add(task_id)
+        self.reserved -= 1
+        self._queue.put_nowait((
+            self.priority_for(skill_id),
+            next(self._seq),
+            task_id,
+            run,
+            client_id,
+            time.perf_counter(),
+        ))
+
+    def is_local(self, task_id: str) -> bool:
+        """Whether `task_id` is queued or running on this process."""
+        return task_id in self._local
+
+    def cancel(self, task_id: str) -> bool:
+        """Interrupt a running task (CancelledError is raised inside it).
+
+        Returns False if the task is not running on this process; queued
+        tasks are skipped by their runner once marked cancelled.
+        """
+        handle = self._handles.get(task_id)
+        if handle is None or handle.done():
+            return False
+        handle.cancel()
+        self.cancelled += 1
+        return True
+
+    def _release(self, client_id: str):
+        remaining = self._per_client.get(client_id, 1) - 1
+        if remaining > 0:
+            self._per_client[client_id] = remaining
+        else:
+            self._per_client.pop(client_id, None)
+
+    async def _worker(self, index: int):
+        while True:
+            _, _, task_id, run, client_id, submitted = await self._queue.get()
+            started = time.perf_counter()
+            self.wait_ms.observe((started - submitted) * 1000)
+            self.running += 1
+            # Run in its own asyncio.Task so cancel() can interrupt it
+            handle = asyncio.create_task(run(task_id), name=f"a2a-task-{task_id}")
+            self._handles[task_id] = handle
+            try:
+                # asyncio.wait does not forward the worker's own cancellation
+                # to the handle, so the two cases can be told apart
+                await asyncio.wait([handle])
+                if handle.cancelled():
+                    logger.info("A2A task %s cancelled in worker %d", task_id, index)
+                elif handle.exception() is not None:
+                    logger.error("A2A task %s failed in worker %d: %s", task_id, index, handle.exception())
+            except asyncio.CancelledError:
+                # The worker itself is being cancelled (shutdown)
+                handle.cancel()
+                raise
+            finally:
+                self._handles.pop(task_id, None)
+                self._local.discard(task_id)
+                self.running -= 1
+                self.run_ms.observe((time.perf_counter() - started) * 1000)
+                self._release(client_id)
+                self._queue.task_done()
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "max_per_client": self.max_per_client,
+            "queue_depth": self.depth,
+            "reserved": self.reserved,
+            "running": self.running,
+            "cancelled": self.cancelled,
+            "clients": len(self._per_client),
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_client_quota": self.rejected_client_quota,
+            "wait_ms": self.wait_ms.snapshot(),
+            "run_ms": self.run_ms.snapshot(),
+        }
+
+
+scheduler = TaskScheduler(
+    workers=settings.a2a_workers,
+    max_queue=settings.a2a_max_queue,
+    max_per_client=settings.a2a_max_tasks_per_client,
+    skill_priorities=settings.a2a_skill_priorities,
+)
+register_collector("a2a_scheduler", scheduler.stats)
@@ -1,14 +1,19 @@
 """Google A2A Protocol - Server endpoints"""
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import Dict
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, Dict, Optional
+from config import settings
+from database.pagination import InvalidCursor
+from .events import broker, sse_frame
 from .protocol import (
-    AgentCard, AgentCapabilities, Skill, Task, TaskInput,
-    TaskOutput, TaskState, TaskCreateRequest, TaskStatusResponse
+    AgentCard, AgentCapabilities, Skill, Task, TaskInput, Artifact,
+    TaskOutput, TaskState, TaskCreateRequest, TaskStatusResponse,
+    TaskStatusUpdateEvent, TaskMessageDeltaEvent, TaskArtifactUpdateEvent
 )
-
-# Task storage (in production, use Redis or database)
-tasks: Dict[str, Task] = {}
+from .scheduler import scheduler, SchedulerBusy
+from .store import task_store, FINISHED_STATES
 
 # Define the agent card
 AGENT_CARD = AgentCard(
@@ -54,24 +59,52 @@ async def get_agent_card() -> AgentCard:
     return AGENT_CARD
 
 
-@a2a_router.post("/a2a/tasks")
-async def create_task(
-    request: TaskCreateRequest,
-    background_tasks: BackgroundTasks
-) -> Task:
-    """Create a new task"""
-    task = Task(
-        input=TaskInput(
-            skill_id=request.skill_id,
-            message=request.message,
-            context=request.context
-        )
+def _client_id(request: Request) -> str:
+    """Caller identity for per-client quotas (X-Client-Id, else remote address)."""
+    return request.headers.get("X-Client-Id") or (
+        request.client.host if request.client else "anonymous"
     )
 
-    tasks[task.id] = task
 
-    # Process task in background
-    background_tasks.add_task(process_task, task.id)
+async def _enqueue_task(request: TaskCreateRequest, client_id: str) -> Task:
+    """Admit and store a new task (429 when the scheduler is saturated).
+
+    The caller submits it right after, with no await in between: the slot
+    reserved by admit() is only consumed by submit().
+    """
+    try:
+        scheduler.admit(client_id)
+    except SchedulerBusy as e:
+        raise HTTPException(
+            status_code=429,
+            detail=e.reason,
+            headers={"Retry-After": str(e.retry_after)},
+        )
+
+    try:
+        task = Task(
+            input=TaskInput(
+                skill_id=request.skill_id,
+                message=request.message,
+                context=request.context
+            )
+        )
+        await task_store.save(task)
+    except BaseException:
+        # Store error or client gone: free the reserved slot
+        scheduler.release(client_id)
+        raise
+    return task
+
+
+@a2a_router.post("/a2a/tasks")
+async def create_task(request: TaskCreateRequest, http_request: Request) -> Task:
+    """Create a new task"""
+    client_id = _client_id(http_request)
+    task = await _enqueue_task(request, client_id)
+
+    # Process task on the scheduler's workers
+    scheduler.submit(task.id, process_task, skill_id=task.input.skill_id, client_id=client_id)
 
     return task
 
@@ -79,20 +112,20 @@ async def create_task(
 @a2a_router.get("/a2a/tasks/{task_id}")
 async def get_task(task_id: str) -> Task:
     """Get task status"""
-    if task_id not in tasks:
+    task = await task_store.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    return tasks[task_id]
+    return task
 
 
 @a2a_router.post("/a2a/tasks/{task_id}/cancel")
 async def cancel_task(task_id: str) -> Task:
     """Cancel a running task"""
-    if task_id not in tasks:
+    task = await task_store.get(task_id)
+    if task is None:
         raise HTTPException(status_code=404, detail="Task not found")
 
-    task = tasks[task_id]
-
     if task.state not in [TaskState.PENDING, TaskState.RUNNING]:
         raise HTTPException(
             status_code=400,
@@ -100,57 +133,199 @@ async def cancel_task(task_id: str) -> Task:
         )
 
     task.cancel()
+    await task_store.save(task)
+    _publish_status(task)
+
+    # Interrupt the agent run (LLM calls included) if it runs in this process;
+    # with a shared store the replica running it sees the cancelled state
+    # within A2A_REMOTE_POLL_SECONDS (_watch_remote_cancel)
+    scheduler.cancel(task_id)
     return task
 
 
 @a2a_router.get("/a2a/tasks")
 async def list_tasks(
     state: TaskState = None,
-    limit: int = 20,
-    offset: int = 0
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page")
 ) -> Dict:
-    """List tasks with optional filtering"""
-    filtered = list(tasks.values())
-
-    if state:
-        filtered = [t for t in filtered if t.state == state]
-
-    # Sort by created_at descending
-    filtered.sort(key=lambda t: t.created_at, reverse=True)
-
-    # Apply pagination
-    paginated = filtered[offset:offset + limit]
+    """List tasks (newest first) with optional filtering"""
+    try:
+        page, next_cursor = await task_store.list(state=state, limit=limit, cursor=cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return {
-        "tasks": paginated,
-        "total": len(filtered),
+        "tasks": page,
         "limit": limit,
-        "offset": offset
+        "next_cursor": next_cursor
     }
 
 
+def _status_event(task: Task) -> TaskStatusUpdateEvent:
+    return TaskStatusUpdateEvent(
+        id=task.id,
+        state=task.state,
+        output=task.output,
+        error=task.error,
+        final=task.state in FINISHED_STATES,
+    )
+
+
+def _publish_status(task: Task):
+    """Push a state transition to subscribers (ending their streams if final)."""
+    broker.publish(task.id, "status", _status_event(task))
+    if task.state in FINISHED_STATES:
+        broker.close(task.id)
+
+
+def _sse_response(frames) -> StreamingResponse:
+    return StreamingResponse(
+        frames,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _event_stream(task: Task, queue: Optional[asyncio.Queue]) -> StreamingResponse:
+    """SSE response starting with the task's current status."""
+    first = sse_frame("status", _status_event(task))
+    if queue is None:
+        return _sse_response(iter([first]))
+    return _sse_response(broker.stream(task.id, queue, first=first))
+
+
+async def _poll_status_frames(
+    task: Task,
+    interval: float,
+    keepalive: float = settings.a2a_sse_keepalive_seconds,
+) -> AsyncIterator[str]:
+    """Status frames of a task run by another replica, read from the store.
+
+    Only state transitions are available this way (no message deltas or
+    artifacts until the final status, which carries the output).
+    """
+    loop = asyncio.get_running_loop()
+    yield sse_frame("status", _status_event(task))
+    last_frame = loop.time()
+    state = task.state
+    while state not in FINISHED_STATES:
+        await asyncio.sleep(interval)
+        current = await task_store.get(task.id)
+        if current is None:
+            break
+        if current.state != state:
+            state = current.state
+            yield sse_frame("status", _status_event(current))
+            last_frame = loop.time()
+        elif loop.time() - last_frame >= keepalive:
+            yield ": keepalive\n\n"
+            last_frame = loop.time()
+
+
+@a2a_router.post("/a2a/tasks/sendSubscribe")
+async def send_subscribe(request: TaskCreateRequest, http_request: Request) -> StreamingResponse:
+    """Create a task and stream its events (Server-Sent Events)
+
+    Events: `status` (state transitions, `final` on the last one),
+    `message` (reply deltas) and `artifact`.
+    """
+    client_id = _client_id(http_request)
+    task = await _enqueue_task(request, client_id)
+
+    # Subscribe before the run starts so no event is missed
+    queue = broker.subscribe(task.id)
+    scheduler.submit(task.id, process_task, skill_id=task.input.skill_id, client_id=client_id)
+
+    return _event_stream(task, queue)
+
+
+@a2a_router.get("/a2a/tasks/{task_id}/subscribe")
+async def subscribe_task(task_id: str) -> StreamingResponse:
+    """Stream the events of an existing task (Server-Sent Events)
+
+    Subscribers of the same task share its single agent run. A task
+    queued or running on another replica (shared store) is followed by
+    polling the store, which yields its status transitions only.
+    """
+    queue = broker.subscribe(task_id)
+    task = await task_store.get(task_id)
+    if task is None:
+        broker.unsubscribe(task_id, queue)
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    if task.state in FINISHED_STATES:
+        broker.unsubscribe(task_id, queue)
+        return _event_stream(task, None)
+
+    if not scheduler.is_local(task_id):
+        broker.unsubscribe(task_id, queue)
+        return _sse_response(_poll_status_frames(task, settings.a2a_remote_poll_seconds))
+
+    return _event_stream(task, queue)
+
+
 async def process_task(task_id: str):
     """Process a task (placeholder - will be implemented with LangGraph agents)"""
-    if task_id not in tasks:
+    task = await task_store.get(task_id)
+    # Gone (purged/evicted) or cancelled while queued
+    if task is None or task.state != TaskState.PENDING:
         return
 
-    task = tasks[task_id]
     task.start()
+    await task_store.save(task)
+    _publish_status(task)
+
+    watcher = None
+    if task_store.shared:
+        watcher = asyncio.create_task(_watch_remote_cancel(task.id, settings.a2a_remote_poll_seconds))
+    try:
+        await _run_agent(task)
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+
+
+async def _watch_remote_cancel(task_id: str, interval: float):
+    """Interrupt the local run once another replica marks the task cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        current = await task_store.get(task_id)
+        if current is not None and current.state == TaskState.CANCELLED:
+            scheduler.cancel(task_id)
+            return
 
+
+async def _run_agent(task: Task):
+    """Run the orchestrator for a started task and store its outcome."""
     try:
         # Import here to avoid circular imports
-        from agents.orchestrator.agent import process_request
+        from agents.orchestrator.agent import stream_request
 
-        # Process with orchestrator agent
-        result = await process_request(
+        # Process with orchestrator agent, streaming to subscribers
+        result = {}
+        artifacts = []
+        async for event in stream_request(
             message=task.input.message,
             skill_id=task.input.skill_id,
             context=task.input.context
-        )
+        ):
+            if event["type"] == "token":
+                broker.publish(task.id, "message", TaskMessageDeltaEvent(
+                    id=task.id, delta=event["content"]
+                ))
+            elif event["type"] == "ui_action":
+                artifact = Artifact(type="json", name="ui_action", content=event["action"])
+                artifacts.append(artifact)
+                broker.publish(task.id, "artifact", TaskArtifactUpdateEvent(
+                    id=task.id, artifact=artifact
+                ))
+            elif event["type"] == "done":
+                result = event
 
         task.complete(TaskOutput(
-            message=result.get("response", "Task completed"),
-            artifacts=result.get("artifacts", []),
+            message=result.get("response") or "Task completed",
+            artifacts=artifacts,
             metadata=result.get("metadata")
         ))
 
@@ -161,5 +336,23 @@ async def process_task(task_id: str):
             metadata={"note": "Agents not yet implemented"}
         ))
 
+    except asyncio.CancelledError:
+        # cancel_task interrupted the run: record it, then let it propagate
+        task.cancel()
+        await asyncio.shield(_save_final(task))
+        raise
+
     except Exception as e:
         task.fail(str(e))
+
+    await _save_final(task)
+
+
+async def _save_final(task: Task):
+    """Store a task's outcome unless it was cancelled meanwhile (possibly by another replica)."""
+    current = await task_store.get(task.id)
+    if current is not None and current is not task and current.state == TaskState.CANCELLED:
+        task = current
+    else:
+        await task_store.save(task)
+    _publish_status(task)
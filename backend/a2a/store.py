@@ -0,0 +1,287 @@
+"""Google A2A Protocol - Task storage
+
+Tasks are listed newest first, keyed on (created_at, id), with keyset
+cursors from database.pagination. Finished tasks (completed, failed,
+cancelled) are purged once they are older than the retention period.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from config import settings
+from database.models import A2ATask
+from database.pagination import encode_cursor, decode_cursor, keyset_after
+from database.session import create_session, run_db
+from metrics import register_collector
+from .protocol import Task, TaskState
+
+logger = logging.getLogger("a2a")
+
+FINISHED_STATES = (TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELLED)
+
+
+def _sort_key(task: Task) -> tuple:
+    return (task.created_at, task.id)
+
+
+def _next_cursor(page: List[Task], has_more: bool) -> Optional[str]:
+    if not has_more or not page:
+        return None
+    return encode_cursor(_sort_key(page[-1]))
+
+
+class TaskStore(ABC):
+    """Storage backend for A2A tasks."""
+
+    # Whether other replicas read and write the same tasks
+    shared = False
+
+    @abstractmethod
+    async def get(self, task_id: str) -> Optional[Task]:
+        """Return a task by id, or None."""
+
+    @abstractmethod
+    async def save(self, task: Task):
+        """Insert or update a task."""
+
+    @abstractmethod
+    async def list(
+        self,
+        state: Optional[TaskState] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Task], Optional[str]]:
+        """Return a page of tasks (newest first) and the cursor of the next page.
+
+        Raises database.pagination.InvalidCursor for a malformed cursor.
+        """
+
+    @abstractmethod
+    async def purge(self, older_than: datetime) -> int:
+        """Delete finished tasks last updated before `older_than` (naive UTC)."""
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Counters for the metrics endpoint."""
+
+
+class InMemoryTaskStore(TaskStore):
+    """Per-process store bounded to `max_tasks`, evicting finished tasks.
+
+    Only finished tasks are evicted, least recently used first, from their
+    own ordered index, so a save never scans the store. Pending and
+    running tasks are never evicted (their runner still needs them); the
+    scheduler's queue bound keeps their number below `max_tasks` (see
+    create_task_store). Tasks are kept in creation order as well, so
+    listing walks from the newest task instead of sorting the whole store.
+    """
+
+    def __init__(self, max_tasks: int = 1000):
+        self.max_tasks = max_tasks
+        self._by_created: Dict[str, Task] = {}
+        # Finished task ids, least recently used first
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        self.evicted = 0
+        self.purged = 0
+
+    def _remove(self, task_id: str):
+        self._by_created.pop(task_id, None)
+        self._finished.pop(task_id, None)
+
+    def _evict(self):
+        while len(self._by_created) > self.max_tasks and self._finished:
+            victim, _ = self._finished.popitem(last=False)
+            self._by_created.pop(victim, None)
+            self.evicted += 1
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        task = self._by_created.get(task_id)
+        if task_id in self._finished:
+            self._finished.move_to_end(task_id)
+        return task
+
+    async def save(self, task: Task):
+        # Reassigning an existing key keeps its creation-order position
+        self._by_created[task.id] = task
+        if task.state in FINISHED_STATES:
+            self._finished[task.id] = None
+            self._finished.move_to_end(task.id)
+        else:
+            self._finished.pop(task.id, None)
+        self._evict()
+
+    async def list(
+        self,
+        state: Optional[TaskState] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Task], Optional[str]]:
+        after = decode_cursor(cursor, 2)
+        after = tuple(after) if after else None
+
+        page: List[Task] = []
+        has_more = False
+        for task in reversed(self._by_created.values()):
+            if after is not None and _sort_key(task) >= after:
+                continue
+            if state is not None and task.state != state:
+                continue
+            if len(page) == limit:
+                has_more = True
+                break
+            page.append(task)
+        return page, _next_cursor(page, has_more)
+
+    async def purge(self, older_than: datetime) -> int:
+        stale = [tid for tid in self._finished if self._by_created[tid].updated_at < older_than]
+        for tid in stale:
+            self._remove(tid)
+        self.purged += len(stale)
+        return len(stale)
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "size": len(self._by_created),
+            "active": len(self._by_created) - len(self._finished),
+            "max_size": self.max_tasks,
+            "evicted": self.evicted,
+            "purged": self.purged,
+        }
+
+
+def _aware(value: Optional[datetime]) -> Optional[datetime]:
+    """Task timestamps are naive UTC; Oracle columns are TIMESTAMP WITH TIME ZONE."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+class OracleTaskStore(TaskStore):
+    """Tasks in the a2a_tasks table, shared by every backend replica."""
+
+    shared = True
+
+    def __init__(self):
+        self.purged = 0
+
+    def _get(self, task_id: str) -> Optional[Task]:
+        db = create_session()
+        try:
+            row = db.get(A2ATask, task_id)
+            return Task.model_validate_json(row.payload) if row else None
+        finally:
+            db.close()
+
+    def _save(self, task: Task):
+        db = create_session()
+        try:
+            db.merge(A2ATask(
+                id=task.id,
+                state=task.state.value,
+                skill_id=task.input.skill_id,
+                payload=task.model_dump_json(),
+                created_at=_aware(task.created_at),
+                updated_at=_aware(task.updated_at),
+                completed_at=_aware(task.completed_at),
+            ))
+            db.commit()
+        finally:
+            db.close()
+
+    def _list(
+        self, state: Optional[TaskState], limit: int, after: Optional[list]
+    ) -> Tuple[List[Task], Optional[str]]:
+        db = create_session()
+        try:
+            query = db.query(A2ATask.payload)
+            if state is not None:
+                query = query.filter(A2ATask.state == state.value)
+            if after is not None:
+                query = query.filter(keyset_after(
+                    (A2ATask.created_at, A2ATask.id), (_aware(after[0]), after[1])
+                ))
+            rows = (
+                query.order_by(A2ATask.created_at.desc(), A2ATask.id.desc())
+                .limit(limit + 1)
+                .all()
+            )
+        finally:
+            db.close()
+
+        page = [Task.model_validate_json(payload) for (payload,) in rows[:limit]]
+        return page, _next_cursor(page, len(rows) > limit)
+
+    def _purge(self, older_than: datetime) -> int:
+        db = create_session()
+        try:
+            count = (
+                db.query(A2ATask)
+                .filter(
+                    A2ATask.state.in_([s.value for s in FINISHED_STATES]),
+                    A2ATask.updated_at < _aware(older_than),
+                )
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return count
+        finally:
+            db.close()
+
+    async def get(self, task_id: str) -> Optional[Task]:
+        return await run_db(self._get, task_id)
+
+    async def save(self, task: Task):
+        await run_db(self._save, task)
+
+    async def list(
+        self,
+        state: Optional[TaskState] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Task], Optional[str]]:
+        after = decode_cursor(cursor, 2)
+        return await run_db(self._list, state, limit, after)
+
+    async def purge(self, older_than: datetime) -> int:
+        count = await run_db(self._purge, older_than)
+        self.purged += count
+        return count
+
+    def stats(self) -> dict:
+        return {"backend": "oracle", "purged": self.purged}
+
+
+def create_task_store() -> TaskStore:
+    """Build the store selected by settings.a2a_task_store."""
+    if settings.a2a_task_store == "oracle":
+        return OracleTaskStore()
+    # Room for every task the scheduler can hold (queued + running), which
+    # are never evicted; beyond that it answers 429
+    active_limit = settings.a2a_max_queue + settings.a2a_workers
+    if settings.a2a_memory_max_tasks < active_limit:
+        logger.warning(
+            "A2A_MEMORY_MAX_TASKS=%d is below A2A_MAX_QUEUE + A2A_WORKERS, using %d",
+            settings.a2a_memory_max_tasks, active_limit,
+        )
+    return InMemoryTaskStore(max_tasks=max(settings.a2a_memory_max_tasks, active_limit))
+
+
+async def purge_loop(store: TaskStore, interval: float, retention: timedelta):
+    """Background task: purge finished tasks older than `retention`."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            purged = await store.purge(datetime.utcnow() - retention)
+            if purged:
+                logger.info("Purged %d finished A2A tasks", purged)
+        except Exception as e:
+            logger.error("A2A task purge failed: %s", e)
+
+
+task_store = create_task_store()
+register_collector("a2a_tasks", task_store.stats)
@@ -1,6 +1,11 @@
 """Base agent utilities for VacanceAI"""
+import functools
+from typing import Callable, Optional
+
+from langchain_core.tools import StructuredTool
 from langchain_google_genai import ChatGoogleGenerativeAI
 from config import settings
+from database.session import run_db
 
 
 def get_llm(model: str = "gemini-2.0-flash", temperature: float = 0.7):
@@ -10,3 +15,30 @@ def get_llm(model: str = "gemini-2.0-flash", temperature: float = 0.7):
         google_api_key=settings.google_api_key,
         temperature=temperature
     )
+
+
+def async_tool(func: Optional[Callable] = None, *, blocking: bool = True, writes: bool = False):
+    """Like @tool, with a native async variant for the agents' ainvoke calls.
+
+    blocking=True (DB access): async calls run the function on the DB
+    worker pool through run_db, so parallel tool calls in one agent step
+    run concurrently without holding up the event loop.
+    blocking=False (pure functions): async calls run it inline, with no
+    thread hop. Sync invoke() is unchanged in both cases.
+    writes=True (bookings, favorites...): the call has side effects, so the
+    agents' tool runner never times it out (see agents.tool_runner).
+    """
+    def decorate(fn: Callable) -> StructuredTool:
+        if blocking:
+            async def coroutine(*args, **kwargs):
+                return await run_db(fn, *args, **kwargs)
+        else:
+            async def coroutine(*args, **kwargs):
+                return fn(*args, **kwargs)
+        return StructuredTool.from_function(
+            func=fn,
+            coroutine=functools.wraps(fn)(coroutine),
+            metadata={"writes": True} if writes else None,
+        )
+
+    return decorate(func) if func is not None else decorate
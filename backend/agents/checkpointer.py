@@ -0,0 +1,470 @@
+"""Durable LangGraph checkpointer for VacanceAI agents (Oracle, or SQLite locally)
+
+Replaces the in-process MemorySaver so agent memory survives restarts and
+is shared by every backend replica. Storage stays bounded:
+- each put compacts the thread down to `max_per_thread` checkpoints
+  (a checkpoint stores its full channel values, so older ones are only
+  needed for time travel);
+- threads idle for longer than `thread_ttl` are evicted by `prune_loop`.
+"""
+
+import asyncio
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+    writes_sort_key,
+)
+from sqlalchemy import create_engine, exists
+from sqlalchemy.orm import Session, aliased
+
+from config import settings
+import database.session as db_session
+from database.session import run_db
+from database.models import AgentCheckpoint, AgentCheckpointWrite
+from metrics import register_collector
+
+logger = logging.getLogger("agents.checkpointer")
+
+# Oracle stores '' as NULL, which a primary key column cannot hold
+_ROOT_NS = "~"
+
+# Idle threads deleted per prune round trip
+_PRUNE_BATCH = 500
+
+
+def _ns_key(checkpoint_ns: Optional[str]) -> str:
+    return checkpoint_ns or _ROOT_NS
+
+
+def _ns_value(stored: str) -> str:
+    return "" if stored == _ROOT_NS else stored
+
+
+def _config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> RunnableConfig:
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint_id,
+        }
+    }
+
+
+class DatabaseCheckpointSaver(BaseCheckpointSaver[str]):
+    """LangGraph checkpoint saver on the agent_checkpoints tables.
+
+    Uses the application engine (database.session) unless `sqlite_path` is
+    given, in which case a private SQLite engine is created and the tables
+    are created on first use. Async methods run the sync ones on the DB
+    worker pool.
+    """
+
+    def __init__(
+        self,
+        max_per_thread: int = 10,
+        thread_ttl: timedelta = timedelta(hours=72),
+        sqlite_path: Optional[str] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        # The latest checkpoint's parent is kept so pending writes can be replayed
+        self.max_per_thread = max(max_per_thread, 2)
+        self.thread_ttl = thread_ttl
+        self.sqlite_path = sqlite_path
+        self._sqlite_engine = None
+        self._engine_lock = threading.Lock()
+        self.puts = 0
+        self.compacted = 0
+        self.evicted_threads = 0
+
+    # ------------------------------------------------------------------
+    # Storage helpers
+    # ------------------------------------------------------------------
+
+    def _engine(self):
+        if not self.sqlite_path:
+            if db_session.engine is None:
+                raise RuntimeError("Database engine is not initialized")
+            return db_session.engine
+
+        with self._engine_lock:
+            if self._sqlite_engine is None:
+                self._sqlite_engine = create_engine(f"sqlite:///{self.sqlite_path}")
+                AgentCheckpoint.metadata.create_all(
+                    self._sqlite_engine,
+                    tables=[AgentCheckpoint.__table__, AgentCheckpointWrite.__table__],
+                )
+            return self._sqlite_engine
+
+    def _session(self) -> Session:
+        return Session(self._engine(), expire_on_commit=False)
+
+    def _load_writes(
+        self, db: Session, rows: List[AgentCheckpoint]
+    ) -> Dict[Tuple[str, str, str], list]:
+        """Pending writes of `rows`, keyed on (thread_id, ns, checkpoint_id)."""
+        result: Dict[Tuple[str, str, str], list] = {
+            (r.thread_id, r.checkpoint_ns, r.checkpoint_id): [] for r in rows
+        }
+        if not rows:
+            return result
+
+        writes = (
+            db.query(AgentCheckpointWrite)
+            .filter(
+                AgentCheckpointWrite.thread_id.in_({r.thread_id for r in rows}),
+                AgentCheckpointWrite.checkpoint_id.in_({r.checkpoint_id for r in rows}),
+            )
+            .all()
+        )
+        for w in writes:
+            key = (w.thread_id, w.checkpoint_ns, w.checkpoint_id)
+            if key in result:
+                result[key].append(w)
+
+        for key, items in result.items():
+            items.sort(key=lambda w: writes_sort_key(w.task_path or "", w.task_id, w.idx))
+        return result
+
+    def _to_tuple(self, row: AgentCheckpoint, writes: list) -> CheckpointTuple:
+        checkpoint_ns = _ns_value(row.checkpoint_ns)
+        return CheckpointTuple(
+            config=_config(row.thread_id, checkpoint_ns, row.checkpoint_id),
+            checkpoint=self.serde.loads_typed((row.checkpoint_type, row.checkpoint)),
+            metadata=self.serde.loads_typed((row.metadata_type, row.metadata_)),
+            parent_config=(
+                _config(row.thread_id, checkpoint_ns, row.parent_checkpoint_id)
+                if row.parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[
+                (w.task_id, w.channel, self.serde.loads_typed((w.value_type, w.value or b"")))
+                for w in writes
+            ],
+        )
+
+    def _delete_checkpoints(
+        self, db: Session, thread_id: str, checkpoint_ns: str, checkpoint_ids: List[str]
+    ):
+        (
+            db.query(AgentCheckpointWrite)
+            .filter(
+                AgentCheckpointWrite.thread_id == thread_id,
+                AgentCheckpointWrite.checkpoint_ns == checkpoint_ns,
+                AgentCheckpointWrite.checkpoint_id.in_(checkpoint_ids),
+            )
+            .delete(synchronize_session=False)
+        )
+        (
+            db.query(AgentCheckpoint)
+            .filter(
+                AgentCheckpoint.thread_id == thread_id,
+                AgentCheckpoint.checkpoint_ns == checkpoint_ns,
+                AgentCheckpoint.checkpoint_id.in_(checkpoint_ids),
+            )
+            .delete(synchronize_session=False)
+        )
+
+    def _compact(self, db: Session, thread_id: str, checkpoint_ns: str) -> int:
+        """Drop all but the newest `max_per_thread` checkpoints of a thread."""
+        stale = [
+            checkpoint_id
+            for (checkpoint_id,) in db.query(AgentCheckpoint.checkpoint_id)
+            .filter(
+                AgentCheckpoint.thread_id == thread_id,
+                AgentCheckpoint.checkpoint_ns == checkpoint_ns,
+            )
+            .order_by(AgentCheckpoint.checkpoint_id.desc())
+            .offset(self.max_per_thread)
+            .all()
+        ]
+        if stale:
+            self._delete_checkpoints(db, thread_id, checkpoint_ns, stale)
+        return len(stale)
+
+    # ------------------------------------------------------------------
+    # BaseCheckpointSaver API
+    # ------------------------------------------------------------------
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = _ns_key(config["configurable"].get("checkpoint_ns"))
+        checkpoint_id = get_checkpoint_id(config)
+
+        with self._session() as db:
+            query = db.query(AgentCheckpoint).filter(
+                AgentCheckpoint.thread_id == thread_id,
+                AgentCheckpoint.checkpoint_ns == checkpoint_ns,
+            )
+            if checkpoint_id:
+                query = query.filter(AgentCheckpoint.checkpoint_id == checkpoint_id)
+            else:
+                query = query.order_by(AgentCheckpoint.checkpoint_id.desc())
+            row = query.first()
+            if row is None:
+                return None
+            writes = self._load_writes(db, [row])
+            return self._to_tuple(row, writes[(row.thread_id, row.checkpoint_ns, row.checkpoint_id)])
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        with self._session() as db:
+            query = db.query(AgentCheckpoint)
+            if config:
+                query = query.filter(AgentCheckpoint.thread_id == config["configurable"]["thread_id"])
+                if config["configurable"].get("checkpoint_ns") is not None:
+                    query = query.filter(
+                        AgentCheckpoint.checkpoint_ns == _ns_key(config["configurable"]["checkpoint_ns"])
+                    )
+                if checkpoint_id := get_checkpoint_id(config):
+                    query = query.filter(AgentCheckpoint.checkpoint_id == checkpoint_id)
+            if before and (before_id := get_checkpoint_id(before)):
+                query = query.filter(AgentCheckpoint.checkpoint_id < before_id)
+            query = query.order_by(
+                AgentCheckpoint.thread_id,
+                AgentCheckpoint.checkpoint_ns,
+                AgentCheckpoint.checkpoint_id.desc(),
+            )
+            # Metadata is an opaque blob, so `filter` is applied after loading
+            if limit is not None and not filter:
+                query = query.limit(limit)
+
+            rows = []
+            for row in query.all():
+                if filter:
+                    metadata = self.serde.loads_typed((row.metadata_type, row.metadata_))
+                    if not all(metadata.get(k) == v for k, v in filter.items()):
+                        continue
+                rows.append(row)
+                if limit is not None and len(rows) >= limit:
+                    break
+
+            writes = self._load_writes(db, rows)
+            tuples = [
+                self._to_tuple(r, writes[(r.thread_id, r.checkpoint_ns, r.checkpoint_id)])
+                for r in rows
+            ]
+        yield from tuples
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_blob = self.serde.dumps_typed(
+            get_checkpoint_metadata(config, metadata)
+        )
+
+        with self._session() as db:
+            db.merge(AgentCheckpoint(
+                thread_id=thread_id,
+                checkpoint_ns=_ns_key(checkpoint_ns),
+                checkpoint_id=checkpoint["id"],
+                parent_checkpoint_id=config["configurable"].get("checkpoint_id"),
+                checkpoint_type=checkpoint_type,
+                checkpoint=checkpoint_blob,
+                metadata_type=metadata_type,
+                metadata_=metadata_blob,
+                created_at=datetime.now(timezone.utc),
+            ))
+            db.flush()
+            compacted = self._compact(db, thread_id, _ns_key(checkpoint_ns))
+            db.commit()
+
+        self.puts += 1
+        self.compacted += compacted
+        return _config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = _ns_key(config["configurable"].get("checkpoint_ns"))
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+
+        with self._session() as db:
+            existing = {
+                idx
+                for (idx,) in db.query(AgentCheckpointWrite.idx).filter(
+                    AgentCheckpointWrite.thread_id == thread_id,
+                    AgentCheckpointWrite.checkpoint_ns == checkpoint_ns,
+                    AgentCheckpointWrite.checkpoint_id == checkpoint_id,
+                    AgentCheckpointWrite.task_id == task_id,
+                )
+            }
+            for i, (channel, value) in enumerate(writes):
+                idx = WRITES_IDX_MAP.get(channel, i)
+                # Regular writes are idempotent; special ones (errors, interrupts) are replaced
+                if idx >= 0 and idx in existing:
+                    continue
+                value_type, value_blob = self.serde.dumps_typed(value)
+                db.merge(AgentCheckpointWrite(
+                    thread_id=thread_id,
+                    checkpoint_ns=checkpoint_ns,
+                    checkpoint_id=checkpoint_id,
+                    task_id=task_id,
+                    idx=idx,
+                    channel=channel,
+                    value_type=value_type,
+                    value=value_blob,
+                    task_path=task_path,
+                ))
+            db.commit()
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._session() as db:
+            (
+                db.query(AgentCheckpointWrite)
+                .filter(AgentCheckpointWrite.thread_id == thread_id)
+                .delete(synchronize_session=False)
+            )
+            (
+                db.query(AgentCheckpoint)
+                .filter(AgentCheckpoint.thread_id == thread_id)
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await run_db(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        tuples = await run_db(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in tuples:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await run_db(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await run_db(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await run_db(self.delete_thread, thread_id)
+
+    # ------------------------------------------------------------------
+    # Eviction
+    # ------------------------------------------------------------------
+
+    def prune_idle_threads(self) -> int:
+        """Delete every thread whose newest checkpoint is older than `thread_ttl`.
+
+        Candidates come from the checkpoints older than the cutoff
+        (idx_agent_checkpoints_created range); a thread is kept if it has
+        a newer one, probed on idx_agent_checkpoints_thread_created. Only
+        old rows are read, never the whole table.
+        """
+        cutoff = datetime.now(timezone.utc) - self.thread_ttl
+        newer = aliased(AgentCheckpoint)
+        evicted = 0
+        while True:
+            with self._session() as db:
+                stale = [
+                    thread_id
+                    for (thread_id,) in db.query(AgentCheckpoint.thread_id)
+                    .filter(AgentCheckpoint.created_at < cutoff)
+                    .filter(~exists().where(
+                        newer.thread_id == AgentCheckpoint.thread_id,
+                        newer.created_at >= cutoff,
+                    ))
+                    .distinct()
+                    .limit(_PRUNE_BATCH)
+                    .all()
+                ]
+                if not stale:
+                    break
+                (
+                    db.query(AgentCheckpointWrite)
+                    .filter(AgentCheckpointWrite.thread_id.in_(stale))
+                    .delete(synchronize_session=False)
+                )
+                (
+                    db.query(AgentCheckpoint)
+                    .filter(AgentCheckpoint.thread_id.in_(stale))
+                    .delete(synchronize_session=False)
+                )
+                db.commit()
+            evicted += len(stale)
+            if len(stale) < _PRUNE_BATCH:
+                break
+
+        self.evicted_threads += evicted
+        return evicted
+
+    def stats(self) -> dict:
+        return {
+            "backend": "sqlite" if self.sqlite_path else "oracle",
+            "max_per_thread": self.max_per_thread,
+            "thread_ttl_hours": self.thread_ttl.total_seconds() / 3600,
+            "puts": self.puts,
+            "compacted": self.compacted,
+            "evicted_threads": self.evicted_threads,
+        }
+
+
+async def prune_loop(saver: DatabaseCheckpointSaver, interval: float):
+    """Background task: evict idle threads every `interval` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            evicted = await run_db(saver.prune_idle_threads)
+            if evicted:
+                logger.info("Evicted %d idle agent threads", evicted)
+        except Exception as e:
+            logger.error("Checkpoint pruning failed: %s", e)
+
+
+checkpointer = DatabaseCheckpointSaver(
+    max_per_thread=settings.checkpoint_max_per_thread,
+    thread_ttl=timedelta(hours=settings.checkpoint_thread_ttl_hours),
+    sqlite_path=settings.checkpoint_sqlite_path,
+)
+register_collector("agent_checkpoints", checkpointer.stats)
@@ -5,6 +5,7 @@ from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from typing import Dict, Any, Optional
 
 from agents.base import get_llm
+from agents.tool_runner import build_tool_node, tool_turn
 from .tools import (
     search_packages,
     get_package_details,
@@ -51,7 +52,7 @@ database_tools = [
 
 database_agent = create_react_agent(
     llm,
-    tools=database_tools,
+    tools=build_tool_node(database_tools),
     prompt=SYSTEM_PROMPT
 )
 
@@ -78,7 +79,8 @@ async def invoke_database_agent(
         messages[0] = HumanMessage(content=message + context_str)
 
     # Invoke agent
-    result = await database_agent.ainvoke({"messages": messages})
+    with tool_turn():
+        result = await database_agent.ainvoke({"messages": messages})
 
     # Extract response
     last_message = result["messages"][-1]
@@ -0,0 +1,89 @@
+"""Caching for the database agent's read-only tools
+
+Two layers, checked in order:
+- request memo: one dict per orchestrator request (ContextVar), so a
+  ReAct turn calling the same tool with the same arguments several times
+  (or create_booking_action re-reading a package) hits the DB once;
+- process-wide TTL cache shared by all requests, cleared whenever this
+  process commits a change to packages, destinations or reviews.
+
+Callers get a deep copy, so mutating a result never leaks into the cache.
+"""
+
+import copy
+import functools
+import inspect
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from cache import TTLCache
+from config import settings
+from database.change_events import on_tables_changed
+from metrics import register_collector
+
+# Tables the cached tools read from
+SOURCE_TABLES = ("packages", "destinations", "destination_tags", "reviews")
+
+_MISSING = object()
+
+_request_memo: ContextVar[Optional[Dict[tuple, Any]]] = ContextVar("tool_request_memo", default=None)
+
+read_cache = TTLCache(max_size=settings.tool_cache_max_size, ttl=settings.tool_cache_ttl_seconds)
+memo_hits = 0
+
+
+@contextmanager
+def request_memo() -> Iterator[None]:
+    """Memoize cached tool calls made inside this block (one request)."""
+    token = _request_memo.set({})
+    try:
+        yield
+    finally:
+        try:
+            _request_memo.reset(token)
+        except ValueError:
+            # Exited from another context (async generator closed elsewhere)
+            _request_memo.set(None)
+
+
+def cached_tool(fn: Callable) -> Callable:
+    """Cache a read-only tool function by its bound arguments.
+
+    Apply below @tool. Results that are error dicts are not cached.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        global memo_hits
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (fn.__name__, json.dumps(bound.arguments, sort_keys=True, default=str))
+
+        memo = _request_memo.get()
+        if memo is not None and key in memo:
+            memo_hits += 1
+            return copy.deepcopy(memo[key])
+
+        value = read_cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = fn(*args, **kwargs)
+            if isinstance(value, dict) and "error" in value:
+                return value
+            read_cache.set(key, value)
+        if memo is not None:
+            memo[key] = value
+        return copy.deepcopy(value)
+
+    return wrapper
+
+
+def invalidate(changed: Optional[set] = None):
+    """Drop every cached tool result."""
+    read_cache.clear()
+
+
+on_tables_changed(SOURCE_TABLES, invalidate)
+register_collector("tool_cache", lambda: {**read_cache.stats(), "memo_hits": memo_hits})
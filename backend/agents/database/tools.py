@@ -1,18 +1,25 @@
 """Database Agent Tools - CRUD operations for VacanceAI (SQLAlchemy ORM)"""
 
 import uuid
-from langchain_core.tools import tool
 from typing import Optional, List
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import joinedload
 
+from agents.base import async_tool
+from config import settings
 from database.session import create_session
 from database.models import (
-    Package, Destination, Booking, Favorite, Review,
+    Package, Destination, Booking, Favorite,
 )
+from database.queries import (
+    destination_has_tags, package_search_filters, search_packages_query,
+    review_stats, package_reviews_page,
+)
+from .memo import cached_tool
 
 
-@tool
+@async_tool
+@cached_tool
 def search_packages(
     destination: Optional[str] = None,
     country: Optional[str] = None,
@@ -27,7 +34,7 @@ def search_packages(
     """Search vacation packages with various filters.
 
     Args:
-        destination: Destination name to search for
+        destination: Destination name, city or country to search for
         country: Country to filter by
         min_price: Minimum price per person
         max_price: Maximum price per person
@@ -40,62 +47,36 @@ def search_packages(
     Returns:
         List of matching packages with destination details
     """
+    travel_date = date.fromisoformat(start_date) if start_date else None
+
+    # All predicates (destination, country, tags included) are applied in
+    # SQL before the LIMIT, with the same builder as GET /api/packages
+    criteria = package_search_filters(
+        destination=destination,
+        country=country,
+        min_price=min_price,
+        max_price=max_price,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        tags=tags,
+        start_date=travel_date,
+    )
+
     db = create_session()
     try:
-        query = (
-            db.query(Package)
-            .options(joinedload(Package.destination))
-            .filter(Package.is_active == True)
+        rows = (
+            search_packages_query(db, criteria)
+            .order_by(Package.price_per_person, Package.id)
+            .limit(limit)
+            .all()
         )
-
-        if min_price:
-            query = query.filter(Package.price_per_person >= min_price)
-        if max_price:
-            query = query.filter(Package.price_per_person <= max_price)
-        if min_duration:
-            query = query.filter(Package.duration_days >= min_duration)
-        if max_duration:
-            query = query.filter(Package.duration_days <= max_duration)
-        if start_date:
-            from sqlalchemy import func
-            date_val = func.to_date(start_date, 'YYYY-MM-DD')
-            query = query.filter(Package.available_from <= date_val)
-            query = query.filter(Package.available_to >= date_val)
-
-        rows = query.order_by(Package.price_per_person).limit(limit).all()
-        packages = [p.to_dict_with_destination() for p in rows]
+        return [p.to_dict_with_destination() for p in rows]
     finally:
         db.close()
 
-    # Filter by destination/country in Python
-    if destination:
-        destination_lower = destination.lower()
-        packages = [
-            p for p in packages
-            if destination_lower in (p.get("destinations", {}).get("name", "") or "").lower()
-            or destination_lower in (p.get("destinations", {}).get("city", "") or "").lower()
-        ]
-
-    if country:
-        country_lower = country.lower()
-        packages = [
-            p for p in packages
-            if country_lower in (p.get("destinations", {}).get("country", "") or "").lower()
-        ]
-
-    if tags:
-        packages = [
-            p for p in packages
-            if any(
-                tag.lower() in [x.lower() for x in (p.get("destinations", {}).get("tags") or [])]
-                for tag in tags
-            )
-        ]
-
-    return packages[:limit]
-
-
-@tool
+
+@async_tool
+@cached_tool
 def get_package_details(package_id: str) -> dict:
     """Get complete details for a specific package.
 
@@ -103,7 +84,7 @@ def get_package_details(package_id: str) -> dict:
         package_id: UUID of the package
 
     Returns:
-        Package details with destination and reviews
+        Package details with destination, newest reviews and review stats
     """
     db = create_session()
     try:
@@ -119,22 +100,18 @@ def get_package_details(package_id: str) -> dict:
 
         package = pkg.to_dict_with_destination()
 
-        # Get reviews
-        reviews = (
-            db.query(Review)
-            .options(joinedload(Review.user))
-            .filter(Review.package_id == package_id)
-            .order_by(Review.created_at.desc())
-            .all()
-        )
+        # Newest reviews only, plus count/average/histogram of all of them
+        reviews, _ = package_reviews_page(db, package_id, settings.package_detail_reviews)
         package["reviews"] = [r.to_dict_with_user() for r in reviews]
+        package["review_stats"] = review_stats(db, package_id)
 
         return package
     finally:
         db.close()
 
 
-@tool
+@async_tool
+@cached_tool
 def get_destinations(
     country: Optional[str] = None,
     tags: Optional[List[str]] = None,
@@ -157,28 +134,21 @@ def get_destinations(
         if country:
             query = query.filter(Destination.country.ilike(f"%{country}%"))
 
+        tag_filter = destination_has_tags(tags)
+        if tag_filter is not None:
+            query = query.filter(tag_filter)
+
         rows = (
             query.order_by(Destination.average_rating.desc().nulls_last())
             .limit(limit)
             .all()
         )
-        destinations = [d.to_dict() for d in rows]
+        return [d.to_dict() for d in rows]
     finally:
         db.close()
 
-    if tags:
-        destinations = [
-            d for d in destinations
-            if any(
-                tag.lower() in [x.lower() for x in (d.get("tags") or [])]
-                for tag in tags
-            )
-        ]
-
-    return destinations
-
 
-@tool
+@async_tool(writes=True)
 def create_booking(
     user_id: str,
     package_id: str,
@@ -241,7 +211,7 @@ def create_booking(
         db.close()
 
 
-@tool
+@async_tool
 def get_user_bookings(
     user_id: str,
     status: Optional[str] = None
@@ -273,7 +243,7 @@ def get_user_bookings(
         db.close()
 
 
-@tool
+@async_tool(writes=True)
 def add_to_favorites(user_id: str, package_id: str) -> dict:
     """Add a package to user's favorites.
 
@@ -307,7 +277,7 @@ def add_to_favorites(user_id: str, package_id: str) -> dict:
         db.close()
 
 
-@tool
+@async_tool
 def get_user_favorites(user_id: str) -> list:
     """Get user's favorite packages.
 
@@ -330,7 +300,7 @@ def get_user_favorites(user_id: str) -> list:
         db.close()
 
 
-@tool
+@async_tool(writes=True)
 def remove_from_favorites(user_id: str, package_id: str) -> dict:
     """Remove a package from user's favorites.
 
@@ -2,16 +2,31 @@
 
 from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage
-from typing import TypedDict, Optional, List, Dict, Any, Literal
+from typing import AsyncIterator, TypedDict, Optional, List, Dict, Any, Literal
 from enum import Enum
 import logging
+import time
 import traceback
 
 logger = logging.getLogger("agents.orchestrator")
 
 from agents.base import get_llm
 from agents.database.agent import invoke_database_agent
-from agents.ui.agent import invoke_ui_agent
+from agents.database.memo import request_memo
+from agents.ui.agent import invoke_ui_agent, stream_ui_agent, remember_turn
+from config import settings
+from database.session import run_db
+from metrics import Histogram, register_collector
+from .fast_path import try_fast_path
+from .response_cache import response_cache
+
+# Streaming latency: request -> first token, and request -> done
+ttft_ms = Histogram()
+stream_total_ms = Histogram()
+register_collector("chat_stream", lambda: {
+    "ttft_ms": ttft_ms.snapshot(),
+    "total_ms": stream_total_ms.snapshot(),
+})
 
 
 class AgentType(str, Enum):
@@ -30,6 +45,7 @@ class OrchestratorState(TypedDict):
     response: Optional[str]
     ui_actions: List[Dict]
     error: Optional[str]
+    fast_path: Optional[str]  # intent answered without the LLM
 
 
 def classify_request(state: OrchestratorState) -> str:
@@ -80,6 +96,33 @@ def classify_request(state: OrchestratorState) -> str:
     return AgentType.UI.value
 
 
+async def _remember_turn(context: Optional[Dict[str, Any]], message: str, response: str):
+    """Add a turn answered without the UI agent to its conversation memory."""
+    conversation_id = (context or {}).get("conversation_id")
+    if not conversation_id:
+        return
+    try:
+        await remember_turn(conversation_id, message, response)
+    except Exception as e:
+        logger.warning("Could not record turn for %s: %s", conversation_id, e)
+
+
+async def handle_fast_path(state: OrchestratorState) -> OrchestratorState:
+    """Answer simple catalog queries directly (see fast_path.py)"""
+    answer = await run_db(
+        try_fast_path, state["message"], state.get("skill_id"), state.get("context")
+    )
+    if answer is None:
+        return state
+
+    state["response"] = answer["response"]
+    state["ui_actions"] = answer["ui_actions"]
+    state["agent_type"] = AgentType.UI.value
+    state["fast_path"] = answer["intent"]
+    await _remember_turn(state.get("context"), state["message"], answer["response"])
+    return state
+
+
 async def handle_database_agent(state: OrchestratorState) -> OrchestratorState:
     """Process request with database agent"""
     try:
@@ -126,21 +169,89 @@ def route_to_agent(state: OrchestratorState) -> Literal["database", "ui"]:
     return agent_type
 
 
+def route_after_fast_path(state: OrchestratorState) -> str:
+    """End if the fast path answered, otherwise route to an agent"""
+    if state.get("fast_path"):
+        return END
+    return route_to_agent(state)
+
+
+def _metadata(skill_id: Optional[str], state: Dict[str, Any]) -> Dict[str, Any]:
+    metadata = {
+        "skill_id": skill_id,
+        "routed_to": state.get("agent_type")
+    }
+    if state.get("fast_path"):
+        metadata["fast_path"] = state["fast_path"]
+    return metadata
+
+
+def _cacheable(context: Optional[Dict[str, Any]]) -> bool:
+    """Only first-turn requests are cached: later ones depend on the conversation."""
+    if not settings.response_cache_enabled:
+        return False
+    history = (context or {}).get("history") or []
+    # The websocket history already holds the current user message
+    return len(history) <= 1
+
+
+async def _cached_result(
+    message: str,
+    skill_id: Optional[str],
+    context: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Cached result in process_request's shape, or None."""
+    if not _cacheable(context):
+        return None
+    cached = await response_cache.aget(message, skill_id, context)
+    if cached is None:
+        return None
+
+    if cached["agent_type"] == AgentType.UI.value:
+        await _remember_turn(context, message, cached["response"])
+
+    logger.info("Response cache %s hit | message='%s'", cached["cached"], message[:100])
+    return {
+        "response": cached["response"],
+        "agent_type": cached["agent_type"],
+        "ui_actions": cached["ui_actions"],
+        "error": None,
+        "metadata": {
+            "skill_id": skill_id,
+            "routed_to": cached["agent_type"],
+            "cached": cached["cached"]
+        }
+    }
+
+
+async def _cache_result(
+    message: str,
+    skill_id: Optional[str],
+    context: Optional[Dict[str, Any]],
+    result: Dict[str, Any]
+):
+    if _cacheable(context):
+        await response_cache.aset(message, skill_id, context, result)
+
+
 # Build the orchestrator graph
 workflow = StateGraph(OrchestratorState)
 
 
 # Add nodes
+workflow.add_node("fast_path", handle_fast_path)
 workflow.add_node("database", handle_database_agent)
 workflow.add_node("ui", handle_ui_agent)
 
-# Add conditional routing from start
+# Try the fast path first, then route to an agent if it did not answer
+workflow.add_edge("__start__", "fast_path")
 workflow.add_conditional_edges(
-    "__start__",
-    route_to_agent,
+    "fast_path",
+    route_after_fast_path,
     {
         "database": "database",
-        "ui": "ui"
+        "ui": "ui",
+        END: END
     }
 )
 
@@ -167,6 +278,10 @@ async def process_request(
     Returns:
         Response with message and any UI actions
     """
+    cached = await _cached_result(message, skill_id, context)
+    if cached is not None:
+        return cached
+
     initial_state: OrchestratorState = {
         "message": message,
         "skill_id": skill_id,
@@ -174,18 +289,95 @@ async def process_request(
         "agent_type": None,
         "response": None,
         "ui_actions": [],
-        "error": None
+        "error": None,
+        "fast_path": None
     }
 
-    result = await orchestrator_agent.ainvoke(initial_state)
+    with request_memo():
+        result = await orchestrator_agent.ainvoke(initial_state)
 
-    return {
+    response = {
         "response": result.get("response", ""),
         "agent_type": result.get("agent_type"),
         "ui_actions": result.get("ui_actions", []),
         "error": result.get("error"),
-        "metadata": {
-            "skill_id": skill_id,
-            "routed_to": result.get("agent_type")
-        }
+        "metadata": _metadata(skill_id, result)
+    }
+    await _cache_result(message, skill_id, context, response)
+    return response
+
+
+async def stream_request(
+    message: str,
+    skill_id: Optional[str] = None,
+    context: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Process a request through the orchestrator, yielding incremental events.
+
+    UI agent requests stream token/tool_start/ui_action events (see
+    stream_ui_agent); fast-path answers yield their ui_action events and
+    database agent requests only yield the final event. The last event always has type "done" and the same keys as
+    process_request's result. Cache hits only yield the final event.
+    """
+    started = time.perf_counter()
+    cached = await _cached_result(message, skill_id, context)
+    if cached is not None:
+        stream_total_ms.observe((time.perf_counter() - started) * 1000)
+        yield {"type": "done", **cached}
+        return
+
+    state: OrchestratorState = {
+        "message": message,
+        "skill_id": skill_id,
+        "context": context,
+        "agent_type": None,
+        "response": None,
+        "ui_actions": [],
+        "error": None,
+        "fast_path": None
+    }
+    with request_memo():
+        state = await handle_fast_path(state)
+        agent_type = None if state.get("fast_path") else route_to_agent(state)
+        first_token = True
+
+        if state.get("fast_path"):
+            for action in state["ui_actions"]:
+                yield {"type": "ui_action", "action": action}
+        elif agent_type == AgentType.UI.value:
+            ctx = context or {}
+            try:
+                async for event in stream_ui_agent(
+                    message=message,
+                    conversation_history=ctx.get("history"),
+                    user_context=ctx.get("user"),
+                    conversation_id=ctx.get("conversation_id"),
+                    page_context=ctx.get("page")
+                ):
+                    if event["type"] == "token" and first_token:
+                        first_token = False
+                        ttft_ms.observe((time.perf_counter() - started) * 1000)
+                    if event["type"] == "done":
+                        state["response"] = event["response"]
+                        state["ui_actions"] = event["ui_actions"]
+                        continue
+                    yield event
+            except Exception as e:
+                logger.error(f"UI agent error: {e}\n{traceback.format_exc()}")
+                state["error"] = f"UI agent error: {str(e)}"
+                state["response"] = "Je rencontre un problème technique. Pouvez-vous reformuler votre demande?"
+            state["agent_type"] = AgentType.UI.value
+        else:
+            state = await handle_database_agent(state)
+
+    stream_total_ms.observe((time.perf_counter() - started) * 1000)
+
+    result = {
+        "response": state.get("response") or "",
+        "agent_type": state.get("agent_type"),
+        "ui_actions": state.get("ui_actions", []),
+        "error": state.get("error"),
+        "metadata": _metadata(skill_id, state)
     }
+    await _cache_result(message, skill_id, context, result)
+    yield {"type": "done", **result}
@@ -0,0 +1,371 @@
+"""Orchestrator fast path - Deterministic answers for simple catalog queries
+
+Messages such as "show me beach packages under 1000€", "liste des
+destinations au Japon" or "show package <uuid>" are parsed into an intent
+with slots (destination, country, budget, duration, travel_type) and
+answered by calling the catalog tools directly, with the same UI actions
+the UI agent would emit.
+
+Confidence is the share of the message's words the parser understood;
+anything below settings.fast_path_min_confidence (dates, follow-ups,
+free-form questions...) goes to the LLM agents as before. A budget needs
+an explicit cue ("under 1000€" is a maximum, "above 1000€" a minimum);
+a bare amount stays unexplained. Any negation, and any word asking for
+something a plain search cannot do (book, cancel, favorite, compare,
+"cheapest"...), drops the confidence to 0 however short the message.
+"""
+
+import logging
+import re
+import time
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from cache import TTLCache
+from config import settings
+from database.change_events import on_tables_changed
+from database.models import Destination
+from database.session import create_session
+from metrics import Histogram, register_collector
+from agents.database.tools import get_destinations
+from agents.ui.tools import search_results, show_package_details
+
+logger = logging.getLogger("agents.orchestrator")
+
+# Skills the fast path may answer (others always go to their agent)
+FAST_PATH_SKILLS = {None, "search_vacations", "get_recommendations", "chat_assistant"}
+
+TRAVEL_TYPES = {
+    "beach": {"beach", "beaches", "plage", "plages", "mer", "sea", "balneaire"},
+    "mountain": {"mountain", "mountains", "montagne", "montagnes", "ski"},
+    "city": {"city", "cities", "ville", "villes", "citytrip", "urbain"},
+    "adventure": {"adventure", "adventures", "aventure", "aventures"},
+    "romantic": {"romantic", "romantique", "romantiques", "honeymoon"},
+    "family": {"family", "famille", "familial", "familiale", "familiales", "kids", "enfants"},
+    "luxury": {"luxury", "luxe", "luxueux", "luxueuses"},
+}
+_TYPE_BY_WORD = {word: kind for kind, words in TRAVEL_TYPES.items() for word in words}
+
+# Words that carry no slot: verbs, articles, prepositions, politeness
+FILLER = {
+    # English
+    "show", "me", "find", "search", "looking", "look", "for", "i", "want", "would",
+    "like", "a", "an", "the", "some", "any", "package", "packages", "trip", "trips",
+    "vacation", "vacations", "holiday", "holidays", "deal", "deals", "offer", "offers",
+    "in", "to", "at", "with", "of", "and", "please", "list", "all", "what", "which",
+    "are", "is", "there", "available", "give", "get", "see", "can", "you", "my", "per",
+    "person", "stay", "stays", "about", "around", "this", "that", "details", "detail",
+    # French
+    "je", "cherche", "recherche", "veux", "voudrais", "aimerais", "montre", "montrez",
+    "moi", "trouve", "trouver", "des", "un", "une", "le", "la", "les", "l", "d", "en",
+    "a", "au", "aux", "pour", "de", "du", "voyage", "voyages", "sejour", "sejours",
+    "vacances", "offre", "offres", "svp", "stp", "liste", "lister", "tous", "toutes",
+    "quelles", "quels", "quel", "quelle", "sont", "disponibles", "disponible", "il",
+    "y", "par", "personne", "avec", "et", "ce", "cet", "cette", "voir", "afficher",
+    "affiche", "donne", "qu", "est",
+}
+DESTINATION_WORDS = {"destination", "destinations"}
+PACKAGE_WORDS = {"package", "packages", "forfait", "forfaits", "offre", "offres"}
+
+_UUID = re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b")
+_AMOUNT = r"(\d{1,3}(?:[ .]\d{3})+|\d+(?:[.,]\d+)?)\s*k?"
+_CURRENCY = r"\s*(?:€|euros?|eur)?"
+# Cue before the amount ("under 1000€") or after it ("1000€ max"); the
+# max cues are tried first so "pas plus de" is not read as "plus de"
+_MAX_CUE = (
+    r"under|below|less than|max(?:imum)?|up to|at most|budget(?: of| de)?|"
+    r"pas plus de|moins de|sous|jusqu a|au maximum"
+)
+_MIN_CUE = r"above|over|more than|at least|from|min(?:imum)?|plus de|a partir de|au moins|au minimum"
+_BUDGET = re.compile(
+    r"(?:\b(?P<max_cue>" + _MAX_CUE + r")\b|(?P<max_sign><))\s*" + _AMOUNT + _CURRENCY
+    + r"|(?:\b(?P<min_cue>" + _MIN_CUE + r")\b|(?P<min_sign>>))\s*" + _AMOUNT + _CURRENCY
+    + r"|\b" + _AMOUNT + r"\s*(?:€|euros?|eur)\s*(?:(?P<max_after>max(?:imum)?)|(?P<min_after>min(?:imum)?))\b"
+)
+# Any of these flips or excludes a criterion: always left to the LLM
+NEGATIONS = {"not", "no", "except", "without", "pas", "ne", "n", "sauf", "sans", "hors", "ni", "jamais"}
+# Actions owned by other flows, and rankings/qualifiers search_packages
+# cannot express: always left to the LLM
+VETO_WORDS = {
+    # English
+    "book", "booking", "bookings", "reserve", "reservation", "reservations", "cancel",
+    "cancellation", "modify", "change", "favorite", "favorites", "favourite", "favourites",
+    "compare", "comparison", "review", "reviews", "pay", "payment", "recommend",
+    "recommendation", "recommendations", "cheapest", "cheap", "cheaper", "expensive",
+    "best", "top", "popular", "newest", "latest", "first", "last",
+    # French
+    "reserver", "reservez", "annuler", "annulation", "modifier", "favori", "favoris",
+    "comparer", "comparaison", "avis", "payer", "paiement", "recommande", "recommander",
+    "recommandation", "recommandations", "cher", "chers", "chere", "cheres", "meilleur",
+    "meilleurs", "meilleure", "meilleures", "populaire", "populaires", "premier",
+    "premiere", "dernier", "derniere",
+}
+_DURATION = re.compile(
+    r"\b(\d+)\s*(?:days?|jours?|nights?|nuits?)\b"
+    r"|\b(a|one|une|1|two|deux|2|three|trois|3)\s*(?:weeks?|semaines?)\b"
+)
+_WEEKS = {"a": 1, "one": 1, "une": 1, "1": 1, "two": 2, "deux": 2, "2": 2, "three": 3, "trois": 3, "3": 3}
+_WORD = re.compile(r"[a-z0-9€]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip accents, turn apostrophes/hyphens into spaces."""
+    text = unicodedata.normalize("NFKD", text.lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return re.sub(r"['’\-]", " ", text)
+
+
+@dataclass
+class Intent:
+    """A parsed fast-path intent."""
+
+    name: str  # search_packages | list_destinations | package_details
+    confidence: float
+    slots: Dict[str, Any] = field(default_factory=dict)
+
+
+# ---- Known places (destination names, cities, countries) ----
+
+_places = TTLCache(max_size=1, ttl=600)
+
+
+def _load_places() -> List[Tuple[str, str, str]]:
+    """(normalized text, slot, original value), longest first."""
+    db = create_session()
+    try:
+        rows = db.query(Destination.name, Destination.city, Destination.country).all()
+    finally:
+        db.close()
+
+    places = {}
+    for name, city, country in rows:
+        for slot, value in (("country", country), ("destination", city), ("destination", name)):
+            if value:
+                places[normalize(value).strip()] = (slot, value)
+    return sorted(
+        ((text, slot, value) for text, (slot, value) in places.items()),
+        key=lambda p: len(p[0]),
+        reverse=True,
+    )
+
+
+def known_places() -> List[Tuple[str, str, str]]:
+    places = _places.get("places")
+    if places is None:
+        places = _load_places()
+        _places.set("places", places)
+    return places
+
+
+on_tables_changed(["destinations"], lambda changed: _places.clear())
+
+
+# ---- Parsing ----
+
+def _consume(pattern: re.Pattern, text: str) -> Tuple[List[re.Match], str]:
+    matches = list(pattern.finditer(text))
+    return matches, pattern.sub(" ", text)
+
+
+def _amount(raw: str, match_text: str) -> Optional[float]:
+    try:
+        value = float(re.sub(r"[\s.](?=\d{3}\b)", "", raw).replace(",", "."))
+    except ValueError:
+        return None
+    if re.search(r"\d\s*k\b", match_text):
+        value *= 1000
+    return value
+
+
+def parse_intent(message: str, page_context: Optional[Dict[str, Any]] = None) -> Optional[Intent]:
+    """Parse a message into an Intent, or None if it is not a catalog query."""
+    # Package ids before normalize() splits them on hyphens
+    uuids, text = _consume(_UUID, message.lower())
+    text = " " + normalize(text) + " "
+    slots: Dict[str, Any] = {}
+
+    if len(uuids) > 1:
+        return None
+    if uuids:
+        slots["package_id"] = uuids[0].group(0)
+
+    # Durations first, so "under 1000 7 days" is not read as one amount
+    durations, text = _consume(_DURATION, text)
+    if len(durations) > 1:
+        return None
+    if durations:
+        days, weeks = durations[0].groups()
+        slots["duration_days"] = int(days) if days else 7 * _WEEKS[weeks]
+
+    budgets, text = _consume(_BUDGET, text)
+    for match in budgets:
+        is_max = bool(match.group("max_cue") or match.group("max_sign") or match.group("max_after"))
+        slot = "budget_max" if is_max else "budget_min"
+        raw = next(g for g in match.groups() if g and g[0].isdigit())
+        amount = _amount(raw, match.group(0))
+        if slot in slots or amount is None:
+            return None
+        slots[slot] = amount
+
+    for place, slot, value in known_places():
+        pattern = re.compile(r"(?<![a-z0-9])" + re.escape(place) + r"(?![a-z0-9])")
+        if pattern.search(text):
+            if slot in slots:
+                return None  # two places: let the LLM sort it out
+            slots[slot] = value
+            text = pattern.sub(" ", text)
+
+    words = _WORD.findall(text)
+    vetoed = any(word in NEGATIONS or word in VETO_WORDS for word in words)
+    explained = 0
+    mentions_destinations = mentions_package = False
+    for word in words:
+        if word in _TYPE_BY_WORD:
+            if slots.setdefault("travel_type", _TYPE_BY_WORD[word]) != _TYPE_BY_WORD[word]:
+                return None
+            explained += 1
+        elif word in DESTINATION_WORDS:
+            mentions_destinations = True
+            explained += 1
+        elif word in FILLER or word in PACKAGE_WORDS:
+            mentions_package = mentions_package or word in PACKAGE_WORDS
+            explained += 1
+        elif word == "€":
+            explained += 1
+
+    # Slots consumed by the regexes count as understood words
+    consumed = len(uuids) + len(budgets) + len(durations) + sum(
+        1 for key in ("destination", "country") if key in slots
+    )
+    total = len(words) + consumed
+    if total == 0:
+        return None
+    confidence = 0.0 if vetoed else (explained + consumed) / total
+
+    if "package_id" in slots:
+        if len(slots) > 1:
+            return None
+        return Intent("package_details", confidence, slots)
+
+    page = page_context if isinstance(page_context, dict) else {}
+    page_data = page.get("data") if isinstance(page.get("data"), dict) else {}
+    if not slots and mentions_package and page.get("page") == "packageDetail" and page_data.get("package_id"):
+        # "show this package" / "details de ce forfait" on a package page
+        return Intent("package_details", confidence, {"package_id": page_data["package_id"]})
+
+    if mentions_destinations and not mentions_package:
+        if set(slots) - {"country", "travel_type"}:
+            return None
+        return Intent("list_destinations", confidence, slots)
+
+    if slots:
+        return Intent("search_packages", confidence, slots)
+    return None
+
+
+# ---- Answering ----
+
+def _describe(slots: Dict[str, Any]) -> str:
+    parts = []
+    if "travel_type" in slots:
+        parts.append(f"de type {slots['travel_type']}")
+    place = slots.get("destination") or slots.get("country")
+    if place:
+        parts.append(f"pour {place}")
+    if "duration_days" in slots:
+        parts.append(f"d'environ {slots['duration_days']} jours")
+    if slots.get("budget_min") is not None:
+        parts.append(f"à partir de {slots['budget_min']:g}€ par personne")
+    if slots.get("budget_max") is not None:
+        parts.append(f"à moins de {slots['budget_max']:g}€ par personne")
+    return " ".join(parts)
+
+
+def run_intent(intent: Intent) -> Tuple[str, List[Dict[str, Any]]]:
+    """Execute an intent: (response text, ui_actions). Blocking (DB)."""
+    slots = intent.slots
+
+    if intent.name == "package_details":
+        action = show_package_details.invoke({"package_id": slots["package_id"]})
+        if action["action"] != "show_package_modal":
+            return "Je n'ai pas trouvé ce package.", [action]
+        package = action["package"]
+        destination = (package.get("destinations") or {}).get("name")
+        where = f" ({destination})" if destination else ""
+        return f"Voici les détails de {package.get('name', 'ce package')}{where}.", [action]
+
+    if intent.name == "list_destinations":
+        tags = [slots["travel_type"]] if "travel_type" in slots else None
+        destinations = get_destinations.invoke({
+            "country": slots.get("country"), "tags": tags, "limit": 10
+        })
+        if not destinations:
+            return "Aucune destination ne correspond à ces critères.", []
+        lines = "\n".join(f"- {d['name']} ({d['country']})" for d in destinations)
+        return f"Voici les destinations disponibles :\n{lines}", []
+
+    action = search_results(
+        destination=slots.get("destination"),
+        budget_max=slots.get("budget_max"),
+        budget_min=slots.get("budget_min"),
+        duration_days=slots.get("duration_days"),
+        travel_type=slots.get("travel_type"),
+        country=slots.get("country"),
+    )
+    if action["action"] != "show_search_results":
+        return action["message"], [action]
+    description = _describe(slots)
+    suffix = f" {description}" if description else ""
+    return f"J'ai trouvé {action['count']} package(s){suffix}.", [action]
+
+
+# Latency of fast-path answers (compare with chat_stream / agent latency)
+fast_path_ms = Histogram()
+_counts = {"answered": 0, "low_confidence": 0, "no_intent": 0, "errors": 0}
+
+
+def try_fast_path(
+    message: str,
+    skill_id: Optional[str],
+    context: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Answer without the LLM if the message is a confident catalog query.
+
+    Returns {"intent", "confidence", "response", "ui_actions"} or None.
+    Blocking: call through run_db.
+    """
+    if not settings.fast_path_enabled or skill_id not in FAST_PATH_SKILLS:
+        return None
+
+    started = time.perf_counter()
+    try:
+        intent = parse_intent(message, (context or {}).get("page"))
+        if intent is None:
+            _counts["no_intent"] += 1
+            return None
+        if intent.confidence < settings.fast_path_min_confidence:
+            _counts["low_confidence"] += 1
+            return None
+        response, ui_actions = run_intent(intent)
+    except Exception as e:
+        # Fall back to the agents rather than failing the request
+        _counts["errors"] += 1
+        logger.warning("Fast path failed for '%s': %s", message[:100], e)
+        return None
+
+    _counts["answered"] += 1
+    fast_path_ms.observe((time.perf_counter() - started) * 1000)
+    logger.info(
+        "Fast path answered '%s' (intent=%s, confidence=%.2f)",
+        message[:100], intent.name, intent.confidence,
+    )
+    return {
+        "intent": intent.name,
+        "confidence": intent.confidence,
+        "response": response,
+        "ui_actions": ui_actions,
+    }
+
+
+register_collector("fast_path", lambda: {**_counts, "latency_ms": fast_path_ms.snapshot()})
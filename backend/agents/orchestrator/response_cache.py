@@ -0,0 +1,240 @@
+"""Response cache in front of the orchestrator's agents
+
+Two tiers:
+- exact: normalized message + skill_id + relevant page context (+ user
+  unless responses are shared across users), in a TTL/LRU cache;
+- semantic (optional): on an exact miss, the message embedding is
+  compared with cached entries of the same scope and the closest one is
+  reused above a cosine similarity threshold.
+
+Entries are dropped whenever packages, destinations or their tags are
+committed by this process, and expire after a TTL otherwise.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from cache import TTLCache
+from config import settings
+from database.change_events import on_tables_changed
+from metrics import register_collector
+
+logger = logging.getLogger("agents.orchestrator")
+
+# Tables whose changes make cached answers stale
+WATCHED_TABLES = ("packages", "destinations", "destination_tags")
+
+# UI actions with side effects (or errors): such answers are never reused
+UNCACHEABLE_ACTIONS = {"booking_confirmed", "add_favorite", "show_error"}
+
+_WS = re.compile(r"\s+")
+
+
+def normalize_message(message: str) -> str:
+    """Lowercase, collapse whitespace and trim trailing punctuation."""
+    return _WS.sub(" ", message.strip().lower()).rstrip(" ?!.")
+
+
+def page_scope(page: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """The parts of the page context an answer can depend on (page, ids, filters)."""
+    if not isinstance(page, dict):
+        return {}
+    scope = {"page": page.get("page")}
+    data = page.get("data")
+    if isinstance(data, dict):
+        for key, value in data.items():
+            if key == "id" or key.endswith("_id") or key == "filters":
+                scope[key] = value
+    return scope
+
+
+def _embed(text: str) -> List[float]:
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    global _embedder
+    if _embedder is None:
+        _embedder = GoogleGenerativeAIEmbeddings(
+            model=settings.response_cache_embedding_model,
+            google_api_key=settings.google_api_key,
+        )
+    vector = _embedder.embed_query(text)
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+_embedder = None
+
+
+class ResponseCache:
+    """Exact + optional semantic cache of orchestrator results."""
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: float,
+        semantic: bool = False,
+        threshold: float = 0.95,
+        share_across_users: bool = False,
+    ):
+        self.exact = TTLCache(max_size=max_size, ttl=ttl)
+        self.semantic = semantic
+        self.threshold = threshold
+        self.share_across_users = share_across_users
+        # scope -> {exact key: unit embedding}, bounded with the exact tier
+        self._vectors: "OrderedDict[str, Dict[str, List[float]]]" = OrderedDict()
+        self._vector_count = 0
+        self._lock = threading.Lock()
+        self.semantic_hits = 0
+        self.invalidations = 0
+
+    def _keys(
+        self, message: str, skill_id: Optional[str], context: Optional[Dict[str, Any]]
+    ) -> Tuple[str, str, str]:
+        """(exact key, scope key, normalized message)."""
+        context = context or {}
+        user = context.get("user") if isinstance(context.get("user"), dict) else {}
+        scope = {
+            "skill_id": skill_id,
+            "page": page_scope(context.get("page")),
+            "user": None if self.share_across_users else user.get("id"),
+        }
+        scope_key = hashlib.sha256(
+            json.dumps(scope, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        normalized = normalize_message(message)
+        exact_key = hashlib.sha256(f"{scope_key}\n{normalized}".encode()).hexdigest()
+        return exact_key, scope_key, normalized
+
+    def get(
+        self, message: str, skill_id: Optional[str], context: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """Cached result for this request, or None (blocking: may embed).
+
+        Hits carry "cached": "exact" or "semantic".
+        """
+        exact_key, scope_key, normalized = self._keys(message, skill_id, context)
+        result = self.exact.get(exact_key)
+        if result is not None:
+            return {**result, "cached": "exact"}
+        if not self.semantic:
+            return None
+
+        with self._lock:
+            candidates = list(self._vectors.get(scope_key, {}).items())
+        if not candidates:
+            return None
+
+        try:
+            query = _embed(normalized)
+        except Exception as e:
+            logger.warning("Response cache embedding failed: %s", e)
+            return None
+
+        best_key, best_score = None, self.threshold
+        for key, vector in candidates:
+            score = sum(a * b for a, b in zip(query, vector))
+            if score >= best_score:
+                best_key, best_score = key, score
+        if best_key is None:
+            return None
+
+        result = self.exact.get(best_key)
+        if result is None:
+            return None
+        self.semantic_hits += 1
+        return {**result, "cached": "semantic"}
+
+    def set(
+        self,
+        message: str,
+        skill_id: Optional[str],
+        context: Optional[Dict[str, Any]],
+        result: Dict[str, Any],
+    ):
+        """Store a result if it is safe to replay (blocking: may embed)."""
+        if result.get("error") or not result.get("response"):
+            return
+        if any(a.get("action") in UNCACHEABLE_ACTIONS for a in result.get("ui_actions") or []):
+            return
+
+        exact_key, scope_key, normalized = self._keys(message, skill_id, context)
+        # Database agent answers can read any table, not just the watched ones
+        ttl = settings.response_cache_database_ttl_seconds if result.get("agent_type") == "database" else None
+        self.exact.set(exact_key, {
+            "response": result["response"],
+            "agent_type": result.get("agent_type"),
+            "ui_actions": result.get("ui_actions") or [],
+        }, ttl=ttl)
+
+        if not self.semantic:
+            return
+        try:
+            vector = _embed(normalized)
+        except Exception as e:
+            logger.warning("Response cache embedding failed: %s", e)
+            return
+        with self._lock:
+            self._vectors.setdefault(scope_key, {})[exact_key] = vector
+            self._vectors.move_to_end(scope_key)
+            self._vector_count += 1
+            # Keep no more vectors than exact entries (expired ones are skipped on lookup)
+            while self._vector_count > self.exact.max_size and self._vectors:
+                _, dropped = self._vectors.popitem(last=False)
+                self._vector_count -= len(dropped)
+
+    async def aget(
+        self, message: str, skill_id: Optional[str], context: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """get() off the event loop when it may call the embedding API."""
+        if self.semantic:
+            return await asyncio.to_thread(self.get, message, skill_id, context)
+        return self.get(message, skill_id, context)
+
+    async def aset(
+        self,
+        message: str,
+        skill_id: Optional[str],
+        context: Optional[Dict[str, Any]],
+        result: Dict[str, Any],
+    ):
+        """set() off the event loop when it may call the embedding API."""
+        if self.semantic:
+            await asyncio.to_thread(self.set, message, skill_id, context, result)
+        else:
+            self.set(message, skill_id, context, result)
+
+    def clear(self, changed: Optional[set] = None):
+        """Drop every entry (catalog data changed)."""
+        self.exact.clear()
+        with self._lock:
+            self._vectors.clear()
+            self._vector_count = 0
+        self.invalidations += 1
+        if changed:
+            logger.info("Response cache cleared after changes to %s", ", ".join(sorted(changed)))
+
+    def stats(self) -> dict:
+        return {
+            **self.exact.stats(),
+            "semantic": self.semantic,
+            "semantic_hits": self.semantic_hits,
+            "invalidations": self.invalidations,
+        }
+
+
+response_cache = ResponseCache(
+    max_size=settings.response_cache_max_size,
+    ttl=settings.response_cache_ttl_seconds,
+    semantic=settings.response_cache_semantic,
+    threshold=settings.response_cache_similarity_threshold,
+    share_across_users=settings.response_cache_share_across_users,
+)
+on_tables_changed(WATCHED_TABLES, response_cache.clear)
+register_collector("response_cache", response_cache.stats)
@@ -0,0 +1,121 @@
+"""Tool execution for the ReAct agents - concurrency bound, timeouts, latency
+
+ToolNode already runs the tool calls of one model step concurrently; the
+wrappers here bound how many run at once per agent turn, give each read
+call a timeout (a timed-out call becomes an error ToolMessage the model can
+react to, instead of stalling the turn) and record per-tool latency
+histograms. Tools declared with async_tool(writes=True) are never timed
+out: the abandoned call would still commit on its worker thread while the
+model, told it failed, retries it (duplicate booking or favorite).
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional, Sequence
+
+from langchain_core.messages import ToolMessage
+from langchain_core.tools import BaseTool
+from langgraph.prebuilt import ToolNode
+
+from config import settings
+from metrics import Histogram, register_collector
+
+logger = logging.getLogger("agents")
+
+# Semaphore of the current agent turn (set by tool_turn)
+_turn_slots: ContextVar[Optional[asyncio.Semaphore]] = ContextVar("agent_tool_slots", default=None)
+
+tool_latency_ms: Dict[str, Histogram] = {}
+tool_timeouts: Dict[str, int] = {}
+
+
+@contextmanager
+def tool_turn() -> Iterator[None]:
+    """Bound concurrent tool calls to settings.agent_tool_concurrency within this block."""
+    token = _turn_slots.set(asyncio.Semaphore(settings.agent_tool_concurrency))
+    try:
+        yield
+    finally:
+        try:
+            _turn_slots.reset(token)
+        except ValueError:
+            # Exited from another context (async generator closed elsewhere)
+            _turn_slots.set(None)
+
+
+def timeout_for(tool_name: str) -> float:
+    return settings.agent_tool_timeouts.get(tool_name, settings.agent_tool_timeout_seconds)
+
+
+def _writes(request) -> bool:
+    tool = request.tool
+    return tool is not None and bool((tool.metadata or {}).get("writes"))
+
+
+def _observe(tool_name: str, started: float):
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    histogram = tool_latency_ms.get(tool_name)
+    if histogram is None:
+        histogram = tool_latency_ms.setdefault(tool_name, Histogram())
+    histogram.observe(elapsed_ms)
+    logger.info("Tool %s took %.1f ms", tool_name, elapsed_ms)
+
+
+def _timed_out(request, timeout: float) -> ToolMessage:
+    name = request.tool_call["name"]
+    tool_timeouts[name] = tool_timeouts.get(name, 0) + 1
+    logger.warning("Tool %s timed out after %.1fs", name, timeout)
+    return ToolMessage(
+        content=f"Error: {name} timed out after {timeout:g}s. Try narrower criteria or another tool.",
+        name=name,
+        tool_call_id=request.tool_call["id"],
+        status="error",
+    )
+
+
+async def _awrap(request, execute):
+    name = request.tool_call["name"]
+    timeout = None if _writes(request) else timeout_for(name)
+    slots = _turn_slots.get()
+
+    started = time.perf_counter()
+    try:
+        if slots is None:
+            return await asyncio.wait_for(execute(request), timeout)
+        async with slots:
+            # The timeout covers the call itself, not the wait for a slot
+            started = time.perf_counter()
+            return await asyncio.wait_for(execute(request), timeout)
+    except asyncio.TimeoutError:
+        # A call running on a worker thread finishes in the background;
+        # its result is discarded
+        return _timed_out(request, timeout)
+    finally:
+        _observe(name, started)
+
+
+def _wrap(request, execute):
+    started = time.perf_counter()
+    try:
+        return execute(request)
+    finally:
+        _observe(request.tool_call["name"], started)
+
+
+def build_tool_node(tools: Sequence[BaseTool]) -> ToolNode:
+    """ToolNode for create_react_agent with the bound, timeouts and metrics."""
+    return ToolNode(tools, wrap_tool_call=_wrap, awrap_tool_call=_awrap)
+
+
+def stats() -> dict:
+    return {
+        "concurrency": settings.agent_tool_concurrency,
+        "timeouts": dict(tool_timeouts),
+        "latency_ms": {name: h.snapshot() for name, h in tool_latency_ms.items()},
+    }
+
+
+register_collector("agent_tools", stats)
@@ -1,15 +1,17 @@
 """UI Agent - Chat assistant for vacation planning"""
 
 from langgraph.prebuilt import create_react_agent
-from langgraph.checkpoint.memory import MemorySaver
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage, ToolMessage
-from typing import Dict, Any, Optional, List
+from typing import AsyncIterator, Dict, Any, Optional, List, Tuple
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
 from agents.base import get_llm
+from agents.checkpointer import checkpointer
+from agents.tool_runner import build_tool_node, tool_turn
+from .history import UIAgentState, history_hook
 from .tools import (
     search_vacation,
     show_package_details,
@@ -100,36 +102,26 @@ ui_tools = [
     get_destinations
 ]
 
-# In-memory checkpointer for conversation state persistence
-memory = MemorySaver()
-
+# Durable checkpointer (Oracle) for conversation state persistence
 ui_agent = create_react_agent(
     llm,
-    tools=ui_tools,
+    tools=build_tool_node(ui_tools),
     prompt=SYSTEM_PROMPT,
-    checkpointer=memory
+    state_schema=UIAgentState,
+    # Compacts/summarizes the history within a token budget (history.py)
+    pre_model_hook=history_hook,
+    checkpointer=checkpointer
 )
 
 
-async def invoke_ui_agent(
+def _build_agent_input(
     message: str,
-    conversation_history: Optional[List[Dict[str, str]]] = None,
-    user_context: Optional[Dict[str, Any]] = None,
-    conversation_id: Optional[str] = None,
-    page_context: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
-    """Invoke the UI agent with a message and conversation context.
-
-    Args:
-        message: The user's message
-        conversation_history: Previous messages in the conversation
-        user_context: User information (id, name, preferences, etc.)
-        conversation_id: Conversation thread ID for checkpointer memory
-        page_context: Current page context (page name, route, displayed data)
-
-    Returns:
-        Agent response with message and any UI actions
-    """
+    conversation_history: Optional[List[Dict[str, str]]],
+    user_context: Optional[Dict[str, Any]],
+    conversation_id: Optional[str],
+    page_context: Optional[Dict[str, Any]],
+) -> Tuple[List, Optional[Dict[str, Any]]]:
+    """Build the agent's input messages and run config for one turn."""
     # Build config with thread_id for checkpointer
     config = None
     use_checkpointer = conversation_id is not None
@@ -163,8 +155,60 @@ async def invoke_ui_agent(
 
         messages.append(HumanMessage(content=message + context_suffix))
 
+    return messages, config
+
+
+def _parse_ui_action(content: Any) -> Optional[Dict[str, Any]]:
+    """Return the UI action carried by a tool result, if any."""
+    try:
+        if isinstance(content, str):
+            content = json.loads(content)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if isinstance(content, dict) and "action" in content:
+        return content
+    return None
+
+
+def _text(content: Any) -> str:
+    """Plain text of a message/chunk content (str or list of content parts)."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "".join(
+            part if isinstance(part, str) else part.get("text", "")
+            for part in content
+            if isinstance(part, (str, dict))
+        )
+    return ""
+
+
+async def invoke_ui_agent(
+    message: str,
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+    conversation_id: Optional[str] = None,
+    page_context: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Invoke the UI agent with a message and conversation context.
+
+    Args:
+        message: The user's message
+        conversation_history: Previous messages in the conversation
+        user_context: User information (id, name, preferences, etc.)
+        conversation_id: Conversation thread ID for checkpointer memory
+        page_context: Current page context (page name, route, displayed data)
+
+    Returns:
+        Agent response with message and any UI actions
+    """
+    messages, config = _build_agent_input(
+        message, conversation_history, user_context, conversation_id, page_context
+    )
+
     # Invoke agent
-    result = await ui_agent.ainvoke({"messages": messages}, config=config)
+    with tool_turn():
+        result = await ui_agent.ainvoke({"messages": messages}, config=config)
 
     # Extract response and actions
     last_message = result["messages"][-1]
@@ -181,14 +225,9 @@ async def invoke_ui_agent(
 
     for msg in all_msgs[last_human_idx + 1:]:
         if isinstance(msg, ToolMessage):
-            try:
-                content = msg.content
-                if isinstance(content, str):
-                    content = json.loads(content)
-                if isinstance(content, dict) and "action" in content:
-                    ui_actions.append(content)
-            except (json.JSONDecodeError, TypeError):
-                pass
+            action = _parse_ui_action(msg.content)
+            if action is not None:
+                ui_actions.append(action)
 
     return {
         "response": last_message.content,
@@ -202,3 +241,82 @@ async def invoke_ui_agent(
             if isinstance(m, (HumanMessage, AIMessage))
         ]
     }
+
+
+async def remember_turn(conversation_id: str, message: str, response: str):
+    """Record a turn answered without running the agent (response cache hit).
+
+    Keeps the checkpointed conversation complete so follow-up messages
+    still see it.
+    """
+    config = {"configurable": {"thread_id": conversation_id}}
+    await ui_agent.aupdate_state(
+        config,
+        {"messages": [HumanMessage(content=message), AIMessage(content=response)]},
+        as_node="agent",
+    )
+
+
+async def stream_ui_agent(
+    message: str,
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+    user_context: Optional[Dict[str, Any]] = None,
+    conversation_id: Optional[str] = None,
+    page_context: Optional[Dict[str, Any]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Run the UI agent and yield incremental events (astream_events v2).
+
+    Yields dicts with a "type" key:
+        token: {"content"} - a piece of the model's answer
+        tool_start: {"tool", "input"} - the agent called a tool
+        ui_action: {"action"} - a tool produced a UI action
+        done: {"response", "ui_actions"} - final answer of the turn
+
+    Same arguments as invoke_ui_agent.
+    """
+    messages, config = _build_agent_input(
+        message, conversation_history, user_context, conversation_id, page_context
+    )
+
+    ui_actions = []
+    final_messages = None
+    # Text streamed since the last tool call, used if no final state is seen
+    answer_parts: List[str] = []
+
+    with tool_turn():
+        async for event in ui_agent.astream_events({"messages": messages}, config=config, version="v2"):
+            kind = event["event"]
+
+            # Only the agent's own model (not e.g. the history summarizer)
+            if kind == "on_chat_model_stream" and event["metadata"].get("langgraph_node") == "agent":
+                text = _text(event["data"]["chunk"].content)
+                if text:
+                    answer_parts.append(text)
+                    yield {"type": "token", "content": text}
+
+            elif kind == "on_tool_start":
+                answer_parts = []
+                yield {
+                    "type": "tool_start",
+                    "tool": event["name"],
+                    "input": event["data"].get("input"),
+                }
+
+            elif kind == "on_tool_end":
+                output = event["data"].get("output")
+                action = _parse_ui_action(getattr(output, "content", output))
+                if action is not None:
+                    ui_actions.append(action)
+                    yield {"type": "ui_action", "action": action}
+
+            elif kind == "on_chain_end" and not event.get("parent_ids"):
+                output = event["data"].get("output")
+                if isinstance(output, dict) and output.get("messages"):
+                    final_messages = output["messages"]
+
+    if final_messages:
+        response = _text(final_messages[-1].content)
+    else:
+        response = "".join(answer_parts)
+
+    yield {"type": "done", "response": response, "ui_actions": ui_actions}
@@ -0,0 +1,257 @@
+"""UI Agent history manager - token budget for the model's input
+
+Runs as the agent's pre_model_hook, before every model call:
+- tool results from earlier turns are compacted to ids and key fields,
+  and earlier user messages lose their page/user context suffix;
+- the current turn's tool results are kept, capped in size;
+- if the prompt is still over settings.history_token_budget, the oldest
+  turns are dropped from the model input; with a checkpointer they are
+  first folded into a running summary kept in the agent state, so each
+  turn is summarized once.
+
+The checkpointed messages themselves are never modified. Prompt sizes
+are logged and recorded under "ui_agent_prompt" in /api/metrics.
+"""
+
+import json
+import logging
+from typing import Annotated, Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.messages import (
+    AIMessage, AnyMessage, BaseMessage, HumanMessage, ToolMessage,
+)
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langgraph.graph.message import add_messages
+from langgraph.managed import RemainingSteps
+from typing_extensions import NotRequired, TypedDict
+
+from agents.base import get_llm
+from config import settings
+from metrics import Histogram, register_collector
+
+logger = logging.getLogger("agents.ui")
+
+prompt_tokens = Histogram(buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000))
+summaries = {"count": 0, "errors": 0}
+register_collector("ui_agent_prompt", lambda: {
+    "tokens": prompt_tokens.snapshot(),
+    "summaries": summaries["count"],
+    "summary_errors": summaries["errors"],
+})
+
+
+class UIAgentState(TypedDict):
+    """create_react_agent state plus the running summary of older turns."""
+
+    messages: Annotated[Sequence[BaseMessage], add_messages]
+    remaining_steps: NotRequired[RemainingSteps]
+    history_summary: NotRequired[str]
+    summarized_through: NotRequired[str]  # id of the last summarized message
+
+
+# ---- Tool payload compaction ----
+
+# Fields the model does not need to refer back to earlier results
+_DROP_FIELDS = {
+    "description", "image_url", "images", "included", "not_included", "highlights",
+    "latitude", "longitude", "created_at", "updated_at", "available_from",
+    "available_to", "is_active", "suggestions", "filters_applied", "personalized",
+}
+_MAX_ITEMS = 10
+
+
+def _compact_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        compact = {}
+        for key, item in value.items():
+            if key in _DROP_FIELDS or item is None:
+                continue
+            if key == "reviews" and isinstance(item, list):
+                compact["review_count"] = len(item)
+                continue
+            compact[key] = _compact_value(item)
+        return compact
+    if isinstance(value, list):
+        items = [_compact_value(item) for item in value[:_MAX_ITEMS]]
+        if len(value) > _MAX_ITEMS:
+            items.append(f"... {len(value) - _MAX_ITEMS} more")
+        return items
+    return value
+
+
+def compact_tool_content(content: Any, max_chars: int) -> str:
+    """Keep ids and key fields of a JSON tool result, within `max_chars`."""
+    text = content if isinstance(content, str) else json.dumps(content, default=str)
+    try:
+        text = json.dumps(_compact_value(json.loads(text)), ensure_ascii=False, default=str)
+    except (json.JSONDecodeError, TypeError):
+        pass
+    return _cap(text, max_chars)
+
+
+def _cap(text: str, max_chars: int) -> str:
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + f"... [tronqué, {len(text) - max_chars} caractères]"
+
+
+def _strip_context(content: Any) -> Any:
+    """Drop the [Contexte utilisateur]/[Page actuelle] suffix of an old user message."""
+    if not isinstance(content, str):
+        return content
+    for marker in ("\n[Contexte utilisateur:", "\n[Page actuelle:"):
+        idx = content.find(marker)
+        if idx != -1:
+            content = content[:idx]
+    return content
+
+
+# ---- Turns ----
+
+def _turn_starts(messages: Sequence[BaseMessage]) -> List[int]:
+    """Indexes of HumanMessages: cutting there never splits a tool call from its result."""
+    return [i for i, m in enumerate(messages) if isinstance(m, HumanMessage)]
+
+
+def _compacted(messages: Sequence[BaseMessage], current_start: int) -> List[BaseMessage]:
+    result = []
+    for i, msg in enumerate(messages):
+        if isinstance(msg, ToolMessage):
+            if i < current_start:
+                content = compact_tool_content(msg.content, settings.history_tool_max_chars // 4)
+            else:
+                content = _cap(
+                    msg.content if isinstance(msg.content, str) else json.dumps(msg.content, default=str),
+                    settings.history_tool_max_chars,
+                )
+            if content != msg.content:
+                msg = msg.model_copy(update={"content": content})
+        elif isinstance(msg, HumanMessage) and i < current_start:
+            content = _strip_context(msg.content)
+            if content != msg.content:
+                msg = msg.model_copy(update={"content": content})
+        result.append(msg)
+    return result
+
+
+def _summary_message(summary: str) -> HumanMessage:
+    return HumanMessage(content=f"[Résumé de la conversation précédente: {summary}]")
+
+
+def _summary_prompt(previous: Optional[str], messages: Sequence[BaseMessage]) -> str:
+    lines = []
+    for msg in messages:
+        if isinstance(msg, HumanMessage):
+            lines.append(f"Utilisateur: {_strip_context(msg.content)}")
+        elif isinstance(msg, AIMessage) and msg.content:
+            lines.append(f"Assistant: {msg.content}")
+        elif isinstance(msg, ToolMessage):
+            lines.append(f"Résultat {msg.name}: {compact_tool_content(msg.content, 500)}")
+    return (
+        "Mets à jour le résumé d'une conversation entre un client et un conseiller vacances. "
+        "Garde les préférences (destination, budget, dates, voyageurs), les ids des packages "
+        "et réservations évoqués et les décisions prises. Maximum 150 mots.\n\n"
+        f"Résumé actuel: {previous or '(aucun)'}\n\nNouveaux échanges:\n" + "\n".join(lines)
+    )
+
+
+_llm = None
+
+
+def _summarizer():
+    global _llm
+    if _llm is None:
+        _llm = get_llm(temperature=0)
+    return _llm
+
+
+def _plan(
+    state: Dict[str, Any], config: RunnableConfig
+) -> Tuple[List[BaseMessage], List[BaseMessage], Optional[str], bool]:
+    """(messages to send, oldest turns to drop, current summary, summarize dropped?)"""
+    messages: List[AnyMessage] = list(state["messages"])
+    summary = state.get("history_summary")
+    summarized_through = state.get("summarized_through")
+    persistent = bool((config.get("configurable") or {}).get("thread_id"))
+
+    # Skip what the summary already covers
+    if persistent and summarized_through:
+        ids = [m.id for m in messages]
+        if summarized_through in ids:
+            messages = messages[ids.index(summarized_through) + 1:]
+        else:
+            summary = None
+
+    starts = _turn_starts(messages)
+    current_start = starts[-1] if starts else 0
+    messages = _compacted(messages, current_start)
+
+    def total(msgs: List[BaseMessage]) -> int:
+        extra = [_summary_message(summary)] if summary else []
+        return count_tokens_approximately(extra + msgs)
+
+    # Drop the oldest whole turns while over budget (never the current one)
+    cut = 0
+    for start in starts[1:]:
+        if total(messages[cut:]) <= settings.history_token_budget:
+            break
+        cut = start
+
+    summarize = persistent and settings.history_summary_enabled
+    return messages[cut:], messages[:cut], summary, summarize
+
+
+def _finish(messages: List[BaseMessage], summary: Optional[str], update: Dict[str, Any]) -> Dict[str, Any]:
+    llm_input = ([_summary_message(summary)] if summary else []) + messages
+    tokens = count_tokens_approximately(llm_input)
+    prompt_tokens.observe(tokens)
+    logger.info(
+        "UI agent prompt ~%d tokens (%d messages%s)",
+        tokens, len(llm_input), ", with summary" if summary else "",
+    )
+    update["llm_input_messages"] = llm_input
+    return update
+
+
+def _summarized(summary: str, dropped: List[BaseMessage]) -> Dict[str, Any]:
+    summaries["count"] += 1
+    return {"history_summary": summary, "summarized_through": dropped[-1].id}
+
+
+def prepare_history(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+    """pre_model_hook: budgeted model input (+ summary updates)."""
+    messages, dropped, summary, summarize = _plan(state, config)
+    update: Dict[str, Any] = {}
+    if dropped and summarize:
+        try:
+            response = _summarizer().invoke(
+                _summary_prompt(summary, dropped), config={"tags": ["history_summary"]}
+            )
+            summary = response.text
+            update = _summarized(summary, dropped)
+        except Exception as e:
+            # Keep the previous summary; the dropped turns are retried next time
+            summaries["errors"] += 1
+            logger.warning("History summary failed: %s", e)
+    return _finish(messages, summary, update)
+
+
+async def aprepare_history(state: Dict[str, Any], config: RunnableConfig) -> Dict[str, Any]:
+    """Async pre_model_hook (the agents run with ainvoke/astream_events)."""
+    messages, dropped, summary, summarize = _plan(state, config)
+    update: Dict[str, Any] = {}
+    if dropped and summarize:
+        try:
+            response = await _summarizer().ainvoke(
+                _summary_prompt(summary, dropped), config={"tags": ["history_summary"]}
+            )
+            summary = response.text
+            update = _summarized(summary, dropped)
+        except Exception as e:
+            summaries["errors"] += 1
+            logger.warning("History summary failed: %s", e)
+    return _finish(messages, summary, update)
+
+
+history_hook = RunnableLambda(prepare_history, afunc=aprepare_history, name="history")
@@ -1,11 +1,11 @@
 """UI Agent Tools - Actions for the frontend interface"""
 
-from langchain_core.tools import tool
 from typing import Optional, List, Dict, Any
+from agents.base import async_tool
 from agents.database.tools import search_packages, get_package_details, create_booking
 
 
-@tool
+@async_tool
 def search_vacation(
     destination: Optional[str] = None,
     budget_max: Optional[float] = None,
@@ -25,15 +25,37 @@ def search_vacation(
     Returns:
         Search results with packages to display
     """
+    return search_results(
+        destination=destination,
+        budget_max=budget_max,
+        duration_days=duration_days,
+        travel_type=travel_type
+    )
+
+
+def search_results(
+    destination: Optional[str] = None,
+    budget_max: Optional[float] = None,
+    duration_days: Optional[int] = None,
+    travel_type: Optional[str] = None,
+    country: Optional[str] = None,
+    budget_min: Optional[float] = None
+) -> Dict[str, Any]:
+    """Run a package search and build the show_search_results UI action.
+
+    Shared by search_vacation and the orchestrator's fast path.
+    """
     # Map travel_type to tags
     tags = [travel_type] if travel_type else None
 
     # Search packages using database tools
     packages = search_packages.invoke({
         "destination": destination,
+        "min_price": budget_min,
         "max_price": budget_max,
         "max_duration": duration_days + 2 if duration_days else None,
         "min_duration": duration_days - 2 if duration_days else None,
+        "country": country,
         "tags": tags,
         "limit": 8
     })
@@ -55,6 +77,7 @@ def search_vacation(
         "count": len(packages),
         "filters_applied": {
             "destination": destination,
+            "budget_min": budget_min,
             "budget_max": budget_max,
             "duration_days": duration_days,
             "travel_type": travel_type
@@ -62,7 +85,7 @@ def search_vacation(
     }
 
 
-@tool
+@async_tool
 def show_package_details(package_id: str) -> Dict[str, Any]:
     """Display detailed information about a specific package.
 
@@ -86,7 +109,7 @@ def show_package_details(package_id: str) -> Dict[str, Any]:
     }
 
 
-@tool
+@async_tool
 def start_booking_flow(
     package_id: str,
     start_date: Optional[str] = None,
@@ -121,7 +144,7 @@ def start_booking_flow(
     }
 
 
-@tool
+@async_tool(blocking=False)
 def add_to_favorites_action(package_id: str) -> Dict[str, Any]:
     """Add a package to the user's favorites (UI action).
 
@@ -138,7 +161,7 @@ def add_to_favorites_action(package_id: str) -> Dict[str, Any]:
     }
 
 
-@tool
+@async_tool(blocking=False)
 def navigate_to_page(page: str) -> Dict[str, Any]:
     """Navigate to a specific page in the application.
 
@@ -162,7 +185,7 @@ def navigate_to_page(page: str) -> Dict[str, Any]:
     }
 
 
-@tool
+@async_tool(blocking=False)
 def get_current_page_state() -> Dict[str, Any]:
     """Get the current state of the page (what the user is viewing).
 
@@ -176,7 +199,7 @@ def get_current_page_state() -> Dict[str, Any]:
     }
 
 
-@tool
+@async_tool(writes=True)
 def create_booking_action(
     user_id: str,
     package_id: str,
@@ -236,7 +259,7 @@ def create_booking_action(
     return {"action": "show_error", "message": result.get("error", "Erreur lors de la réservation")}
 
 
-@tool
+@async_tool
 def show_recommendations(
     preferences: Optional[List[str]] = None,
     budget_range: Optional[str] = None
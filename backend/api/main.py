@@ -1,17 +1,23 @@
 """VacanceAI Backend - Main FastAPI Application"""
 
+import asyncio
 import logging
+from datetime import timedelta
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 from config import settings
 from logging_config import setup_logging
-from database.session import init_engine, close_engine
+from database.session import init_engine, close_engine, init_db_workers
+from database.ratings import reconcile_loop
 from telemetry import init_telemetry
+from agents.checkpointer import checkpointer, prune_loop
+from a2a.store import task_store, purge_loop
+from a2a.scheduler import scheduler
 
 logger = logging.getLogger("vacanceai")
-from .routes import health, auth, destinations, packages, bookings, favorites, reviews, conversations, tripadvisor
+from .routes import health, auth, destinations, packages, bookings, favorites, reviews, conversations, tripadvisor, metrics
 from a2a.server import a2a_router
 
 
@@ -22,10 +28,29 @@ async def lifespan(app: FastAPI):
     setup_logging()
     logger.info("Starting %s API...", settings.app_name)
     init_engine()
+    init_db_workers()
     init_telemetry(app)
+    checkpoint_pruner = asyncio.create_task(
+        prune_loop(checkpointer, settings.checkpoint_prune_interval_seconds)
+    )
+    a2a_purger = asyncio.create_task(purge_loop(
+        task_store,
+        settings.a2a_purge_interval_seconds,
+        timedelta(hours=settings.a2a_task_retention_hours),
+    ))
+    rating_reconciler = None
+    if settings.rating_reconcile_interval_seconds > 0:
+        rating_reconciler = asyncio.create_task(
+            reconcile_loop(settings.rating_reconcile_interval_seconds)
+        )
     yield
     # Shutdown
     logger.info("Shutting down %s API...", settings.app_name)
+    checkpoint_pruner.cancel()
+    a2a_purger.cancel()
+    if rating_reconciler is not None:
+        rating_reconciler.cancel()
+    await scheduler.stop()
     close_engine()
 
 
@@ -70,6 +95,7 @@ app.include_router(favorites.router, prefix="/api/favorites", tags=["Favorites"]
 app.include_router(reviews.router, prefix="/api/reviews", tags=["Reviews"])
 app.include_router(conversations.router, prefix="/api/conversations", tags=["Chat Assistant"])
 app.include_router(tripadvisor.router, prefix="/api/tripadvisor", tags=["TripAdvisor"])
+app.include_router(metrics.router, prefix="/api/metrics", tags=["Metrics"])
 app.include_router(a2a_router, tags=["A2A Protocol"])
 
 
@@ -7,10 +7,13 @@ from fastapi.responses import FileResponse
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.orm import Session
 
-from database.session import get_db
+from database.session import get_db, run_db
 from database.models import User, RefreshToken
-from auth.jwt_service import hash_password, verify_password, create_access_token, create_refresh_token
-from auth.middleware import get_current_user
+from auth.jwt_service import (
+    hash_password_async, verify_password_async, PasswordHasherBusy,
+    create_access_token, create_refresh_token, token_profile,
+)
+from auth.middleware import get_current_user, invalidate_cached_user
 
 router = APIRouter()
 
@@ -38,16 +41,46 @@ class UpdateProfileRequest(BaseModel):
     avatar_url: str | None = None
 
 
+def _get_user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+
+def _get_user_and_release(db: Session, email: str):
+    """Look up a user, then return the connection to the pool.
+
+    Callers await bcrypt next; holding a pooled connection (and a DB
+    worker for the request's cleanup) through the hashing queue exhausts
+    the pool under a login burst. The returned user stays loaded.
+    """
+    try:
+        return _get_user_by_email(db, email)
+    finally:
+        db.close()
+
+
+def _add_and_commit(db: Session, row):
+    db.add(row)
+    db.commit()
+
+
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="Service temporarily busy, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
 @router.post("/signup")
 async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
     """Register a new user"""
-    existing = db.query(User).filter(User.email == request.email).first()
+    existing = await run_db(_get_user_and_release, db, request.email)
     if existing:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     try:
         user_id = str(uuid.uuid4())
-        hashed = hash_password(request.password)
+        hashed = await hash_password_async(request.password)
 
         user = User(
             id=user_id,
@@ -56,8 +89,7 @@ async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
             first_name=request.first_name,
             last_name=request.last_name,
         )
-        db.add(user)
-        db.commit()
+        await run_db(_add_and_commit, db, user)
 
         return {
             "message": "User created successfully",
@@ -65,23 +97,38 @@ async def signup(request: SignUpRequest, db: Session = Depends(get_db)):
             "email": request.email
         }
 
+    except PasswordHasherBusy:
+        raise _hashing_busy()
     except Exception as e:
-        db.rollback()
+        await run_db(db.rollback)
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/login")
 async def login(request: LoginRequest, db: Session = Depends(get_db)):
     """Login with email and password"""
-    user = db.query(User).filter(User.email == request.email).first()
+    user = await run_db(_get_user_and_release, db, request.email)
 
-    if not user or not verify_password(request.password, user.password_hash):
+    try:
+        valid = user is not None and await verify_password_async(request.password, user.password_hash)
+    except PasswordHasherBusy:
+        raise _hashing_busy()
+
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     # Create tokens
-    access_token = create_access_token(user.id, user.email)
+    access_token = create_access_token(user.id, user.email, token_profile(user))
     refresh_token, refresh_expires = create_refresh_token(user.id)
 
+    # Read user fields before the commit expires them
+    user_info = {
+        "id": user.id,
+        "email": user.email,
+        "first_name": user.first_name,
+        "last_name": user.last_name
+    }
+
     # Store refresh token
     token = RefreshToken(
         id=str(uuid.uuid4()),
@@ -89,32 +136,27 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
         token=refresh_token,
         expires_at=refresh_expires,
     )
-    db.add(token)
-    db.commit()
+    await run_db(_add_and_commit, db, token)
 
     return {
         "access_token": access_token,
         "refresh_token": refresh_token,
         "expires_in": 3600,
-        "user": {
-            "id": user.id,
-            "email": user.email,
-            "first_name": user.first_name,
-            "last_name": user.last_name
-        }
+        "user": user_info
     }
 
 
 @router.post("/logout")
-async def logout(user=Depends(get_current_user), db: Session = Depends(get_db)):
+def logout(user=Depends(get_current_user), db: Session = Depends(get_db)):
     """Logout current user - delete all refresh tokens"""
     db.query(RefreshToken).filter(RefreshToken.user_id == user.id).delete()
     db.commit()
+    invalidate_cached_user(user.id)
     return {"message": "Logged out successfully"}
 
 
 @router.post("/refresh")
-async def refresh_token(request: RefreshRequest, db: Session = Depends(get_db)):
+def refresh_token(request: RefreshRequest, db: Session = Depends(get_db)):
     """Refresh access token"""
     from sqlalchemy import func
 
@@ -136,7 +178,7 @@ async def refresh_token(request: RefreshRequest, db: Session = Depends(get_db)):
     db.query(RefreshToken).filter(RefreshToken.token == request.refresh_token).delete()
 
     # Create new tokens
-    access_token = create_access_token(user.id, user.email)
+    access_token = create_access_token(user.id, user.email, token_profile(user))
     new_refresh, refresh_expires = create_refresh_token(user.id)
 
     new_token = RefreshToken(
@@ -156,7 +198,7 @@ async def refresh_token(request: RefreshRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/me")
-async def get_current_user_profile(user=Depends(get_current_user), db: Session = Depends(get_db)):
+def get_current_user_profile(user=Depends(get_current_user), db: Session = Depends(get_db)):
     """Get current user's profile"""
     result = db.query(User).filter(User.id == user.id).first()
 
@@ -169,7 +211,7 @@ async def get_current_user_profile(user=Depends(get_current_user), db: Session =
 
 
 @router.patch("/me")
-async def update_profile(
+def update_profile(
     request: UpdateProfileRequest,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -185,6 +227,7 @@ async def update_profile(
         setattr(db_user, key, value)
     db.commit()
     db.refresh(db_user)
+    invalidate_cached_user(user.id)
 
     d = db_user.to_dict()
     d.pop("password_hash", None)
@@ -197,6 +240,29 @@ ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
 MAX_SIZE = 2 * 1024 * 1024  # 2 MB
 
 
+def _store_avatar(user_id: str, ext: str, content: bytes, db: Session) -> str:
+    """Write the avatar file and update users.avatar_url (blocking I/O)."""
+    os.makedirs(AVATAR_DIR, exist_ok=True)
+
+    # Remove old avatar if exists
+    for old_ext in ALLOWED_EXTENSIONS:
+        old_path = os.path.join(AVATAR_DIR, f"{user_id}{old_ext}")
+        if os.path.exists(old_path):
+            os.remove(old_path)
+
+    filename = f"{user_id}{ext}"
+    filepath = os.path.join(AVATAR_DIR, filename)
+    with open(filepath, "wb") as f:
+        f.write(content)
+
+    avatar_url = f"/api/auth/avatar/{filename}"
+    db_user = db.query(User).filter(User.id == user_id).first()
+    db_user.avatar_url = avatar_url
+    db.commit()
+    invalidate_cached_user(user_id)
+    return avatar_url
+
+
 @router.post("/avatar")
 async def upload_avatar(
     file: UploadFile = File(...),
@@ -212,23 +278,7 @@ async def upload_avatar(
     if len(content) > MAX_SIZE:
         raise HTTPException(status_code=400, detail="Image trop volumineuse (max 2 Mo)")
 
-    os.makedirs(AVATAR_DIR, exist_ok=True)
-
-    # Remove old avatar if exists
-    for old_ext in ALLOWED_EXTENSIONS:
-        old_path = os.path.join(AVATAR_DIR, f"{user.id}{old_ext}")
-        if os.path.exists(old_path):
-            os.remove(old_path)
-
-    filename = f"{user.id}{ext}"
-    filepath = os.path.join(AVATAR_DIR, filename)
-    with open(filepath, "wb") as f:
-        f.write(content)
-
-    avatar_url = f"/api/auth/avatar/{filename}"
-    db_user = db.query(User).filter(User.id == user.id).first()
-    db_user.avatar_url = avatar_url
-    db.commit()
+    avatar_url = await run_db(_store_avatar, user.id, ext, content, db)
 
     return {"avatar_url": avatar_url}
 
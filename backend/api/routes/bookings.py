@@ -1,7 +1,7 @@
 """Bookings routes - SQLAlchemy ORM"""
 
 import uuid
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel
 from typing import Optional
 from datetime import date, timedelta
@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session, joinedload
 
 from database.session import get_db
 from database.models import Booking, Package
+from database.pagination import InvalidCursor, decode_cursor, keyset_page
 from auth.middleware import get_current_user
 
 router = APIRouter()
@@ -37,12 +38,22 @@ def _get_booking_with_joins(db: Session, booking_id: str, user_id: str):
 
 
 @router.get("/")
-async def list_user_bookings(
+def list_user_bookings(
     status: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size (all bookings if omitted)"),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """List current user's bookings"""
+    """List current user's bookings, newest first (by cursor, or by offset)"""
+    try:
+        after = decode_cursor(cursor, 2)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if after is not None and limit is None:
+        limit = 20
+
     query = (
         db.query(Booking)
         .options(joinedload(Booking.package).joinedload(Package.destination))
@@ -52,15 +63,15 @@ async def list_user_bookings(
     if status:
         query = query.filter(Booking.status == status)
 
-    query = query.order_by(Booking.created_at.desc())
-
-    rows = query.all()
+    rows, next_cursor = keyset_page(
+        query, (Booking.created_at, Booking.id), limit, after=after, offset=0 if after else offset
+    )
     bookings = [b.to_dict_with_joins() for b in rows]
-    return {"bookings": bookings}
+    return {"bookings": bookings, "next_cursor": next_cursor}
 
 
 @router.post("/")
-async def create_booking(
+def create_booking(
     booking: BookingCreate,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -123,7 +134,7 @@ async def create_booking(
 
 
 @router.get("/{booking_id}")
-async def get_booking(
+def get_booking(
     booking_id: str,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -138,7 +149,7 @@ async def get_booking(
 
 
 @router.patch("/{booking_id}")
-async def update_booking(
+def update_booking(
     booking_id: str,
     update: BookingUpdate,
     user=Depends(get_current_user),
@@ -173,7 +184,7 @@ async def update_booking(
 
 
 @router.delete("/{booking_id}")
-async def cancel_booking(
+def cancel_booking(
     booking_id: str,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
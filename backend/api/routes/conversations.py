@@ -2,15 +2,19 @@
 
 import json
 import uuid
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, Depends, Query
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from database.session import get_db, create_session
-from database.models import Conversation
-from agents.orchestrator.agent import process_request
+from config import settings
+from database.session import get_db, create_session, run_db
+from database.models import Conversation, ConversationMessage
+from agents.orchestrator.agent import process_request, stream_request
+from agents.checkpointer import checkpointer
 from auth.middleware import get_current_user, get_optional_user
 
 router = APIRouter()
@@ -31,13 +35,90 @@ class ConversationResponse(BaseModel):
 active_connections: Dict[str, WebSocket] = {}
 
 
-def _to_json(value):
-    """Convert a Python object to a JSON string for CLOB storage."""
-    if value is None:
+def _load_recent_messages(conversation_id: str, limit: int) -> tuple[bool, list]:
+    """Return (exists, newest `limit` messages oldest-first) (blocking, own session)."""
+    db = create_session()
+    try:
+        exists = (
+            db.query(Conversation.id)
+            .filter(Conversation.id == conversation_id)
+            .first()
+        ) is not None
+        if not exists:
+            return False, []
+
+        rows = (
+            db.query(ConversationMessage)
+            .filter(ConversationMessage.conversation_id == conversation_id)
+            .order_by(ConversationMessage.seq.desc())
+            .limit(limit)
+            .all()
+        )
+        return True, [m.to_dict() for m in reversed(rows)]
+    finally:
+        db.close()
+
+
+def _message_time(timestamp: Optional[str]) -> Optional[datetime]:
+    """created_at for a history entry's ISO timestamp (naive = UTC)."""
+    if not timestamp:
+        return None
+    try:
+        value = datetime.fromisoformat(timestamp)
+    except ValueError:
         return None
-    if isinstance(value, str):
-        return value
-    return json.dumps(value, ensure_ascii=False)
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _append_messages(conversation_id: str, messages: list, conv_exists: bool) -> bool:
+    """Insert one row per new message, creating the conversation if needed.
+
+    The conversation row is locked (SELECT ... FOR UPDATE) before reading
+    MAX(seq), so overlapping turns on one conversation (REST and
+    WebSocket, two tabs) append one after the other instead of colliding
+    on (conversation_id, seq). Each row keeps its entry's own timestamp.
+
+    Returns True once the conversation row exists.
+    """
+    db = create_session()
+    try:
+        if not conv_exists:
+            try:
+                db.add(Conversation(id=conversation_id, user_id=None, context="{}"))
+                db.commit()
+            except IntegrityError:
+                # Created by a concurrent turn
+                db.rollback()
+
+        (
+            db.query(Conversation.id)
+            .filter(Conversation.id == conversation_id)
+            .with_for_update()
+            .one()
+        )
+        last_seq = (
+            db.query(func.max(ConversationMessage.seq))
+            .filter(ConversationMessage.conversation_id == conversation_id)
+            .scalar()
+        ) or 0
+
+        for offset, msg in enumerate(messages, start=1):
+            row = ConversationMessage(
+                id=str(uuid.uuid4()),
+                conversation_id=conversation_id,
+                seq=last_seq + offset,
+                role=msg["role"],
+                content=msg["content"],
+                ui_actions=msg.get("ui_actions"),
+            )
+            created_at = _message_time(msg.get("timestamp"))
+            if created_at is not None:
+                row.created_at = created_at
+            db.add(row)
+        db.commit()
+        return True
+    finally:
+        db.close()
 
 
 @router.websocket("/ws/{conversation_id}")
@@ -46,16 +127,9 @@ async def websocket_chat(websocket: WebSocket, conversation_id: str):
     await websocket.accept()
     active_connections[conversation_id] = websocket
 
-    # Get or create conversation (manual session for WebSocket)
-    db = create_session()
-    try:
-        conv = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-        history = []
-        if conv:
-            history = conv.messages or []
-        conv_exists = conv is not None
-    finally:
-        db.close()
+    # Get or create conversation (DB work runs off the event loop)
+    window = settings.conversation_history_window
+    conv_exists, history = await run_db(_load_recent_messages, conversation_id, window)
 
     try:
         while True:
@@ -73,52 +147,46 @@ async def websocket_chat(websocket: WebSocket, conversation_id: str):
             user_message = message_data.get("message", "")
             user_context = message_data.get("context", {})
 
-            history.append({
+            user_entry = {
                 "role": "user",
                 "content": user_message,
                 "timestamp": datetime.utcnow().isoformat()
-            })
-
-            result = await process_request(
-                message=user_message,
-                context={
-                    "history": history,
-                    "user": user_context.get("user"),
-                    "conversation_id": conversation_id,
-                    **user_context
-                }
-            )
-
-            history.append({
+            }
+            history.append(user_entry)
+
+            request_context = {
+                "history": history,
+                "user": user_context.get("user"),
+                "conversation_id": conversation_id,
+                **user_context
+            }
+
+            if message_data.get("stream", True):
+                # Forward token/tool_start/ui_action frames as they happen
+                async for event in stream_request(message=user_message, context=request_context):
+                    if event["type"] == "done":
+                        result = event
+                    else:
+                        await websocket.send_text(json.dumps(event, default=str))
+            else:
+                result = await process_request(message=user_message, context=request_context)
+
+            assistant_entry = {
                 "role": "assistant",
                 "content": result["response"],
                 "timestamp": datetime.utcnow().isoformat(),
                 "ui_actions": result.get("ui_actions", [])
-            })
+            }
+            history.append(assistant_entry)
+            del history[:-window]
 
-            # Save conversation (new session per message)
-            db = create_session()
-            try:
-                messages_json = _to_json(history)
-                if conv_exists:
-                    conv = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-                    if conv:
-                        conv.messages = messages_json
-                        db.commit()
-                else:
-                    new_conv = Conversation(
-                        id=conversation_id,
-                        user_id=None,
-                        messages=messages_json,
-                        context="{}",
-                    )
-                    db.add(new_conv)
-                    db.commit()
-                    conv_exists = True
-            finally:
-                db.close()
+            # Append the turn (one row per message, new session)
+            conv_exists = await run_db(
+                _append_messages, conversation_id, [user_entry, assistant_entry], conv_exists
+            )
 
             await websocket.send_text(json.dumps({
+                "type": "done",
                 "response": result["response"],
                 "ui_actions": result.get("ui_actions", []),
                 "agent_type": result.get("agent_type"),
@@ -146,20 +214,18 @@ async def websocket_chat(websocket: WebSocket, conversation_id: str):
 async def send_message(
     conversation_id: str,
     chat: ChatMessage,
-    db: Session = Depends(get_db),
 ) -> ConversationResponse:
     """Send a message to the vacation assistant (REST alternative to WebSocket)."""
-    conv = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-
-    history = []
-    if conv:
-        history = conv.messages or []
+    conv_exists, history = await run_db(
+        _load_recent_messages, conversation_id, settings.conversation_history_window
+    )
 
-    history.append({
+    user_entry = {
         "role": "user",
         "content": chat.message,
         "timestamp": datetime.utcnow().isoformat()
-    })
+    }
+    history.append(user_entry)
 
     result = await process_request(
         message=chat.message,
@@ -170,25 +236,14 @@ async def send_message(
         }
     )
 
-    history.append({
+    assistant_entry = {
         "role": "assistant",
         "content": result["response"],
         "timestamp": datetime.utcnow().isoformat(),
         "ui_actions": result.get("ui_actions", [])
-    })
-
-    messages_json = _to_json(history)
-    if conv:
-        conv.messages = messages_json
-    else:
-        new_conv = Conversation(
-            id=conversation_id,
-            user_id=None,
-            messages=messages_json,
-            context="{}",
-        )
-        db.add(new_conv)
-    db.commit()
+    }
+
+    await run_db(_append_messages, conversation_id, [user_entry, assistant_entry], conv_exists)
 
     return ConversationResponse(
         response=result["response"],
@@ -198,28 +253,51 @@ async def send_message(
 
 
 @router.get("/{conversation_id}")
-async def get_conversation(conversation_id: str, db: Session = Depends(get_db)):
-    """Get conversation history."""
+def get_conversation(
+    conversation_id: str,
+    limit: int = Query(50, ge=1, le=200),
+    before_seq: Optional[int] = Query(None, description="Only messages older than this seq (next page)"),
+    db: Session = Depends(get_db),
+):
+    """Get conversation history: the newest `limit` messages, oldest first."""
     conv = db.query(Conversation).filter(Conversation.id == conversation_id).first()
 
     if not conv:
         return {"messages": [], "conversation_id": conversation_id}
 
-    return conv.to_dict()
+    query = (
+        db.query(ConversationMessage)
+        .filter(ConversationMessage.conversation_id == conversation_id)
+    )
+    if before_seq is not None:
+        query = query.filter(ConversationMessage.seq < before_seq)
+
+    rows = query.order_by(ConversationMessage.seq.desc()).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    d = conv.to_dict()
+    d["messages"] = [m.to_dict() for m in reversed(rows)]
+    d["has_more"] = has_more
+    d["next_before_seq"] = rows[-1].seq if has_more else None
+    return d
 
 
 @router.delete("/{conversation_id}")
-async def clear_conversation(conversation_id: str, db: Session = Depends(get_db)):
-    """Clear conversation history."""
-    conv = db.query(Conversation).filter(Conversation.id == conversation_id).first()
-    if conv:
-        conv.messages = "[]"
-        db.commit()
+def clear_conversation(conversation_id: str, db: Session = Depends(get_db)):
+    """Clear conversation history (and the agent's memory of it)."""
+    (
+        db.query(ConversationMessage)
+        .filter(ConversationMessage.conversation_id == conversation_id)
+        .delete()
+    )
+    db.commit()
+    checkpointer.delete_thread(conversation_id)
     return {"message": "Conversation cleared"}
 
 
 @router.post("/new")
-async def create_conversation(
+def create_conversation(
     user=Depends(get_optional_user),
     db: Session = Depends(get_db),
 ):
@@ -229,7 +307,6 @@ async def create_conversation(
     conv = Conversation(
         id=conversation_id,
         user_id=user.id if user else None,
-        messages="[]",
         context="{}",
     )
     db.add(conv)
@@ -6,12 +6,13 @@ from sqlalchemy.orm import Session
 
 from database.session import get_db
 from database.models import Destination, Package
+from database.queries import destination_has_tags
 
 router = APIRouter()
 
 
 @router.get("/")
-async def list_destinations(
+def list_destinations(
     country: Optional[str] = None,
     tags: Optional[str] = Query(None, description="Comma-separated tags"),
     limit: int = Query(20, ge=1, le=100),
@@ -23,26 +24,20 @@ async def list_destinations(
     if country:
         query = query.filter(Destination.country == country)
 
+    tag_filter = destination_has_tags(tags.split(",") if tags else None)
+    if tag_filter is not None:
+        query = query.filter(tag_filter)
+
     query = query.order_by(Destination.average_rating.desc().nulls_last())
 
     rows = query.offset(0).limit(limit).all()
     destinations = [d.to_dict() for d in rows]
 
-    # Filter by tags in Python (JSON array in CLOB)
-    if tags:
-        tag_list = [t.strip().lower() for t in tags.split(",")]
-        destinations = [
-            d for d in destinations
-            if d.get("tags") and any(
-                t.lower() in [x.lower() for x in d["tags"]] for t in tag_list
-            )
-        ]
-
     return {"destinations": destinations, "count": len(destinations)}
 
 
 @router.get("/{destination_id}")
-async def get_destination(destination_id: str, db: Session = Depends(get_db)):
+def get_destination(destination_id: str, db: Session = Depends(get_db)):
     """Get destination details with its packages"""
     dest = db.query(Destination).filter(Destination.id == destination_id).first()
 
@@ -64,7 +59,7 @@ async def get_destination(destination_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/{destination_id}/packages")
-async def get_destination_packages(
+def get_destination_packages(
     destination_id: str,
     min_price: Optional[float] = None,
     max_price: Optional[float] = None,
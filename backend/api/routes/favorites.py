@@ -12,7 +12,7 @@ router = APIRouter()
 
 
 @router.get("/")
-async def list_favorites(
+def list_favorites(
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -28,7 +28,7 @@ async def list_favorites(
 
 
 @router.post("/{package_id}")
-async def add_favorite(
+def add_favorite(
     package_id: str,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -55,7 +55,7 @@ async def add_favorite(
 
 
 @router.delete("/{package_id}")
-async def remove_favorite(
+def remove_favorite(
     package_id: str,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -75,7 +75,7 @@ async def remove_favorite(
 
 
 @router.get("/check/{package_id}")
-async def check_favorite(
+def check_favorite(
     package_id: str,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -22,7 +22,7 @@ async def health_check():
 
 
 @router.get("/ready")
-async def readiness_check(db: Session = Depends(get_db)):
+def readiness_check(db: Session = Depends(get_db)):
     """Readiness check endpoint"""
     try:
         result = db.execute(text("SELECT 1 FROM DUAL")).scalar()
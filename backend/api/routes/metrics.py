@@ -0,0 +1,19 @@
+"""Metrics routes - in-process runtime metrics"""
+
+from fastapi import APIRouter
+
+from metrics import collect
+
+router = APIRouter()
+
+
+@router.get("/")
+async def get_metrics():
+    """All registered runtime metrics"""
+    return collect()
+
+
+@router.get("/db-pool")
+async def get_db_pool_metrics():
+    """Connection pool state plus checkout wait and hold-time histograms (ms)"""
+    return collect("db_pool")
@@ -5,14 +5,29 @@ from typing import Optional
 from datetime import date
 from sqlalchemy.orm import Session, joinedload
 
+from config import settings
 from database.session import get_db
-from database.models import Package, Review, Destination
+from database.models import Package
+from database.pagination import InvalidCursor, decode_cursor, keyset_page
+from database.queries import (
+    package_search_filters, search_packages_query, count_packages,
+    review_stats, package_reviews_page,
+)
 
 router = APIRouter()
 
+# sort_by -> (keyset columns ending with the id tie-breaker, descending)
+SORT_KEYS = {
+    "price_asc": ((Package.price_per_person, Package.id), False),
+    "price_desc": ((Package.price_per_person, Package.id), True),
+    "duration_asc": ((Package.duration_days, Package.id), False),
+    "duration_desc": ((Package.duration_days, Package.id), True),
+    "name_asc": ((Package.name, Package.id), False),
+}
+
 
 @router.get("/")
-async def list_packages(
+def list_packages(
     destination: Optional[str] = None,
     destination_id: Optional[str] = None,
     min_price: Optional[float] = None,
@@ -24,83 +39,57 @@ async def list_packages(
     sort_by: Optional[str] = Query(None, description="Sort: price_asc, price_desc, duration_asc, duration_desc, name_asc"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page (same sort_by)"),
     db: Session = Depends(get_db),
 ):
-    """Search packages with filters"""
-    query = (
-        db.query(Package)
-        .options(joinedload(Package.destination))
-        .filter(Package.is_active == True)
+    """Search packages with filters (paged by cursor, or by offset)"""
+    if sort_by not in SORT_KEYS:
+        sort_by = "price_asc"
+    columns, descending = SORT_KEYS[sort_by]
+    try:
+        after = decode_cursor(cursor, len(columns), scope=sort_by)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    criteria = package_search_filters(
+        destination=destination,
+        destination_id=destination_id,
+        min_price=min_price,
+        max_price=max_price,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        tags=tags.split(",") if tags else None,
+        start_date=start_date,
     )
 
-    # SQL-level filters
-    if destination_id:
-        query = query.filter(Package.destination_id == destination_id)
-    if min_price is not None:
-        query = query.filter(Package.price_per_person >= min_price)
-    if max_price is not None:
-        query = query.filter(Package.price_per_person <= max_price)
-    if min_duration is not None:
-        query = query.filter(Package.duration_days >= min_duration)
-    if max_duration is not None:
-        query = query.filter(Package.duration_days <= max_duration)
-    if start_date:
-        query = query.filter(Package.available_from <= start_date)
-        query = query.filter(Package.available_to >= start_date)
-
-    # Sorting
-    sort_map = {
-        "price_asc": Package.price_per_person.asc(),
-        "price_desc": Package.price_per_person.desc(),
-        "duration_asc": Package.duration_days.asc(),
-        "duration_desc": Package.duration_days.desc(),
-        "name_asc": Package.name.asc(),
-    }
-    order = sort_map.get(sort_by, Package.price_per_person.asc())
-    query = query.order_by(order)
-
-    # Fetch all matching rows (needed for Python-level filters)
-    rows = query.all()
-
-    # Python-level filter: destination text search (fallback when no destination_id)
-    if destination and not destination_id:
-        dest_lower = destination.lower()
-        rows = [
-            p for p in rows
-            if p.destination and (
-                dest_lower in (p.destination.name or "").lower()
-                or dest_lower in (p.destination.city or "").lower()
-                or dest_lower in (p.destination.country or "").lower()
-            )
-        ]
-
-    # Python-level filter: tags (match on destination tags)
-    if tags:
-        tag_list = [t.strip().lower() for t in tags.split(",") if t.strip()]
-        rows = [
-            p for p in rows
-            if p.destination and p.destination.tags and any(
-                t in [x.lower() for x in p.destination.tags] for t in tag_list
-            )
-        ]
-
-    # Total after all filters
-    total = len(rows)
-
-    # Pagination (applied after Python filters)
-    paginated = rows[offset:offset + limit]
-    packages = [p.to_dict_with_destination() for p in paginated]
+    total = count_packages(db, criteria)
+    # A cursor already encodes the position, so offset only applies without one
+    if after:
+        offset = 0
+
+    # Package.id as tie-breaker keeps pages stable
+    rows, next_cursor = keyset_page(
+        search_packages_query(db, criteria),
+        columns,
+        limit,
+        after=after,
+        offset=offset,
+        descending=descending,
+        scope=sort_by,
+    )
+    packages = [p.to_dict_with_destination() for p in rows]
 
     return {
         "packages": packages,
         "total": total,
         "limit": limit,
-        "offset": offset
+        "offset": offset,
+        "next_cursor": next_cursor,
     }
 
 
 @router.get("/featured")
-async def get_featured_packages(
+def get_featured_packages(
     limit: int = Query(6, ge=1, le=20),
     db: Session = Depends(get_db),
 ):
@@ -118,8 +107,11 @@ async def get_featured_packages(
 
 
 @router.get("/{package_id}")
-async def get_package(package_id: str, db: Session = Depends(get_db)):
-    """Get package details with destination and reviews"""
+def get_package(package_id: str, db: Session = Depends(get_db)):
+    """Get package details with destination, newest reviews and review stats
+
+    More reviews: GET /api/reviews/package/{id}?cursor=<reviews_next_cursor>
+    """
     pkg = (
         db.query(Package)
         .options(joinedload(Package.destination))
@@ -132,21 +124,17 @@ async def get_package(package_id: str, db: Session = Depends(get_db)):
 
     package = pkg.to_dict_with_destination()
 
-    # Get reviews with user info
-    reviews = (
-        db.query(Review)
-        .options(joinedload(Review.user))
-        .filter(Review.package_id == package_id)
-        .order_by(Review.created_at.desc())
-        .all()
-    )
+    # Newest reviews with user info; the rest is paged through the reviews route
+    reviews, next_cursor = package_reviews_page(db, package_id, settings.package_detail_reviews)
     package["reviews"] = [r.to_dict_with_user() for r in reviews]
+    package["reviews_next_cursor"] = next_cursor
+    package["review_stats"] = review_stats(db, package_id)
 
     return package
 
 
 @router.get("/{package_id}/availability")
-async def check_availability(
+def check_availability(
     package_id: str,
     start_date: date,
     num_persons: int = Query(1, ge=1, le=10),
@@ -4,11 +4,13 @@ import uuid
 from fastapi import APIRouter, HTTPException, Depends, Query
 from pydantic import BaseModel, Field
 from typing import Optional
-from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from database.session import get_db
-from database.models import Review, Booking, Package, Destination
+from database.models import Review, Booking
+from database.pagination import InvalidCursor, decode_cursor
+from database.queries import package_reviews_page
+from database.ratings import add_rating
 from auth.middleware import get_current_user
 
 router = APIRouter()
@@ -22,28 +24,28 @@ class ReviewCreate(BaseModel):
 
 
 @router.get("/package/{package_id}")
-async def get_package_reviews(
+def get_package_reviews(
     package_id: str,
     limit: int = Query(10, ge=1, le=50),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
     db: Session = Depends(get_db),
 ):
-    """Get reviews for a package"""
-    rows = (
-        db.query(Review)
-        .options(joinedload(Review.user))
-        .filter(Review.package_id == package_id)
-        .order_by(Review.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
+    """Get reviews for a package, newest first (by cursor, or by offset)"""
+    try:
+        after = decode_cursor(cursor, 2)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rows, next_cursor = package_reviews_page(
+        db, package_id, limit, after=after, offset=0 if after else offset
     )
     reviews = [r.to_dict_with_user() for r in rows]
-    return {"reviews": reviews}
+    return {"reviews": reviews, "next_cursor": next_cursor}
 
 
 @router.post("/")
-async def create_review(
+def create_review(
     review: ReviewCreate,
     user=Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -87,6 +89,8 @@ async def create_review(
         review_comment=review.comment,
     )
     db.add(new_review)
+    # Package/destination rating aggregates, in the same transaction
+    add_rating(db, review.package_id, review.rating)
     db.commit()
 
     # Reload with user join
@@ -98,27 +102,5 @@ async def create_review(
     )
     result_dict = result.to_dict_with_user() if result else {"id": review_id}
 
-    # Update destination average rating
-    _update_destination_rating(db, review.package_id)
-
     return {"message": "Review created", "review": result_dict}
 
-
-def _update_destination_rating(db: Session, package_id: str):
-    """Update destination average rating after new review"""
-    pkg = db.query(Package).filter(Package.id == package_id).first()
-    if not pkg:
-        return
-
-    avg = (
-        db.query(func.avg(Review.rating))
-        .join(Package, Review.package_id == Package.id)
-        .filter(Package.destination_id == pkg.destination_id)
-        .scalar()
-    )
-
-    if avg is not None:
-        dest = db.query(Destination).filter(Destination.id == pkg.destination_id).first()
-        if dest:
-            dest.average_rating = round(float(avg), 1)
-            db.commit()
@@ -1,17 +1,20 @@
 """TripAdvisor routes - SQLAlchemy ORM"""
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import Optional
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func
+from sqlalchemy.orm import Session
 
 from database.session import get_db
 from database.models import TripAdvisorLocation, TripAdvisorPhoto, TripAdvisorReview
+from database.pagination import InvalidCursor, decode_cursor, keyset_page
+from database.queries import rows_by_location, totals_by_location
 
 router = APIRouter()
 
 
 @router.get("/locations")
-async def list_locations(
+def list_locations(
     country: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
@@ -25,27 +28,70 @@ async def list_locations(
 
 
 @router.get("/locations-with-details")
-async def list_locations_with_details(
+def list_locations_with_details(
     country: Optional[str] = None,
+    max_photos: Optional[int] = Query(None, ge=0, description="Photos per location (all if omitted)"),
+    max_reviews: Optional[int] = Query(None, ge=0, description="Newest reviews per location (all if omitted)"),
     db: Session = Depends(get_db),
 ):
-    """List TripAdvisor locations with photos and reviews in a single query"""
-    query = (
-        db.query(TripAdvisorLocation)
-        .options(
-            joinedload(TripAdvisorLocation.photos),
-            joinedload(TripAdvisorLocation.reviews),
-        )
-    )
+    """List TripAdvisor locations with photos, reviews and average rating
+
+    Photos and reviews are loaded with one IN-list query each (per 500
+    locations) rather than joined to the locations, which returned
+    photos x reviews rows per location. photo_count, review_count and
+    average_rating always cover every row, whatever the caps.
+    """
+    query = db.query(TripAdvisorLocation)
     if country:
         query = query.filter(TripAdvisorLocation.search_country == country)
     rows = query.order_by(TripAdvisorLocation.name).all()
-    locations = [r.to_dict_with_details() for r in rows]
+    location_ids = [r.location_id for r in rows]
+
+    photos = rows_by_location(
+        db, TripAdvisorPhoto, location_ids,
+        (TripAdvisorPhoto.created_at, TripAdvisorPhoto.id), max_photos,
+    )
+    reviews = rows_by_location(
+        db, TripAdvisorReview, location_ids,
+        (TripAdvisorReview.published_date.desc().nulls_last(), TripAdvisorReview.id), max_reviews,
+    )
+    photo_totals = {}
+    review_totals = {}
+    if max_photos is not None:
+        photo_totals = totals_by_location(
+            db, TripAdvisorPhoto, location_ids, func.count(TripAdvisorPhoto.id)
+        )
+    if max_reviews is not None:
+        review_totals = totals_by_location(
+            db, TripAdvisorReview, location_ids,
+            func.count(TripAdvisorReview.id), func.avg(TripAdvisorReview.rating),
+        )
+
+    locations = []
+    for r in rows:
+        d = r.to_dict()
+        location_photos = photos[r.location_id]
+        location_reviews = reviews[r.location_id]
+        d["photos"] = [p.to_dict() for p in location_photos]
+        d["reviews"] = [rv.to_dict() for rv in location_reviews]
+
+        if max_photos is None:
+            d["photo_count"] = len(location_photos)
+        else:
+            d["photo_count"] = photo_totals.get(r.location_id, (0,))[0]
+        if max_reviews is None:
+            ratings = [rv.rating for rv in location_reviews if rv.rating]
+            d["review_count"] = len(location_reviews)
+            average = sum(ratings) / len(ratings) if ratings else 0.0
+        else:
+            d["review_count"], average = review_totals.get(r.location_id, (0, None))
+        d["average_rating"] = round(float(average or 0), 1)
+        locations.append(d)
     return {"locations": locations}
 
 
 @router.get("/countries")
-async def list_countries(db: Session = Depends(get_db)):
+def list_countries(db: Session = Depends(get_db)):
     """List unique countries from TripAdvisor locations"""
     rows = (
         db.query(TripAdvisorLocation.search_country)
@@ -59,7 +105,7 @@ async def list_countries(db: Session = Depends(get_db)):
 
 
 @router.get("/locations/{location_id}")
-async def get_location(location_id: str, db: Session = Depends(get_db)):
+def get_location(location_id: str, db: Session = Depends(get_db)):
     """Get a single TripAdvisor location"""
     row = (
         db.query(TripAdvisorLocation)
@@ -72,7 +118,7 @@ async def get_location(location_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/locations/{location_id}/photos")
-async def get_location_photos(location_id: str, db: Session = Depends(get_db)):
+def get_location_photos(location_id: str, db: Session = Depends(get_db)):
     """Get photos for a TripAdvisor location"""
     rows = (
         db.query(TripAdvisorPhoto)
@@ -84,13 +130,35 @@ async def get_location_photos(location_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/locations/{location_id}/reviews")
-async def get_location_reviews(location_id: str, db: Session = Depends(get_db)):
-    """Get reviews for a TripAdvisor location"""
-    rows = (
-        db.query(TripAdvisorReview)
-        .filter(TripAdvisorReview.location_id == location_id)
-        .order_by(TripAdvisorReview.published_date.desc().nulls_last())
-        .all()
+def get_location_reviews(
+    location_id: str,
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size (all reviews if omitted)"),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    db: Session = Depends(get_db),
+):
+    """Get reviews for a TripAdvisor location
+
+    Without `limit`/`cursor`: every review, by publication date. Paged:
+    newest imported first, by (created_at, id) - published_date is
+    nullable, so it cannot key a cursor.
+    """
+    try:
+        after = decode_cursor(cursor, 2)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    query = db.query(TripAdvisorReview).filter(TripAdvisorReview.location_id == location_id)
+    if limit is None and after is None:
+        rows = query.order_by(TripAdvisorReview.published_date.desc().nulls_last()).all()
+        return {"reviews": [r.to_dict() for r in rows], "next_cursor": None}
+
+    rows, next_cursor = keyset_page(
+        query,
+        (TripAdvisorReview.created_at, TripAdvisorReview.id),
+        limit or 20,
+        after=after,
+        offset=0 if after else offset,
     )
     reviews = [r.to_dict() for r in rows]
-    return {"reviews": reviews}
+    return {"reviews": reviews, "next_cursor": next_cursor}
@@ -1,12 +1,23 @@
 """JWT Authentication Service for VacanceAI - replaces Supabase Auth"""
 
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
 from passlib.context import CryptContext
 import jwt
 from config import settings
+from metrics import Histogram, register_collector
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.bcrypt_rounds,
+)
 
 # Token constants
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expire_minutes
@@ -25,8 +36,89 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def create_access_token(user_id: str, email: str) -> str:
-    """Create a JWT access token."""
+class PasswordHasherBusy(Exception):
+    """Raised when the password hashing queue is full."""
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, size-limited thread pool.
+
+    bcrypt releases the GIL, so worker threads keep its 100-300 ms of CPU
+    per call off the event loop and out of the DB worker pool. Calls beyond
+    `max_queue` waiting jobs are rejected with PasswordHasherBusy.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.running = 0
+        self.rejected = 0
+        self.wait_ms = Histogram()
+        self.hash_ms = Histogram()
+
+    async def run(self, fn: Callable, *args):
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise PasswordHasherBusy()
+            self.queued += 1
+        submitted = time.perf_counter()
+
+        def job():
+            started = time.perf_counter()
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+            self.wait_ms.observe((started - submitted) * 1000)
+            try:
+                return fn(*args)
+            finally:
+                self.hash_ms.observe((time.perf_counter() - started) * 1000)
+                with self._lock:
+                    self.running -= 1
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "bcrypt_rounds": settings.bcrypt_rounds,
+            "queued": self.queued,
+            "running": self.running,
+            "rejected": self.rejected,
+            "wait_ms": self.wait_ms.snapshot(),
+            "hash_ms": self.hash_ms.snapshot(),
+        }
+
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    max_queue=settings.password_hash_max_queue,
+)
+register_collector("password_hashing", password_hasher.stats)
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password on the password hashing pool."""
+    return await password_hasher.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the password hashing pool."""
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+
+def create_access_token(user_id: str, email: str, profile: Optional[dict] = None) -> str:
+    """Create a JWT access token.
+
+    `profile` (first_name, last_name, phone, avatar_url) is embedded as
+    claims so get_current_user can skip the DB when
+    settings.auth_trust_token_claims is enabled.
+    """
     expires = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     payload = {
         "sub": user_id,
@@ -35,9 +127,21 @@ def create_access_token(user_id: str, email: str) -> str:
         "exp": expires,
         "iat": datetime.now(timezone.utc),
     }
+    if profile:
+        payload.update(profile)
     return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
+def token_profile(user) -> dict:
+    """Profile claims for create_access_token from a User row."""
+    return {
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "phone": user.phone,
+        "avatar_url": user.avatar_url,
+    }
+
+
 def create_refresh_token(user_id: str) -> tuple[str, datetime]:
     """Create a JWT refresh token. Returns (token, expires_at)."""
     expires = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
@@ -46,6 +150,9 @@ def create_refresh_token(user_id: str) -> tuple[str, datetime]:
         "type": "refresh",
         "exp": expires,
         "iat": datetime.now(timezone.utc),
+        # Two logins in the same second would otherwise get the same token
+        # (refresh_tokens.token is unique)
+        "jti": uuid.uuid4().hex,
     }
     token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
     return token, expires
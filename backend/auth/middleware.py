@@ -6,11 +6,21 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from auth.jwt_service import decode_token
+from cache import TTLCache
+from config import settings
 from database.session import get_db
 from database.models import User as UserModel
+from metrics import register_collector
 
 security = HTTPBearer()
 
+# Authenticated users keyed on the token's `sub` claim
+user_cache = TTLCache(
+    max_size=settings.user_cache_max_size,
+    ttl=settings.user_cache_ttl_seconds,
+)
+register_collector("user_cache", user_cache.stats)
+
 
 class User:
     """User model from Oracle database"""
@@ -24,8 +34,46 @@ class User:
         self.avatar_url = model.avatar_url
         self.created_at = model.created_at
 
+    @classmethod
+    def from_claims(cls, payload: dict) -> "User":
+        """Build a user from the profile claims embedded in an access token."""
+        user = cls.__new__(cls)
+        user.id = payload["sub"]
+        user.email = payload.get("email")
+        user.first_name = payload.get("first_name")
+        user.last_name = payload.get("last_name")
+        user.phone = payload.get("phone")
+        user.avatar_url = payload.get("avatar_url")
+        user.created_at = None
+        return user
+
+
+def invalidate_cached_user(user_id: str):
+    """Forget a cached user (after profile changes or logout)."""
+    user_cache.invalidate(user_id)
+
+
+def _resolve_user(payload: dict, db: Session) -> Optional[User]:
+    """Return the user for a decoded access token, hitting Oracle only on a cache miss."""
+    user_id = payload["sub"]
+
+    if settings.auth_trust_token_claims and "first_name" in payload:
+        return User.from_claims(payload)
 
-async def get_current_user(
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    user_row = db.query(UserModel).filter(UserModel.id == user_id).first()
+    if not user_row:
+        return None
+
+    user = User(user_row)
+    user_cache.set(user_id, user)
+    return user
+
+
+def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
 ) -> User:
@@ -38,16 +86,15 @@ async def get_current_user(
         if payload.get("type") != "access":
             raise HTTPException(status_code=401, detail="Invalid token type")
 
-        user_id = payload.get("sub")
-        if not user_id:
+        if not payload.get("sub"):
             raise HTTPException(status_code=401, detail="Invalid token")
 
-        user_row = db.query(UserModel).filter(UserModel.id == user_id).first()
+        user = _resolve_user(payload, db)
 
-        if not user_row:
+        if not user:
             raise HTTPException(status_code=401, detail="User not found")
 
-        return User(user_row)
+        return user
 
     except HTTPException:
         raise
@@ -58,7 +105,7 @@ async def get_current_user(
         )
 
 
-async def get_optional_user(
+def get_optional_user(
     request: Request,
     db: Session = Depends(get_db),
 ) -> Optional[User]:
@@ -75,14 +122,10 @@ async def get_optional_user(
         if payload.get("type") != "access":
             return None
 
-        user_id = payload.get("sub")
-        if not user_id:
+        if not payload.get("sub"):
             return None
 
-        user_row = db.query(UserModel).filter(UserModel.id == user_id).first()
-
-        if user_row:
-            return User(user_row)
+        return _resolve_user(payload, db)
 
     except Exception:
         pass
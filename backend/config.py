@@ -20,12 +20,34 @@ class Settings(BaseSettings):
     oracle_user: str = "VACANCEAI"
     oracle_password: str = "vacanceai"
 
+    # Connection pool (QueuePool)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800  # seconds; -1 disables recycling
+    db_pool_pre_ping: bool = False  # ping on every checkout (extra round trip)
+    db_pool_use_lifo: bool = True  # reuse hot connections, let extras idle out
+
+    # Worker threads for blocking DB work (sync routes/dependencies, run_db)
+    db_worker_threads: int = 16
+
     # JWT Auth
     jwt_secret_key: str = "vacanceai-super-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 60
     refresh_token_expire_days: int = 30
 
+    # Password hashing (bcrypt on a dedicated thread pool)
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_queue: int = 64
+
+    # Authenticated user cache (get_current_user / get_optional_user)
+    user_cache_ttl_seconds: int = 60
+    user_cache_max_size: int = 10000
+    # Build the user from access-token profile claims, skipping the DB entirely
+    auth_trust_token_claims: bool = False
+
     # Google AI (Gemini)
     google_api_key: str = ""
 
@@ -35,6 +57,78 @@ class Settings(BaseSettings):
     langchain_project: str = "VacanceAI"
     langchain_endpoint: str = "https://api.smith.langchain.com"
 
+    # Package detail (route and agent tool): newest reviews embedded, rest paged
+    package_detail_reviews: int = 5
+    # Package/destination rating aggregates: full recompute from reviews (drift repair).
+    # 0 = not run by the API; run `python -m database.ratings` as a single job
+    # (k8s/rating-reconciler.yaml). Set it only when one process serves the app.
+    rating_reconcile_interval_seconds: int = 0
+
+    # Chat: recent messages kept in memory / passed to the agent per turn
+    conversation_history_window: int = 20
+
+    # UI agent checkpoints (LangGraph state, stored in Oracle)
+    checkpoint_max_per_thread: int = 10  # older checkpoints are compacted away
+    checkpoint_thread_ttl_hours: int = 72  # idle threads are evicted after this
+    checkpoint_prune_interval_seconds: int = 900
+    # Local development: store checkpoints in SQLite instead of Oracle
+    checkpoint_sqlite_path: Optional[str] = None
+
+    # A2A task store: "memory" (bounded LRU, per process) or "oracle"
+    a2a_task_store: str = "memory"
+    a2a_memory_max_tasks: int = 1000
+    a2a_task_retention_hours: int = 24  # finished tasks older than this are purged
+    a2a_purge_interval_seconds: int = 600
+    # A2A task execution: worker count, queue bound and per-client quota
+    a2a_workers: int = 4
+    a2a_max_queue: int = 100  # beyond this, new tasks get 429 + Retry-After
+    a2a_max_tasks_per_client: int = 10  # queued + running
+    # Queue priority by skill_id (lower runs first, others default to 5)
+    a2a_skill_priorities: dict[str, int] = {
+        "book_package": 0,
+        "chat_assistant": 1,
+        "search_vacations": 2,
+        "get_recommendations": 3,
+        "query_database": 6,
+        "get_data": 6,
+    }
+    # SSE task streams: frames buffered per subscriber before it is dropped
+    a2a_sse_queue_size: int = 256
+    a2a_sse_keepalive_seconds: float = 15.0
+    # Shared store: how often a replica re-reads a task it does not run
+    # (subscribers on other replicas, cancellations from other replicas)
+    a2a_remote_poll_seconds: float = 1.0
+
+    # UI agent model input: token budget, older turns summarized past it
+    history_token_budget: int = 6000
+    history_tool_max_chars: int = 8000  # current turn; earlier turns get a quarter
+    history_summary_enabled: bool = True
+
+    # Agent tool calls: parallel calls per turn, and timeout per call (seconds)
+    agent_tool_concurrency: int = 4
+    agent_tool_timeout_seconds: float = 15.0
+    agent_tool_timeouts: dict[str, float] = {}  # per-tool overrides, by tool name
+
+    # Database agent read tools (search_packages, get_package_details, get_destinations)
+    tool_cache_ttl_seconds: int = 60
+    tool_cache_max_size: int = 1000
+
+    # Orchestrator fast path: answer simple catalog queries without the LLM
+    fast_path_enabled: bool = True
+    fast_path_min_confidence: float = 0.85  # share of words the parser understood
+
+    # Orchestrator response cache (first-turn requests; cleared on catalog writes)
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: int = 300
+    response_cache_database_ttl_seconds: int = 60  # database agent answers
+    response_cache_max_size: int = 2000
+    # Reuse answers across users (user id left out of the cache key)
+    response_cache_share_across_users: bool = False
+    # Semantic tier: reuse the answer of a near-identical message (embedding call per miss)
+    response_cache_semantic: bool = False
+    response_cache_similarity_threshold: float = 0.95
+    response_cache_embedding_model: str = "models/text-embedding-004"
+
     # Frontend URL
     frontend_url: str = "http://localhost:5173"
 
@@ -1,14 +1,16 @@
 """Database module for VacanceAI - SQLAlchemy ORM"""
-from .session import init_engine, close_engine, get_db, create_session
+from .session import init_engine, close_engine, get_db, create_session, run_db
 from .models import (
-    Base, User, RefreshToken, Destination, Package, Booking,
-    Favorite, Review, Conversation,
+    Base, User, RefreshToken, Destination, DestinationTag, Package, Booking,
+    Favorite, Review, Conversation, ConversationMessage,
     TripAdvisorLocation, TripAdvisorPhoto, TripAdvisorReview,
+    AgentCheckpoint, AgentCheckpointWrite, A2ATask,
 )
 
 __all__ = [
-    "init_engine", "close_engine", "get_db", "create_session",
-    "Base", "User", "RefreshToken", "Destination", "Package", "Booking",
-    "Favorite", "Review", "Conversation",
+    "init_engine", "close_engine", "get_db", "create_session", "run_db",
+    "Base", "User", "RefreshToken", "Destination", "DestinationTag", "Package", "Booking",
+    "Favorite", "Review", "Conversation", "ConversationMessage",
     "TripAdvisorLocation", "TripAdvisorPhoto", "TripAdvisorReview",
+    "AgentCheckpoint", "AgentCheckpointWrite", "A2ATask",
 ]
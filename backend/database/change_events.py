@@ -0,0 +1,70 @@
+"""Commit-time table change notifications for VacanceAI caches
+
+Tables written by a session (ORM flushes and bulk query.update/delete)
+are collected per session and reported to listeners once the
+transaction commits; a rollback discards them. Changes made outside this
+process (other replicas, SQL scripts) are not seen, so caches relying on
+this must still expire entries on a TTL.
+"""
+
+import logging
+from typing import Callable, Dict, Iterable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger("database")
+
+_PENDING = "vacanceai_changed_tables"
+
+ChangeListener = Callable[[Set[str]], None]
+_listeners: Dict[str, List[ChangeListener]] = {}
+
+
+def on_tables_changed(tables: Iterable[str], listener: ChangeListener):
+    """Call `listener(changed_tables)` after each commit touching any of `tables`."""
+    for table in tables:
+        _listeners.setdefault(table, []).append(listener)
+
+
+def _mark(session: Session, table: str):
+    if table in _listeners:
+        session.info.setdefault(_PENDING, set()).add(table)
+
+
+@event.listens_for(Session, "after_flush")
+def _after_flush(session, flush_context):
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            _mark(session, table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_bulk(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete:
+        mapper = orm_execute_state.bind_mapper
+        if mapper is not None:
+            _mark(orm_execute_state.session, mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _after_commit(session):
+    changed = session.info.pop(_PENDING, None)
+    if not changed:
+        return
+    notified = set()
+    for table in changed:
+        for listener in _listeners.get(table, ()):
+            if id(listener) in notified:
+                continue
+            notified.add(id(listener))
+            try:
+                listener(changed)
+            except Exception as e:
+                logger.error("Change listener failed for %s: %s", sorted(changed), e)
+
+
+@event.listens_for(Session, "after_rollback")
+def _after_rollback(session):
+    session.info.pop(_PENDING, None)
@@ -0,0 +1,25 @@
+-- =============================================
+-- Migration 001 - destination_tags
+-- Normalizes destinations.tags (JSON array in CLOB) into an indexed
+-- association table and backfills it from existing rows.
+-- Run as VACANCEAI on a database created before this migration.
+-- =============================================
+
+CREATE TABLE destination_tags (
+    destination_id  VARCHAR2(36) NOT NULL,
+    tag             VARCHAR2(50) NOT NULL,
+    CONSTRAINT pk_destination_tags PRIMARY KEY (destination_id, tag),
+    CONSTRAINT fk_destination_tags_dest FOREIGN KEY (destination_id) REFERENCES destinations(id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_destination_tags_tag ON destination_tags(tag, destination_id);
+
+-- Backfill: one lowercased row per distinct tag of each destination
+INSERT INTO destination_tags (destination_id, tag)
+SELECT DISTINCT d.id, LOWER(TRIM(jt.tag))
+FROM destinations d,
+     JSON_TABLE(d.tags, '$[*]' COLUMNS (tag VARCHAR2(50) PATH '$')) jt
+WHERE jt.tag IS NOT NULL
+  AND TRIM(jt.tag) IS NOT NULL;
+
+COMMIT;
@@ -0,0 +1,44 @@
+-- =============================================
+-- Migration 002 - conversation_messages
+-- Moves chat history from the conversations.messages JSON CLOB
+-- (rewritten on every turn) to an append-only table, one row per
+-- message ordered by seq.
+-- Run as VACANCEAI on a database created before this migration.
+-- =============================================
+
+CREATE TABLE conversation_messages (
+    id              VARCHAR2(36) DEFAULT SYS_GUID() PRIMARY KEY,
+    conversation_id VARCHAR2(36) NOT NULL,
+    seq             NUMBER NOT NULL,
+    role            VARCHAR2(20) NOT NULL,
+    content         CLOB,
+    ui_actions      CLOB CHECK (ui_actions IS JSON),
+    created_at      TIMESTAMP WITH TIME ZONE DEFAULT SYSTIMESTAMP NOT NULL,
+    CONSTRAINT fk_conv_messages_conversation FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE,
+    CONSTRAINT uq_conversation_messages_seq UNIQUE (conversation_id, seq)
+);
+
+-- Backfill: explode each history array, keeping its order as seq.
+-- Timestamps were stored as naive UTC ISO strings.
+INSERT INTO conversation_messages (conversation_id, seq, role, content, ui_actions, created_at)
+SELECT c.id,
+       jt.seq,
+       NVL(jt.role, 'user'),
+       jt.content,
+       jt.ui_actions,
+       NVL(FROM_TZ(TO_TIMESTAMP(SUBSTR(jt.ts, 1, 19), 'YYYY-MM-DD"T"HH24:MI:SS'), 'UTC'), c.created_at)
+FROM conversations c,
+     JSON_TABLE(c.messages, '$[*]' COLUMNS (
+         seq         FOR ORDINALITY,
+         role        VARCHAR2(20) PATH '$.role',
+         content     CLOB PATH '$.content',
+         ui_actions  CLOB FORMAT JSON PATH '$.ui_actions',
+         ts          VARCHAR2(40) PATH '$.timestamp'
+     )) jt
+WHERE c.messages IS NOT NULL;
+
+COMMIT;
+
+-- Once the backfill is verified, the legacy column can be emptied:
+-- UPDATE conversations SET messages = NULL;
+-- COMMIT;
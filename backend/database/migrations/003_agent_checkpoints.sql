@@ -0,0 +1,36 @@
+-- =============================================
+-- Migration 003 - agent_checkpoints / agent_checkpoint_writes
+-- Durable LangGraph checkpoints for the UI agent (replaces the
+-- in-process MemorySaver). No backfill: in-memory state is not kept.
+-- Run as VACANCEAI on a database created before this migration.
+-- =============================================
+
+CREATE TABLE agent_checkpoints (
+    thread_id             VARCHAR2(150) NOT NULL,
+    checkpoint_ns         VARCHAR2(255) NOT NULL,
+    checkpoint_id         VARCHAR2(64) NOT NULL,
+    parent_checkpoint_id  VARCHAR2(64),
+    checkpoint_type       VARCHAR2(30) NOT NULL,
+    checkpoint            BLOB NOT NULL,
+    metadata_type         VARCHAR2(30) NOT NULL,
+    metadata              BLOB NOT NULL,
+    created_at            TIMESTAMP WITH TIME ZONE DEFAULT SYSTIMESTAMP NOT NULL,
+    CONSTRAINT pk_agent_checkpoints PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+
+CREATE INDEX idx_agent_checkpoints_created ON agent_checkpoints(created_at);
+-- idle-thread pruning: "has this thread a checkpoint newer than the cutoff?"
+CREATE INDEX idx_agent_checkpoints_thread_created ON agent_checkpoints(thread_id, created_at);
+
+CREATE TABLE agent_checkpoint_writes (
+    thread_id       VARCHAR2(150) NOT NULL,
+    checkpoint_ns   VARCHAR2(255) NOT NULL,
+    checkpoint_id   VARCHAR2(64) NOT NULL,
+    task_id         VARCHAR2(64) NOT NULL,
+    idx             NUMBER NOT NULL,
+    channel         VARCHAR2(255) NOT NULL,
+    value_type      VARCHAR2(30) NOT NULL,
+    value           BLOB,
+    task_path       VARCHAR2(500),
+    CONSTRAINT pk_agent_checkpoint_writes PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
@@ -0,0 +1,20 @@
+-- =============================================
+-- Migration 004 - a2a_tasks
+-- Durable store for A2A protocol tasks (previously a process-local
+-- dict). Run as VACANCEAI on a database created before this migration.
+-- =============================================
+
+CREATE TABLE a2a_tasks (
+    id              VARCHAR2(36) PRIMARY KEY,
+    state           VARCHAR2(20) NOT NULL,
+    skill_id        VARCHAR2(100),
+    payload         CLOB NOT NULL CHECK (payload IS JSON),
+    created_at      TIMESTAMP WITH TIME ZONE NOT NULL,
+    updated_at      TIMESTAMP WITH TIME ZONE NOT NULL,
+    completed_at    TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX idx_a2a_tasks_state_created ON a2a_tasks(state, created_at, id);
+CREATE INDEX idx_a2a_tasks_created ON a2a_tasks(created_at, id);
+-- purge: finished states, updated_at older than the retention
+CREATE INDEX idx_a2a_tasks_state_updated ON a2a_tasks(state, updated_at);
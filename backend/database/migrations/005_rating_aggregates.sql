@@ -0,0 +1,28 @@
+-- =============================================
+-- Migration 005 - rating aggregates
+-- Running review sum/count per package and destination, maintained with
+-- each review insert (destinations.total_reviews was never updated
+-- before). Run as VACANCEAI on a database created before this migration.
+-- =============================================
+
+ALTER TABLE packages ADD (
+    total_reviews   NUMBER DEFAULT 0,
+    rating_sum      NUMBER DEFAULT 0
+);
+
+ALTER TABLE destinations ADD (
+    rating_sum      NUMBER DEFAULT 0
+);
+
+-- Backfill from existing reviews (same recompute as database.ratings.reconcile_ratings)
+UPDATE packages p SET
+    rating_sum    = (SELECT NVL(SUM(r.rating), 0) FROM reviews r WHERE r.package_id = p.id),
+    total_reviews = (SELECT COUNT(*) FROM reviews r WHERE r.package_id = p.id);
+
+UPDATE destinations d SET
+    rating_sum     = (SELECT NVL(SUM(p.rating_sum), 0) FROM packages p WHERE p.destination_id = d.id),
+    total_reviews  = (SELECT NVL(SUM(p.total_reviews), 0) FROM packages p WHERE p.destination_id = d.id),
+    average_rating = (SELECT NVL(ROUND(SUM(p.rating_sum) / NULLIF(SUM(p.total_reviews), 0), 1), 0)
+                      FROM packages p WHERE p.destination_id = d.id);
+
+COMMIT;
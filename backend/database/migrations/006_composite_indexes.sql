@@ -0,0 +1,31 @@
+-- =============================================
+-- Migration 006 - composite indexes
+-- Indexes matching the route query shapes (filter columns, then the
+-- keyset sort columns). Single-column indexes that are now a prefix of
+-- a composite one are dropped. Run as VACANCEAI on a database created
+-- before this migration.
+-- =============================================
+
+-- Catalog listings: active packages, optionally of one destination, by price
+CREATE INDEX idx_packages_active_dest_price ON packages(is_active, destination_id, price_per_person, id);
+CREATE INDEX idx_packages_active_price ON packages(is_active, price_per_person, id);
+DROP INDEX idx_packages_active;
+-- idx_packages_price stays: price ranges that do not also filter on
+-- is_active (admin/reporting queries, ad-hoc SQL) cannot use the
+-- composites above, which lead with is_active
+
+-- "My bookings", newest first, with or without a status filter
+CREATE INDEX idx_bookings_user_created ON bookings(user_id, created_at, id);
+CREATE INDEX idx_bookings_user_status ON bookings(user_id, status, created_at, id);
+DROP INDEX idx_bookings_user;
+
+-- uq_favorites (user_id, package_id) already covers user_id lookups
+DROP INDEX idx_favorites_user;
+
+-- Package reviews, newest first (keyset on created_at, id)
+CREATE INDEX idx_reviews_package_created ON reviews(package_id, created_at, id);
+DROP INDEX idx_reviews_package;
+
+-- TripAdvisor reviews of a location, paged by (created_at, id)
+CREATE INDEX idx_ta_reviews_location_created ON tripadvisor_reviews(location_id, created_at, id);
+DROP INDEX idx_ta_reviews_location;
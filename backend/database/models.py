@@ -1,12 +1,14 @@
 """SQLAlchemy ORM models for VacanceAI Oracle database"""
 
+import json
+from datetime import datetime, timezone
 from decimal import Decimal
 from sqlalchemy import (
-    Column, String, Integer, Numeric, Date, Text, ForeignKey,
-    UniqueConstraint, Index, text as sa_text,
+    Column, String, Integer, Numeric, Date, Text, ForeignKey, LargeBinary,
+    UniqueConstraint, Index, event, text as sa_text,
 )
 from sqlalchemy.dialects.oracle import CLOB, TIMESTAMP
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.orm import relationship, declarative_base, deferred
 
 from .types import JSONEncodedCLOB, OracleBoolean
 
@@ -24,6 +26,29 @@ def _f(value):
     return value
 
 
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+def normalize_tags(tags) -> list:
+    """Lowercase, strip and de-duplicate a tag list (accepts a JSON string)."""
+    if not tags:
+        return []
+    if isinstance(tags, str):
+        try:
+            tags = json.loads(tags)
+        except (json.JSONDecodeError, TypeError):
+            return []
+    result = []
+    for tag in tags:
+        if not isinstance(tag, str):
+            continue
+        tag = tag.strip().lower()
+        if tag and tag not in result:
+            result.append(tag)
+    return result
+
+
 # ============================================
 # 1. USERS
 # ============================================
@@ -90,14 +115,17 @@ class Destination(Base):
     description = Column(CLOB)
     image_url = Column(String(500))
     tags = Column(JSONEncodedCLOB)
+    # Running review aggregates (see database/ratings.py)
     average_rating = Column(Numeric(3, 1), default=0)
     total_reviews = Column(Integer, default=0)
+    rating_sum = Column(Integer, default=0)
     latitude = Column(Numeric(10, 7))
     longitude = Column(Numeric(10, 7))
     created_at = Column(TZ_TIMESTAMP, nullable=False, server_default=sa_text("SYSTIMESTAMP"))
     updated_at = Column(TZ_TIMESTAMP, nullable=False, server_default=sa_text("SYSTIMESTAMP"))
 
     packages = relationship("Package", back_populates="destination", cascade="all, delete-orphan")
+    tag_rows = relationship("DestinationTag", cascade="all, delete-orphan", passive_deletes=True)
 
     def to_dict(self):
         return {
@@ -142,12 +170,45 @@ class Destination(Base):
         }
 
 
+class DestinationTag(Base):
+    """Normalized (lowercased) copy of Destination.tags, one row per tag.
+
+    Kept in sync by the Destination.tags set listener below; tag filters
+    query this table instead of decoding the JSON CLOB.
+    """
+    __tablename__ = "destination_tags"
+    __table_args__ = (
+        Index("idx_destination_tags_tag", "tag", "destination_id"),
+    )
+
+    destination_id = Column(String(36), ForeignKey("destinations.id", ondelete="CASCADE"), primary_key=True)
+    tag = Column(String(50), primary_key=True)
+
+
+@event.listens_for(Destination.tags, "set")
+def _sync_destination_tags(target, value, oldvalue, initiator):
+    """Rebuild destination_tags rows whenever Destination.tags is assigned."""
+    existing = {row.tag: row for row in target.tag_rows}
+    target.tag_rows = [
+        existing.get(tag) or DestinationTag(tag=tag)
+        for tag in normalize_tags(value)
+    ]
+
+
 # ============================================
 # 4. PACKAGES
 # ============================================
 
 class Package(Base):
     __tablename__ = "packages"
+    __table_args__ = (
+        # Catalog listings: active packages, optionally of one destination, by price
+        Index("idx_packages_active_dest_price", "is_active", "destination_id", "price_per_person", "id"),
+        Index("idx_packages_active_price", "is_active", "price_per_person", "id"),
+        Index("idx_packages_price", "price_per_person"),
+        Index("idx_packages_destination", "destination_id"),
+        Index("idx_packages_dates", "available_from", "available_to"),
+    )
 
     id = Column(String(36), primary_key=True, server_default=sa_text("SYS_GUID()"))
     destination_id = Column(String(36), ForeignKey("destinations.id", ondelete="CASCADE"), nullable=False)
@@ -165,6 +226,9 @@ class Package(Base):
     available_to = Column(Date)
     is_active = Column(OracleBoolean, default=True)
     hotel_category = Column(Integer)
+    # Running review aggregates (see database/ratings.py)
+    total_reviews = Column(Integer, default=0)
+    rating_sum = Column(Integer, default=0)
     created_at = Column(TZ_TIMESTAMP, nullable=False, server_default=sa_text("SYSTIMESTAMP"))
     updated_at = Column(TZ_TIMESTAMP, nullable=False, server_default=sa_text("SYSTIMESTAMP"))
 
@@ -191,10 +255,19 @@ class Package(Base):
             "available_to": self.available_to,
             "is_active": self.is_active,
             "hotel_category": self.hotel_category,
+            "average_rating": self.average_rating,
+            "total_reviews": self.total_reviews or 0,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
 
+    @property
+    def average_rating(self):
+        """Mean review rating (1 decimal), or None without reviews."""
+        if not self.total_reviews:
+            return None
+        return round((self.rating_sum or 0) / self.total_reviews, 1)
+
     def to_dict_with_destination(self):
         """Package dict with nested destination (matches format_package_with_destination)."""
         d = self.to_dict()
@@ -239,6 +312,13 @@ class Package(Base):
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # "My bookings", newest first, with or without a status filter
+        Index("idx_bookings_user_created", "user_id", "created_at", "id"),
+        Index("idx_bookings_user_status", "user_id", "status", "created_at", "id"),
+        Index("idx_bookings_package", "package_id"),
+        Index("idx_bookings_status", "status"),
+    )
 
     id = Column(String(36), primary_key=True, server_default=sa_text("SYS_GUID()"))
     user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -290,6 +370,7 @@ class Booking(Base):
 class Favorite(Base):
     __tablename__ = "favorites"
     __table_args__ = (
+        # Also the index for per-user lookups (user_id, package_id)
         UniqueConstraint("user_id", "package_id", name="uq_favorites"),
     )
 
@@ -325,6 +406,11 @@ class Favorite(Base):
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Package reviews, newest first (keyset on created_at, id)
+        Index("idx_reviews_package_created", "package_id", "created_at", "id"),
+        Index("idx_reviews_user", "user_id"),
+    )
 
     id = Column(String(36), primary_key=True, server_default=sa_text("SYS_GUID()"))
     user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -373,22 +459,51 @@ class Conversation(Base):
 
     id = Column(String(36), primary_key=True)
     user_id = Column(String(36), ForeignKey("users.id", ondelete="SET NULL"))
-    messages = Column(JSONEncodedCLOB)
+    # Legacy whole-history CLOB, superseded by conversation_messages
+    messages = deferred(Column(JSONEncodedCLOB))
     context = Column(JSONEncodedCLOB)
     created_at = Column(TZ_TIMESTAMP, nullable=False, server_default=sa_text("SYSTIMESTAMP"))
     updated_at = Column(TZ_TIMESTAMP, nullable=False, server_default=sa_text("SYSTIMESTAMP"))
 
     def to_dict(self):
+        """Conversation metadata; messages are read from conversation_messages."""
         return {
             "id": self.id,
             "user_id": self.user_id,
-            "messages": self.messages or [],
             "context": self.context or {},
             "created_at": self.created_at,
             "updated_at": self.updated_at,
         }
 
 
+class ConversationMessage(Base):
+    """One chat message, append-only, ordered by seq within a conversation."""
+    __tablename__ = "conversation_messages"
+    __table_args__ = (
+        UniqueConstraint("conversation_id", "seq", name="uq_conversation_messages_seq"),
+    )
+
+    id = Column(String(36), primary_key=True, server_default=sa_text("SYS_GUID()"))
+    conversation_id = Column(String(36), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)
+    role = Column(String(20), nullable=False)
+    content = Column(CLOB)
+    ui_actions = Column(JSONEncodedCLOB)
+    created_at = Column(TZ_TIMESTAMP, nullable=False, server_default=sa_text("SYSTIMESTAMP"))
+
+    def to_dict(self):
+        """Message dict in the historical CLOB format (plus seq)."""
+        d = {
+            "seq": self.seq,
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.created_at.isoformat() if self.created_at else None,
+        }
+        if self.ui_actions is not None:
+            d["ui_actions"] = self.ui_actions
+        return d
+
+
 # ============================================
 # 9. TRIPADVISOR LOCATIONS
 # ============================================
@@ -460,6 +575,9 @@ class TripAdvisorLocation(Base):
 
 class TripAdvisorPhoto(Base):
     __tablename__ = "tripadvisor_photos"
+    __table_args__ = (
+        Index("idx_ta_photos_location", "location_id"),
+    )
 
     id = Column(String(36), primary_key=True, server_default=sa_text("SYS_GUID()"))
     location_id = Column(String(50), nullable=False)
@@ -495,6 +613,9 @@ class TripAdvisorPhoto(Base):
 
 class TripAdvisorReview(Base):
     __tablename__ = "tripadvisor_reviews"
+    __table_args__ = (
+        Index("idx_ta_reviews_location_created", "location_id", "created_at", "id"),
+    )
 
     id = Column(String(36), primary_key=True, server_default=sa_text("SYS_GUID()"))
     location_id = Column(String(50), nullable=False)
@@ -527,3 +648,65 @@ class TripAdvisorReview(Base):
             "url": self.url,
             "created_at": self.created_at,
         }
+
+
+# ============================================
+# 12. AGENT CHECKPOINTS (LangGraph)
+# ============================================
+# Timestamps are also set client-side so the checkpointer can run on
+# SQLite for local development.
+
+class AgentCheckpoint(Base):
+    """One serialized LangGraph checkpoint (channel values included)."""
+    __tablename__ = "agent_checkpoints"
+    __table_args__ = (
+        Index("idx_agent_checkpoints_created", "created_at"),
+        Index("idx_agent_checkpoints_thread_created", "thread_id", "created_at"),
+    )
+
+    thread_id = Column(String(150), primary_key=True)
+    checkpoint_ns = Column(String(255), primary_key=True)
+    checkpoint_id = Column(String(64), primary_key=True)
+    parent_checkpoint_id = Column(String(64))
+    checkpoint_type = Column(String(30), nullable=False)
+    checkpoint = Column(LargeBinary, nullable=False)
+    metadata_type = Column(String(30), nullable=False)
+    metadata_ = Column("metadata", LargeBinary, nullable=False)
+    created_at = Column(TZ_TIMESTAMP, nullable=False, default=_utcnow, server_default=sa_text("SYSTIMESTAMP"))
+
+
+class AgentCheckpointWrite(Base):
+    """A pending write recorded against a checkpoint by one task."""
+    __tablename__ = "agent_checkpoint_writes"
+
+    thread_id = Column(String(150), primary_key=True)
+    checkpoint_ns = Column(String(255), primary_key=True)
+    checkpoint_id = Column(String(64), primary_key=True)
+    task_id = Column(String(64), primary_key=True)
+    idx = Column(Integer, primary_key=True, autoincrement=False)
+    channel = Column(String(255), nullable=False)
+    value_type = Column(String(30), nullable=False)
+    value = Column(LargeBinary)
+    task_path = Column(String(500))
+
+
+# ============================================
+# 13. A2A TASKS
+# ============================================
+
+class A2ATask(Base):
+    """A2A protocol task; the full Task document is kept in `payload`."""
+    __tablename__ = "a2a_tasks"
+    __table_args__ = (
+        Index("idx_a2a_tasks_state_created", "state", "created_at", "id"),
+        Index("idx_a2a_tasks_created", "created_at", "id"),
+        Index("idx_a2a_tasks_state_updated", "state", "updated_at"),
+    )
+
+    id = Column(String(36), primary_key=True)
+    state = Column(String(20), nullable=False)
+    skill_id = Column(String(100))
+    payload = Column(CLOB, nullable=False)
+    created_at = Column(TZ_TIMESTAMP, nullable=False)
+    updated_at = Column(TZ_TIMESTAMP, nullable=False)
+    completed_at = Column(TZ_TIMESTAMP)
@@ -39,6 +39,12 @@ ALTER SESSION SET CURRENT_SCHEMA = VACANCEAI;
 -- ============================================
 -- Drop existing tables (reverse dependency order)
 -- ============================================
+BEGIN EXECUTE IMMEDIATE 'DROP TABLE a2a_tasks CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
+/
+BEGIN EXECUTE IMMEDIATE 'DROP TABLE agent_checkpoint_writes CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
+/
+BEGIN EXECUTE IMMEDIATE 'DROP TABLE agent_checkpoints CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
+/
 BEGIN EXECUTE IMMEDIATE 'DROP TABLE tripadvisor_reviews CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
 /
 BEGIN EXECUTE IMMEDIATE 'DROP TABLE tripadvisor_photos CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
@@ -47,6 +53,8 @@ BEGIN EXECUTE IMMEDIATE 'DROP TABLE tripadvisor_locations CASCADE CONSTRAINTS';
 /
 BEGIN EXECUTE IMMEDIATE 'DROP TABLE package_embeddings CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
 /
+BEGIN EXECUTE IMMEDIATE 'DROP TABLE conversation_messages CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
+/
 BEGIN EXECUTE IMMEDIATE 'DROP TABLE conversations CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
 /
 BEGIN EXECUTE IMMEDIATE 'DROP TABLE reviews CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
@@ -57,6 +65,8 @@ BEGIN EXECUTE IMMEDIATE 'DROP TABLE bookings CASCADE CONSTRAINTS'; EXCEPTION WHE
 /
 BEGIN EXECUTE IMMEDIATE 'DROP TABLE packages CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
 /
+BEGIN EXECUTE IMMEDIATE 'DROP TABLE destination_tags CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
+/
 BEGIN EXECUTE IMMEDIATE 'DROP TABLE destinations CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
 /
 BEGIN EXECUTE IMMEDIATE 'DROP TABLE refresh_tokens CASCADE CONSTRAINTS'; EXCEPTION WHEN OTHERS THEN IF SQLCODE != -942 THEN RAISE; END IF; END;
@@ -109,6 +119,7 @@ CREATE TABLE destinations (
     tags            CLOB CHECK (tags IS JSON),
     average_rating  NUMBER(3,1) DEFAULT 0,
     total_reviews   NUMBER DEFAULT 0,
+    rating_sum      NUMBER DEFAULT 0,   -- running aggregates, see database/ratings.py
     latitude        NUMBER(10,7),
     longitude       NUMBER(10,7),
     created_at      TIMESTAMP WITH TIME ZONE DEFAULT SYSTIMESTAMP NOT NULL,
@@ -118,6 +129,17 @@ CREATE TABLE destinations (
 CREATE INDEX idx_destinations_country ON destinations(country);
 CREATE INDEX idx_destinations_rating ON destinations(average_rating DESC);
 
+-- Normalized (lowercased) copy of destinations.tags, one row per tag.
+-- Maintained by the ORM; used by all tag filters.
+CREATE TABLE destination_tags (
+    destination_id  VARCHAR2(36) NOT NULL,
+    tag             VARCHAR2(50) NOT NULL,
+    CONSTRAINT pk_destination_tags PRIMARY KEY (destination_id, tag),
+    CONSTRAINT fk_destination_tags_dest FOREIGN KEY (destination_id) REFERENCES destinations(id) ON DELETE CASCADE
+);
+
+CREATE INDEX idx_destination_tags_tag ON destination_tags(tag, destination_id);
+
 -- ============================================
 -- 4. PACKAGES
 -- ============================================
@@ -138,14 +160,18 @@ CREATE TABLE packages (
     available_to    DATE,
     is_active       NUMBER(1) DEFAULT 1,
     hotel_category  NUMBER(1),
+    total_reviews   NUMBER DEFAULT 0,   -- running aggregates, see database/ratings.py
+    rating_sum      NUMBER DEFAULT 0,
     created_at      TIMESTAMP WITH TIME ZONE DEFAULT SYSTIMESTAMP NOT NULL,
     updated_at      TIMESTAMP WITH TIME ZONE DEFAULT SYSTIMESTAMP NOT NULL,
     CONSTRAINT fk_packages_destination FOREIGN KEY (destination_id) REFERENCES destinations(id) ON DELETE CASCADE
 );
 
-CREATE INDEX idx_packages_destination ON packages(destination_id);
+-- Catalog listings: active packages, optionally of one destination, by price
+CREATE INDEX idx_packages_active_dest_price ON packages(is_active, destination_id, price_per_person, id);
+CREATE INDEX idx_packages_active_price ON packages(is_active, price_per_person, id);
 CREATE INDEX idx_packages_price ON packages(price_per_person);
-CREATE INDEX idx_packages_active ON packages(is_active);
+CREATE INDEX idx_packages_destination ON packages(destination_id);
 CREATE INDEX idx_packages_dates ON packages(available_from, available_to);
 
 -- ============================================
@@ -170,7 +196,9 @@ CREATE TABLE bookings (
     CONSTRAINT chk_payment_status CHECK (payment_status IN ('unpaid', 'paid', 'refunded'))
 );
 
-CREATE INDEX idx_bookings_user ON bookings(user_id);
+-- "My bookings", newest first, with or without a status filter
+CREATE INDEX idx_bookings_user_created ON bookings(user_id, created_at, id);
+CREATE INDEX idx_bookings_user_status ON bookings(user_id, status, created_at, id);
 CREATE INDEX idx_bookings_package ON bookings(package_id);
 CREATE INDEX idx_bookings_status ON bookings(status);
 
@@ -187,7 +215,7 @@ CREATE TABLE favorites (
     CONSTRAINT uq_favorites UNIQUE (user_id, package_id)
 );
 
-CREATE INDEX idx_favorites_user ON favorites(user_id);
+-- uq_favorites (user_id, package_id) serves the per-user lookups
 
 -- ============================================
 -- 7. REVIEWS
@@ -207,7 +235,8 @@ CREATE TABLE reviews (
     CONSTRAINT chk_rating CHECK (rating BETWEEN 1 AND 5)
 );
 
-CREATE INDEX idx_reviews_package ON reviews(package_id);
+-- Package reviews, newest first (keyset on created_at, id)
+CREATE INDEX idx_reviews_package_created ON reviews(package_id, created_at, id);
 CREATE INDEX idx_reviews_user ON reviews(user_id);
 
 -- ============================================
@@ -225,6 +254,19 @@ CREATE TABLE conversations (
 
 CREATE INDEX idx_conversations_user ON conversations(user_id);
 
+-- One row per chat message (conversations.messages is legacy)
+CREATE TABLE conversation_messages (
+    id              VARCHAR2(36) DEFAULT SYS_GUID() PRIMARY KEY,
+    conversation_id VARCHAR2(36) NOT NULL,
+    seq             NUMBER NOT NULL,
+    role            VARCHAR2(20) NOT NULL,
+    content         CLOB,
+    ui_actions      CLOB CHECK (ui_actions IS JSON),
+    created_at      TIMESTAMP WITH TIME ZONE DEFAULT SYSTIMESTAMP NOT NULL,
+    CONSTRAINT fk_conv_messages_conversation FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE,
+    CONSTRAINT uq_conversation_messages_seq UNIQUE (conversation_id, seq)
+);
+
 -- ============================================
 -- 9. PACKAGE EMBEDDINGS (RAG - disabled for now)
 -- ============================================
@@ -305,7 +347,56 @@ CREATE TABLE tripadvisor_reviews (
     created_at          TIMESTAMP WITH TIME ZONE DEFAULT SYSTIMESTAMP NOT NULL
 );
 
-CREATE INDEX idx_ta_reviews_location ON tripadvisor_reviews(location_id);
+CREATE INDEX idx_ta_reviews_location_created ON tripadvisor_reviews(location_id, created_at, id);
+
+-- ============================================
+-- 13. AGENT CHECKPOINTS (LangGraph state of the UI agent)
+-- ============================================
+CREATE TABLE agent_checkpoints (
+    thread_id             VARCHAR2(150) NOT NULL,
+    checkpoint_ns         VARCHAR2(255) NOT NULL,
+    checkpoint_id         VARCHAR2(64) NOT NULL,
+    parent_checkpoint_id  VARCHAR2(64),
+    checkpoint_type       VARCHAR2(30) NOT NULL,
+    checkpoint            BLOB NOT NULL,
+    metadata_type         VARCHAR2(30) NOT NULL,
+    metadata              BLOB NOT NULL,
+    created_at            TIMESTAMP WITH TIME ZONE DEFAULT SYSTIMESTAMP NOT NULL,
+    CONSTRAINT pk_agent_checkpoints PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+
+CREATE INDEX idx_agent_checkpoints_created ON agent_checkpoints(created_at);
+CREATE INDEX idx_agent_checkpoints_thread_created ON agent_checkpoints(thread_id, created_at);
+
+CREATE TABLE agent_checkpoint_writes (
+    thread_id       VARCHAR2(150) NOT NULL,
+    checkpoint_ns   VARCHAR2(255) NOT NULL,
+    checkpoint_id   VARCHAR2(64) NOT NULL,
+    task_id         VARCHAR2(64) NOT NULL,
+    idx             NUMBER NOT NULL,
+    channel         VARCHAR2(255) NOT NULL,
+    value_type      VARCHAR2(30) NOT NULL,
+    value           BLOB,
+    task_path       VARCHAR2(500),
+    CONSTRAINT pk_agent_checkpoint_writes PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+
+-- ============================================
+-- 14. A2A TASKS
+-- ============================================
+CREATE TABLE a2a_tasks (
+    id              VARCHAR2(36) PRIMARY KEY,
+    state           VARCHAR2(20) NOT NULL,
+    skill_id        VARCHAR2(100),
+    payload         CLOB NOT NULL CHECK (payload IS JSON),
+    created_at      TIMESTAMP WITH TIME ZONE NOT NULL,
+    updated_at      TIMESTAMP WITH TIME ZONE NOT NULL,
+    completed_at    TIMESTAMP WITH TIME ZONE
+);
+
+CREATE INDEX idx_a2a_tasks_state_created ON a2a_tasks(state, created_at, id);
+CREATE INDEX idx_a2a_tasks_created ON a2a_tasks(created_at, id);
+CREATE INDEX idx_a2a_tasks_state_updated ON a2a_tasks(state, updated_at);
 
 -- ============================================
 -- TRIGGERS: auto-update updated_at
@@ -0,0 +1,117 @@
+"""Keyset (cursor) pagination helpers for VacanceAI
+
+A cursor is an opaque, URL-safe token wrapping the sort key of the last
+row of a page. The next page starts strictly after it, so paging cost
+does not grow with depth the way OFFSET does.
+
+Routes take `cursor` next to their legacy `limit`/`offset` parameters
+and return `next_cursor` (None on the last page); see keyset_page.
+"""
+
+import base64
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client sends a malformed or tampered cursor."""
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    if isinstance(value, dict) and "dec" in value:
+        return Decimal(value["dec"])
+    return value
+
+
+def encode_cursor(values: Sequence[Any], scope: Optional[str] = None) -> str:
+    """Encode a row's sort key as an opaque cursor.
+
+    `scope` (e.g. the sort order) is checked back by decode_cursor, so a
+    cursor cannot be replayed against a differently ordered listing.
+    """
+    if scope:
+        values = [scope, *values]
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], size: int, scope: Optional[str] = None) -> Optional[list]:
+    """Decode a cursor into its `size` sort-key values (None if no cursor)."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+    if scope:
+        if not isinstance(values, list) or not values or values[0] != scope:
+            raise InvalidCursor("Invalid cursor")
+        values = values[1:]
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor("Invalid cursor")
+    try:
+        return [_decode_value(v) for v in values]
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid cursor") from e
+
+
+def keyset_after(columns: Sequence, values: Sequence[Any], descending: bool = True):
+    """WHERE clause selecting rows after `values` in (columns...) order.
+
+    Expands the row-value comparison (a, b) < (x, y) into
+    a < x OR (a = x AND b < y), which every backend can serve from a
+    composite index on the same columns.
+    """
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        step = column < value if descending else column > value
+        equal = [c == v for c, v in zip(columns[:i], values[:i])]
+        clauses.append(and_(*equal, step) if equal else step)
+    return or_(*clauses)
+
+
+def keyset_page(
+    query,
+    columns: Sequence,
+    limit: Optional[int],
+    after: Optional[Sequence[Any]] = None,
+    offset: int = 0,
+    descending: bool = True,
+    scope: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """One page of `query` in (columns...) order, and the next page's cursor.
+
+    `columns` are mapped attributes of the queried entity ending with a
+    unique one (the id). Pages start after the decoded cursor `after`,
+    or at `offset` for clients still paging by offset; `limit=None`
+    returns every row (next cursor None).
+    """
+    if after is not None:
+        query = query.filter(keyset_after(columns, after, descending))
+    query = query.order_by(*(c.desc() if descending else c.asc() for c in columns))
+    if offset:
+        query = query.offset(offset)
+    if limit is None:
+        return query.all(), None
+
+    rows = query.limit(limit + 1).all()
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor([getattr(page[-1], c.key) for c in columns], scope)
+    return page, next_cursor
@@ -0,0 +1,98 @@
+"""Connection pool instrumentation for VacanceAI (SQLAlchemy pool events)"""
+
+import time
+import threading
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+from metrics import Histogram, register_collector
+
+_CHECKOUT_TS = "vacanceai_checkout_ts"
+
+
+class PoolMetrics:
+    """Counters and latency histograms for one engine's connection pool."""
+
+    def __init__(self):
+        self.wait_ms = Histogram()
+        self.hold_ms = Histogram()
+        self.connects = 0
+        self.checkouts = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+        self._engine = None
+
+    def _incr(self, attr: str):
+        with self._lock:
+            setattr(self, attr, getattr(self, attr) + 1)
+
+    def attach(self, engine):
+        """Listen to the engine's pool events."""
+        self._engine = engine
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_conn, record):
+        self._incr("connects")
+
+    def _on_checkout(self, dbapi_conn, record, proxy):
+        self._incr("checkouts")
+        record.info[_CHECKOUT_TS] = time.perf_counter()
+
+    def _on_checkin(self, dbapi_conn, record):
+        started = record.info.pop(_CHECKOUT_TS, None)
+        if started is not None:
+            self.hold_ms.observe((time.perf_counter() - started) * 1000)
+
+    def _on_invalidate(self, dbapi_conn, record, exception):
+        self._incr("invalidations")
+
+    def snapshot(self) -> dict:
+        pool = self._engine.pool if self._engine is not None else None
+        state = {}
+        if isinstance(pool, QueuePool):
+            state = {
+                "size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "idle": pool.checkedin(),
+                "overflow": max(pool.overflow(), 0),
+                "max_overflow": pool._max_overflow,
+                "timeout_seconds": pool.timeout(),
+            }
+        return {
+            **state,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_ms": self.wait_ms.snapshot(),
+            "hold_ms": self.hold_ms.snapshot(),
+        }
+
+
+pool_metrics = PoolMetrics()
+# Registered at import so GET /api/metrics/db-pool answers before init_engine
+register_collector("db_pool", pool_metrics.snapshot)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection.
+
+    Pool events fire only once a connection is handed out, so the wait
+    (queueing + connect) is timed around QueuePool._do_get.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics._incr("timeouts")
+            raise
+        finally:
+            pool_metrics.wait_ms.observe((time.perf_counter() - started) * 1000)
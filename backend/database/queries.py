@@ -0,0 +1,193 @@
+"""Reusable SQLAlchemy query builders for VacanceAI"""
+
+from datetime import date
+from typing import Dict, Optional, List, Sequence, Tuple
+
+from sqlalchemy import or_, func, select
+from sqlalchemy.orm import Session, aliased, contains_eager, joinedload
+
+from .models import Package, Destination, DestinationTag, Review, normalize_tags
+from .pagination import keyset_page
+
+
+def _contains_ci(column, value: str):
+    """Case-insensitive substring match (LOWER(col) LIKE '%value%')."""
+    return func.lower(column).contains(value.lower(), autoescape=True)
+
+
+def destination_has_tags(tags: Optional[List[str]]):
+    """EXISTS predicate on destination_tags matching any of `tags`, or None."""
+    tag_list = normalize_tags(tags)
+    if not tag_list:
+        return None
+    return Destination.tag_rows.any(DestinationTag.tag.in_(tag_list))
+
+
+def package_search_filters(
+    destination: Optional[str] = None,
+    destination_id: Optional[str] = None,
+    country: Optional[str] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    min_duration: Optional[int] = None,
+    max_duration: Optional[int] = None,
+    tags: Optional[List[str]] = None,
+    start_date: Optional[date] = None,
+) -> list:
+    """Build the WHERE criteria for a package search.
+
+    Criteria reference both Package and Destination, so the query they are
+    applied to must join Package.destination.
+    """
+    criteria = [Package.is_active == True]
+
+    if destination_id:
+        criteria.append(Package.destination_id == destination_id)
+    elif destination:
+        criteria.append(or_(
+            _contains_ci(Destination.name, destination),
+            _contains_ci(Destination.city, destination),
+            _contains_ci(Destination.country, destination),
+        ))
+    if country:
+        criteria.append(_contains_ci(Destination.country, country))
+    if min_price is not None:
+        criteria.append(Package.price_per_person >= min_price)
+    if max_price is not None:
+        criteria.append(Package.price_per_person <= max_price)
+    if min_duration is not None:
+        criteria.append(Package.duration_days >= min_duration)
+    if max_duration is not None:
+        criteria.append(Package.duration_days <= max_duration)
+    if start_date:
+        criteria.append(Package.available_from <= start_date)
+        criteria.append(Package.available_to >= start_date)
+
+    tag_filter = destination_has_tags(tags)
+    if tag_filter is not None:
+        criteria.append(tag_filter)
+
+    return criteria
+
+
+def search_packages_query(db: Session, criteria: list):
+    """Package query joined to its destination, filtered by `criteria`.
+
+    The destination is loaded from the same join (contains_eager), so
+    LIMIT/OFFSET apply to package rows directly.
+    """
+    return (
+        db.query(Package)
+        .join(Package.destination)
+        .options(contains_eager(Package.destination))
+        .filter(*criteria)
+    )
+
+
+def count_packages(db: Session, criteria: list) -> int:
+    """COUNT(*) of packages matching `criteria`."""
+    return (
+        db.query(func.count(Package.id))
+        .select_from(Package)
+        .join(Package.destination)
+        .filter(*criteria)
+        .scalar()
+    )
+
+
+def review_stats(db: Session, package_id: str) -> dict:
+    """Review count, average and 1-5 rating histogram of a package (one GROUP BY)."""
+    rows = (
+        db.query(Review.rating, func.count(Review.id))
+        .filter(Review.package_id == package_id)
+        .group_by(Review.rating)
+        .all()
+    )
+    histogram = {str(rating): 0 for rating in range(1, 6)}
+    for rating, count in rows:
+        histogram[str(rating)] = count
+    total = sum(count for _, count in rows)
+    average = round(sum(rating * count for rating, count in rows) / total, 2) if total else None
+    return {"count": total, "average": average, "histogram": histogram}
+
+
+def package_reviews_page(
+    db: Session,
+    package_id: str,
+    limit: int,
+    after: Optional[list] = None,
+    offset: int = 0,
+) -> Tuple[List[Review], Optional[str]]:
+    """Newest-first reviews of a package (with user) and the next page's cursor.
+
+    `after` is a decoded cursor (created_at, id); `offset` is kept for
+    clients still paging by offset.
+    """
+    query = (
+        db.query(Review)
+        .options(joinedload(Review.user))
+        .filter(Review.package_id == package_id)
+    )
+    return keyset_page(query, (Review.created_at, Review.id), limit, after=after, offset=offset)
+
+
+# Oracle caps IN lists at 1000 expressions
+_IN_BATCH = 500
+
+
+def _batches(ids: Sequence[str]):
+    for start in range(0, len(ids), _IN_BATCH):
+        yield ids[start:start + _IN_BATCH]
+
+
+def rows_by_location(
+    db: Session,
+    model,
+    location_ids: Sequence[str],
+    order_by: Sequence,
+    limit: Optional[int] = None,
+) -> Dict[str, list]:
+    """TripAdvisor photos/reviews (`model`) of each location, one IN-list query per batch.
+
+    With `limit`, only the first `limit` rows per location in `order_by`
+    order are fetched (ROW_NUMBER() OVER (PARTITION BY location_id)).
+    """
+    grouped: Dict[str, list] = {location_id: [] for location_id in location_ids}
+    if limit == 0:
+        return grouped
+    for batch in _batches(location_ids):
+        if limit is None:
+            query = (
+                db.query(model)
+                .filter(model.location_id.in_(batch))
+                .order_by(model.location_id, *order_by)
+            )
+        else:
+            rn = func.row_number().over(
+                partition_by=model.location_id, order_by=list(order_by)
+            ).label("rn")
+            ranked = select(model, rn).where(model.location_id.in_(batch)).subquery()
+            row = aliased(model, ranked)
+            query = (
+                db.query(row)
+                .filter(ranked.c.rn <= limit)
+                .order_by(ranked.c.location_id, ranked.c.rn)
+            )
+        for item in query:
+            grouped[item.location_id].append(item)
+    return grouped
+
+
+def totals_by_location(db: Session, model, location_ids: Sequence[str], *aggregates) -> Dict[str, tuple]:
+    """GROUP BY location_id of `aggregates` over `model`, batched like rows_by_location."""
+    totals: Dict[str, tuple] = {}
+    for batch in _batches(location_ids):
+        rows = (
+            db.query(model.location_id, *aggregates)
+            .filter(model.location_id.in_(batch))
+            .group_by(model.location_id)
+            .all()
+        )
+        for location_id, *values in rows:
+            totals[location_id] = tuple(values)
+    return totals
@@ -0,0 +1,160 @@
+"""Running review aggregates for packages and destinations
+
+packages and destinations keep rating_sum/total_reviews (destinations
+also the rounded average_rating they are sorted by). add_rating updates
+both with relative UPDATEs in the caller's transaction, so they commit
+or roll back with the review itself and concurrent reviews never
+overwrite each other. reconcile_ratings recomputes every aggregate from
+the reviews table in bulk and rewrites only the rows that drifted
+(reviews written or deleted outside the API). It is meant to run as a
+single job, not on every replica:
+
+    python -m database.ratings        # from backend/, e.g. a CronJob
+
+reconcile_loop runs it in-process when RATING_RECONCILE_INTERVAL_SECONDS
+is set, for single-process deployments.
+"""
+
+import asyncio
+import logging
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+
+from .models import Destination, Package, Review
+from .session import close_engine, create_session, init_engine, run_db
+
+logger = logging.getLogger("database")
+
+
+def add_rating(db: Session, package_id: str, rating: int):
+    """Count a new review of `package_id` (call before committing its insert)."""
+    (
+        db.query(Package)
+        .filter(Package.id == package_id)
+        .update(
+            {
+                Package.rating_sum: func.coalesce(Package.rating_sum, 0) + rating,
+                Package.total_reviews: func.coalesce(Package.total_reviews, 0) + 1,
+            },
+            synchronize_session=False,
+        )
+    )
+    # SET expressions all read the pre-update row, hence the "+ rating / + 1"
+    new_sum = func.coalesce(Destination.rating_sum, 0) + rating
+    new_count = func.coalesce(Destination.total_reviews, 0) + 1
+    destination_id = select(Package.destination_id).where(Package.id == package_id).scalar_subquery()
+    (
+        db.query(Destination)
+        .filter(Destination.id == destination_id)
+        .update(
+            {
+                Destination.rating_sum: new_sum,
+                Destination.total_reviews: new_count,
+                Destination.average_rating: func.round(new_sum / new_count, 1),
+            },
+            synchronize_session=False,
+        )
+    )
+
+
+def reconcile_ratings(db: Session) -> dict:
+    """Recompute every package and destination aggregate from the reviews table.
+
+    Only rows whose stored aggregates differ are updated; when none do,
+    the transaction is rolled back so no change event clears the caches.
+    """
+    package_sum = (
+        select(func.coalesce(func.sum(Review.rating), 0))
+        .where(Review.package_id == Package.id)
+        .scalar_subquery()
+    )
+    package_count = (
+        select(func.count(Review.id))
+        .where(Review.package_id == Package.id)
+        .scalar_subquery()
+    )
+    packages = (
+        db.query(Package)
+        .filter(or_(
+            func.coalesce(Package.rating_sum, -1) != package_sum,
+            func.coalesce(Package.total_reviews, -1) != package_count,
+        ))
+        .update(
+            {Package.rating_sum: package_sum, Package.total_reviews: package_count},
+            synchronize_session=False,
+        )
+    )
+
+    # From the package aggregates just written, in the same transaction
+    destination_sum = (
+        select(func.coalesce(func.sum(Package.rating_sum), 0))
+        .where(Package.destination_id == Destination.id)
+        .scalar_subquery()
+    )
+    destination_count = (
+        select(func.coalesce(func.sum(Package.total_reviews), 0))
+        .where(Package.destination_id == Destination.id)
+        .scalar_subquery()
+    )
+    destination_average = (
+        select(func.round(func.sum(Package.rating_sum) / func.nullif(func.sum(Package.total_reviews), 0), 1))
+        .where(Package.destination_id == Destination.id)
+        .scalar_subquery()
+    )
+    destinations = (
+        db.query(Destination)
+        .filter(or_(
+            func.coalesce(Destination.rating_sum, -1) != destination_sum,
+            func.coalesce(Destination.total_reviews, -1) != destination_count,
+            func.coalesce(Destination.average_rating, -1) != func.coalesce(destination_average, 0),
+        ))
+        .update(
+            {
+                Destination.rating_sum: destination_sum,
+                Destination.total_reviews: destination_count,
+                Destination.average_rating: func.coalesce(destination_average, 0),
+            },
+            synchronize_session=False,
+        )
+    )
+    if packages or destinations:
+        db.commit()
+    else:
+        db.rollback()
+    return {"packages": packages, "destinations": destinations}
+
+
+def _reconcile() -> dict:
+    db = create_session()
+    try:
+        return reconcile_ratings(db)
+    finally:
+        db.close()
+
+
+async def reconcile_loop(interval: float):
+    """Background task: reconcile the rating aggregates every `interval` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            counts = await run_db(_reconcile)
+            logger.info(
+                "Reconciled rating aggregates (%d packages, %d destinations rewritten)",
+                counts["packages"], counts["destinations"],
+            )
+        except Exception as e:
+            logger.error("Rating reconciliation failed: %s", e)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    init_engine()
+    try:
+        counts = _reconcile()
+    finally:
+        close_engine()
+    logger.info(
+        "Reconciled rating aggregates (%d packages, %d destinations rewritten)",
+        counts["packages"], counts["destinations"],
+    )
@@ -1,19 +1,23 @@
 """SQLAlchemy engine and session management for VacanceAI"""
 
 import logging
-from typing import Generator
+from typing import Any, Callable, Generator, TypeVar
 
+import anyio.to_thread
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from starlette.concurrency import run_in_threadpool
 
 from config import settings
+from .pool_metrics import InstrumentedQueuePool, pool_metrics
 
 logger = logging.getLogger("database")
 
 engine = None
 SessionLocal: sessionmaker = None
 
+T = TypeVar("T")
+
 
 def init_engine():
     """Initialize the SQLAlchemy engine and session factory."""
@@ -27,18 +31,24 @@ def init_engine():
 
     engine = create_engine(
         url,
-        poolclass=QueuePool,
-        pool_size=2,
-        max_overflow=8,
-        pool_pre_ping=True,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_use_lifo=settings.db_pool_use_lifo,
         echo=False,
     )
 
     SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
+    pool_metrics.attach(engine)
+
     logger.info(
-        "SQLAlchemy engine initialized: %s:%s/%s",
+        "SQLAlchemy engine initialized: %s:%s/%s (pool_size=%d, max_overflow=%d, pre_ping=%s)",
         settings.oracle_host, settings.oracle_port, settings.oracle_service,
+        settings.db_pool_size, settings.db_max_overflow, settings.db_pool_pre_ping,
     )
 
     # Route SQLAlchemy SQL logs to sql.log via the database logger
@@ -58,6 +68,28 @@ def close_engine():
         logger.info("SQLAlchemy engine disposed")
 
 
+def init_db_workers():
+    """Bound the worker pool used for blocking DB work.
+
+    FastAPI runs sync route handlers and dependencies (get_db,
+    get_current_user, ...) on AnyIO's default thread limiter, and run_db
+    uses the same limiter, so this caps all concurrent DB work per worker.
+    Must be called from the running event loop (app lifespan).
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = settings.db_worker_threads
+    logger.info("DB worker pool limited to %d threads", settings.db_worker_threads)
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run blocking SQLAlchemy work from async code on the DB worker pool.
+
+    Use this in async handlers (WebSocket, agents) instead of calling
+    Session methods directly on the event loop.
+    """
+    return await run_in_threadpool(fn, *args, **kwargs)
+
+
 def create_session() -> Session:
     """Create a new session (for use outside FastAPI Depends, e.g. WebSocket, agent tools)."""
     return SessionLocal()
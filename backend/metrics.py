@@ -0,0 +1,67 @@
+"""In-process metrics for VacanceAI Backend (histograms + collectors)"""
+
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, Optional
+
+# Default latency buckets, in milliseconds
+DEFAULT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Thread-safe fixed-bucket histogram (cumulative counts, Prometheus-style)."""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS_MS):
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """Record one observation."""
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[idx] += 1
+            self._sum += value
+            self._count += 1
+            if value > self._max:
+                self._max = value
+
+    def snapshot(self) -> dict:
+        """Return count/sum/avg/max and cumulative bucket counts."""
+        with self._lock:
+            counts = list(self._counts)
+            total, count, maximum = self._sum, self._count, self._max
+
+        cumulative = {}
+        running = 0
+        for bound, n in zip(self.buckets, counts):
+            running += n
+            cumulative[f"le_{bound:g}"] = running
+        cumulative["le_inf"] = running + counts[-1]
+
+        return {
+            "count": count,
+            "sum": round(total, 3),
+            "avg": round(total / count, 3) if count else 0.0,
+            "max": round(maximum, 3),
+            "buckets": cumulative,
+        }
+
+
+# Named snapshot providers exposed by GET /api/metrics
+_collectors: Dict[str, Callable[[], dict]] = {}
+
+
+def register_collector(name: str, collector: Callable[[], dict]):
+    """Register (or replace) a named metrics snapshot provider."""
+    _collectors[name] = collector
+
+
+def collect(name: Optional[str] = None) -> dict:
+    """Snapshot one collector by name, or all of them."""
+    if name is not None:
+        return _collectors[name]()
+    return {key: fn() for key, fn in _collectors.items()}
@@ -0,0 +1,38 @@
+"""Shared pytest setup: run from backend/ (imports are relative to it)."""
+
+import os
+import sys
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Agents build their models at import time
+os.environ.setdefault("GOOGLE_API_KEY", "test")
+
+
+@pytest.fixture
+def sessions():
+    """sessionmaker on an in-memory SQLite database with every table."""
+    from database.models import Base
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    # SYSTIMESTAMP is Oracle-only: use CURRENT_TIMESTAMP while creating the tables
+    swapped = []
+    for table in Base.metadata.tables.values():
+        for column in table.columns:
+            default = column.server_default
+            if default is not None and str(getattr(default, "arg", "")) == "SYSTIMESTAMP":
+                swapped.append((column, default.arg))
+                default.arg = text("CURRENT_TIMESTAMP")
+    try:
+        Base.metadata.create_all(engine)
+    finally:
+        for column, arg in swapped:
+            column.server_default.arg = arg
+    yield sessionmaker(bind=engine, autocommit=False, autoflush=False)
+    engine.dispose()
@@ -0,0 +1,255 @@
+"""A2A task cancellation: a cancelled run stops making LLM calls.
+
+Also covers the shared-store case, where the task runs on another replica,
+and admission under concurrent bursts.
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from a2a import server
+from a2a.protocol import Task, TaskCreateRequest, TaskInput, TaskOutput, TaskState
+from a2a.scheduler import TaskScheduler
+from a2a.store import InMemoryTaskStore
+import agents.orchestrator.agent as orchestrator
+
+
+class CountingAgent:
+    """stream_request stand-in: one "LLM call" (counted) per token, forever."""
+
+    def __init__(self):
+        self.calls = 0
+        self.messages = []
+
+    async def stream_request(self, message, skill_id=None, context=None):
+        self.messages.append(message)
+        while True:
+            await asyncio.sleep(0.01)
+            self.calls += 1
+            yield {"type": "token", "content": "."}
+
+
+class QuickAgent:
+    async def stream_request(self, message, skill_id=None, context=None):
+        yield {"type": "done", "response": "ok", "metadata": {}}
+
+
+@pytest.fixture
+def a2a(monkeypatch):
+    scheduler = TaskScheduler(workers=1, max_queue=10, max_per_client=10, skill_priorities={})
+    store = InMemoryTaskStore()
+    monkeypatch.setattr(server, "scheduler", scheduler)
+    monkeypatch.setattr(server, "task_store", store)
+    return scheduler, store
+
+
+def http_request():
+    return Request({"type": "http", "headers": [(b"x-client-id", b"tester")], "client": ("127.0.0.1", 1)})
+
+
+async def wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+def test_cancel_stops_llm_calls_and_frees_the_worker(a2a, monkeypatch):
+    scheduler, store = a2a
+    agent = CountingAgent()
+    monkeypatch.setattr(orchestrator, "stream_request", agent.stream_request)
+
+    async def scenario():
+        task = await server.create_task(TaskCreateRequest(message="plan my trip"), http_request())
+        await wait_for(lambda: agent.calls >= 3)
+        assert (await store.get(task.id)).state == TaskState.RUNNING
+
+        cancelled = await server.cancel_task(task.id)
+        assert cancelled.state == TaskState.CANCELLED
+        await wait_for(lambda: scheduler.running == 0)
+
+        calls = agent.calls
+        await asyncio.sleep(0.1)
+        assert agent.calls == calls  # no call after the cancellation
+        assert (await store.get(task.id)).state == TaskState.CANCELLED
+        assert scheduler.stats()["cancelled"] == 1
+        assert scheduler.stats()["clients"] == 0
+
+        # The single worker is free again: the next task runs to completion
+        monkeypatch.setattr(orchestrator, "stream_request", QuickAgent().stream_request)
+        follow_up = await server.create_task(TaskCreateRequest(message="again"), http_request())
+        await wait_for(lambda: follow_up.state == TaskState.COMPLETED)
+        assert (await store.get(task.id)).state == TaskState.CANCELLED
+
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+
+
+def test_cancel_while_queued_never_runs(a2a, monkeypatch):
+    scheduler, store = a2a
+    agent = CountingAgent()
+    monkeypatch.setattr(orchestrator, "stream_request", agent.stream_request)
+
+    async def scenario():
+        first = await server.create_task(TaskCreateRequest(message="first"), http_request())
+        queued = await server.create_task(TaskCreateRequest(message="second"), http_request())
+        await wait_for(lambda: agent.calls >= 1)
+
+        await server.cancel_task(queued.id)
+        await server.cancel_task(first.id)
+        await wait_for(lambda: scheduler.running == 0 and scheduler.depth == 0)
+        await asyncio.sleep(0.05)
+
+        # The queued task was skipped by its runner: the agent never saw it
+        assert agent.messages == ["first"]
+        assert (await store.get(queued.id)).state == TaskState.CANCELLED
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+
+
+class SharedStore(InMemoryTaskStore):
+    """In-memory store standing in for the Oracle one shared by replicas."""
+
+    shared = True
+
+
+def test_cancel_from_another_replica_interrupts_the_run(monkeypatch):
+    scheduler = TaskScheduler(workers=1, max_queue=10, max_per_client=10, skill_priorities={})
+    store = SharedStore()
+    monkeypatch.setattr(server, "scheduler", scheduler)
+    monkeypatch.setattr(server, "task_store", store)
+    monkeypatch.setattr(server.settings, "a2a_remote_poll_seconds", 0.02)
+    agent = CountingAgent()
+    monkeypatch.setattr(orchestrator, "stream_request", agent.stream_request)
+
+    async def scenario():
+        task = await server.create_task(TaskCreateRequest(message="plan my trip"), http_request())
+        await wait_for(lambda: agent.calls >= 3)
+
+        # Another replica only updates the shared store
+        remote = (await store.get(task.id)).model_copy(deep=True)
+        remote.cancel()
+        await store.save(remote)
+
+        await wait_for(lambda: scheduler.running == 0)
+        calls = agent.calls
+        await asyncio.sleep(0.1)
+        assert agent.calls == calls
+        assert (await store.get(task.id)).state == TaskState.CANCELLED
+        assert scheduler.stats()["cancelled"] == 1
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+
+
+def test_subscribe_to_a_task_run_elsewhere_polls_the_store(a2a, monkeypatch):
+    scheduler, store = a2a
+    monkeypatch.setattr(server.settings, "a2a_remote_poll_seconds", 0.01)
+
+    async def scenario():
+        # Stored by another replica, never submitted to this scheduler
+        task = Task(input=TaskInput(message="elsewhere"))
+        await store.save(task)
+        response = await server.subscribe_task(task.id)
+
+        frames = []
+
+        async def read():
+            async for frame in response.body_iterator:
+                frames.append(frame)
+
+        reader = asyncio.create_task(read())
+        await asyncio.sleep(0.05)
+        running = task.model_copy(deep=True)
+        running.start()
+        await store.save(running)
+        await asyncio.sleep(0.05)
+        done = running.model_copy(deep=True)
+        done.complete(TaskOutput(message="ok"))
+        await store.save(done)
+
+        await asyncio.wait_for(reader, timeout=2.0)
+        states = [json.loads(f.split("data: ", 1)[1])["state"] for f in frames]
+        assert states == ["pending", "running", "completed"]
+        assert json.loads(frames[-1].split("data: ", 1)[1])["final"] is True
+
+    asyncio.run(scenario())
+
+
+class SlowStore(InMemoryTaskStore):
+    """Saves hop to a thread like the Oracle store does."""
+
+    async def save(self, task):
+        await asyncio.sleep(0.02)
+        await super().save(task)
+
+
+class FailingStore(InMemoryTaskStore):
+    async def save(self, task):
+        await asyncio.sleep(0)
+        raise RuntimeError("database unavailable")
+
+
+def test_concurrent_burst_respects_the_client_quota(monkeypatch):
+    scheduler = TaskScheduler(workers=1, max_queue=100, max_per_client=3, skill_priorities={})
+    monkeypatch.setattr(server, "scheduler", scheduler)
+    monkeypatch.setattr(server, "task_store", SlowStore())
+    agent = CountingAgent()
+    monkeypatch.setattr(orchestrator, "stream_request", agent.stream_request)
+
+    async def scenario():
+        results = await asyncio.gather(*(
+            server.create_task(TaskCreateRequest(message=f"burst {i}"), http_request())
+            for i in range(10)
+        ), return_exceptions=True)
+        accepted = [r for r in results if not isinstance(r, Exception)]
+        rejected = [r for r in results if isinstance(r, HTTPException)]
+        assert len(accepted) == 3
+        assert len(rejected) == 7
+        assert all(r.status_code == 429 for r in rejected)
+        assert scheduler.stats()["rejected_client_quota"] == 7
+        assert scheduler.reserved == 0
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_burst_respects_the_queue_bound(monkeypatch):
+    scheduler = TaskScheduler(workers=1, max_queue=2, max_per_client=100, skill_priorities={})
+    monkeypatch.setattr(server, "scheduler", scheduler)
+    monkeypatch.setattr(server, "task_store", SlowStore())
+    agent = CountingAgent()
+    monkeypatch.setattr(orchestrator, "stream_request", agent.stream_request)
+
+    async def scenario():
+        results = await asyncio.gather(*(
+            server.create_task(TaskCreateRequest(message=f"burst {i}"), http_request())
+            for i in range(10)
+        ), return_exceptions=True)
+        assert sum(not isinstance(r, Exception) for r in results) == 2
+        assert scheduler.stats()["rejected_queue_full"] == 8
+        await scheduler.stop()
+
+    asyncio.run(scenario())
+
+
+def test_failed_save_releases_the_reserved_slot(monkeypatch):
+    scheduler = TaskScheduler(workers=1, max_queue=10, max_per_client=1, skill_priorities={})
+    monkeypatch.setattr(server, "scheduler", scheduler)
+    monkeypatch.setattr(server, "task_store", FailingStore())
+
+    async def scenario():
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await server.create_task(TaskCreateRequest(message="x"), http_request())
+        assert scheduler.reserved == 0
+        assert scheduler.stats()["clients"] == 0
+        assert scheduler.stats()["rejected_client_quota"] == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,84 @@
+"""InMemoryTaskStore eviction: finished tasks only, least recently used first."""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from a2a import store as a2a_store
+from a2a.protocol import Task, TaskInput, TaskOutput
+from a2a.store import InMemoryTaskStore
+
+
+def new_task(message):
+    return Task(input=TaskInput(message=message))
+
+
+def finished(task):
+    task.complete(TaskOutput(message="ok"))
+    return task
+
+
+def test_active_tasks_are_never_evicted():
+    async def scenario():
+        store = InMemoryTaskStore(max_tasks=2)
+        tasks = [new_task(f"t{i}") for i in range(4)]
+        for task in tasks:
+            await store.save(task)
+        # Over the bound, but every task still has a runner waiting on it
+        for task in tasks:
+            assert await store.get(task.id) is task
+        assert store.stats()["evicted"] == 0
+
+        await store.save(finished(tasks[0]))
+        await store.save(finished(tasks[1]))
+        assert await store.get(tasks[0].id) is None
+        assert await store.get(tasks[1].id) is None
+        assert await store.get(tasks[2].id) is tasks[2]
+        assert store.stats()["active"] == 2
+
+    asyncio.run(scenario())
+
+
+def test_least_recently_used_finished_task_is_evicted_first():
+    async def scenario():
+        store = InMemoryTaskStore(max_tasks=3)
+        running = new_task("running")
+        await store.save(running)
+        old, recent = finished(new_task("old")), finished(new_task("recent"))
+        await store.save(old)
+        await store.save(recent)
+        await store.get(old.id)  # now more recently used than `recent`
+
+        await store.save(new_task("new"))
+        assert await store.get(recent.id) is None
+        assert await store.get(old.id) is old
+        assert await store.get(running.id) is running
+
+        page, _ = await store.list(limit=10)
+        assert [t.input.message for t in page] == ["new", "old", "running"]
+
+    asyncio.run(scenario())
+
+
+def test_purge_drops_only_stale_finished_tasks():
+    async def scenario():
+        store = InMemoryTaskStore()
+        stale, fresh, running = finished(new_task("stale")), finished(new_task("fresh")), new_task("running")
+        stale.updated_at -= timedelta(hours=48)
+        running.updated_at -= timedelta(hours=48)
+        for task in (stale, fresh, running):
+            await store.save(task)
+
+        assert await store.purge(datetime.utcnow() - timedelta(hours=24)) == 1
+        assert await store.get(stale.id) is None
+        assert await store.get(fresh.id) is fresh
+        assert await store.get(running.id) is running
+
+    asyncio.run(scenario())
+
+
+def test_memory_store_holds_every_task_the_scheduler_admits(monkeypatch):
+    monkeypatch.setattr(a2a_store.settings, "a2a_task_store", "memory")
+    monkeypatch.setattr(a2a_store.settings, "a2a_memory_max_tasks", 10)
+    monkeypatch.setattr(a2a_store.settings, "a2a_max_queue", 100)
+    monkeypatch.setattr(a2a_store.settings, "a2a_workers", 4)
+    assert a2a_store.create_task_store().max_tasks == 104
@@ -0,0 +1,10 @@
+"""Refresh tokens stay unique for logins within the same second."""
+
+from auth.jwt_service import create_refresh_token, decode_token
+
+
+def test_refresh_tokens_differ_within_the_same_second():
+    first, _ = create_refresh_token("user-1")
+    second, _ = create_refresh_token("user-1")
+    assert first != second
+    assert decode_token(first)["sub"] == "user-1"
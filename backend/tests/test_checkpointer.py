@@ -0,0 +1,62 @@
+"""Idle-thread pruning: stale threads go, threads with recent checkpoints stay,
+and the lookup reads indexes only, never agent_checkpoints rows."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event
+
+from agents.checkpointer import DatabaseCheckpointSaver
+from database.models import AgentCheckpoint, AgentCheckpointWrite
+
+NOW = datetime.now(timezone.utc)
+
+
+def checkpoint(thread_id, checkpoint_id, age):
+    return AgentCheckpoint(
+        thread_id=thread_id, checkpoint_ns="~", checkpoint_id=checkpoint_id,
+        checkpoint_type="json", checkpoint=b"{}", metadata_type="json", metadata_=b"{}",
+        created_at=NOW - age,
+    )
+
+
+def test_prune_idle_threads(tmp_path):
+    saver = DatabaseCheckpointSaver(thread_ttl=timedelta(hours=72), sqlite_path=str(tmp_path / "cp.db"))
+    with saver._session() as db:
+        db.add_all([
+            checkpoint("idle", "1", timedelta(days=10)),
+            checkpoint("idle", "2", timedelta(days=5)),
+            # Started long ago, still in use
+            checkpoint("active", "1", timedelta(days=10)),
+            checkpoint("active", "2", timedelta(minutes=5)),
+            checkpoint("new", "1", timedelta(minutes=1)),
+        ])
+        db.add(AgentCheckpointWrite(
+            thread_id="idle", checkpoint_ns="~", checkpoint_id="2", task_id="t", idx=0,
+            channel="messages", value_type="json", value=b"[]",
+        ))
+        db.commit()
+
+    engine = saver._engine()
+    selects = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            selects.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        assert saver.prune_idle_threads() == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    with saver._session() as db:
+        assert sorted({row.thread_id for row in db.query(AgentCheckpoint)}) == ["active", "new"]
+        assert db.query(AgentCheckpointWrite).count() == 0
+
+    assert selects
+    with engine.connect() as conn:
+        for statement, parameters in selects:
+            plan = [row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+            full_scans = [d for d in plan if d.startswith("SCAN agent_checkpoints") and "INDEX" not in d]
+            print(plan)
+            assert not full_scans, plan
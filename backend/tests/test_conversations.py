@@ -0,0 +1,39 @@
+"""Conversation message persistence (_append_messages)."""
+
+from datetime import datetime, timezone
+
+from api.routes import conversations
+from database.models import Conversation, ConversationMessage
+
+
+def turn(n, at):
+    return [
+        {"role": "user", "content": f"question {n}", "timestamp": at.isoformat()},
+        {"role": "assistant", "content": f"answer {n}", "timestamp": datetime(2026, 1, 1, 12, 5).isoformat()},
+    ]
+
+
+def test_appends_keep_seq_order_and_timestamps(sessions, monkeypatch):
+    monkeypatch.setattr(conversations, "create_session", sessions)
+    asked = datetime(2026, 1, 1, 12, 0)
+
+    assert conversations._append_messages("c1", turn(1, asked), conv_exists=False)
+    # A second turn that also missed the conversation row (concurrent first turns)
+    assert conversations._append_messages("c1", turn(2, asked), conv_exists=False)
+
+    db = sessions()
+    rows = db.query(ConversationMessage).order_by(ConversationMessage.seq).all()
+    assert [(r.seq, r.content) for r in rows] == [
+        (1, "question 1"), (2, "answer 1"), (3, "question 2"), (4, "answer 2"),
+    ]
+    # The user message keeps the time it was sent, not the commit time
+    assert rows[0].created_at.replace(tzinfo=timezone.utc) == asked.replace(tzinfo=timezone.utc)
+    assert rows[0].created_at != rows[1].created_at
+    assert db.query(Conversation).count() == 1
+    db.close()
+
+
+def test_message_time():
+    assert conversations._message_time("2026-01-01T12:00:00") == datetime(2026, 1, 1, 12, tzinfo=timezone.utc)
+    assert conversations._message_time("not a date") is None
+    assert conversations._message_time(None) is None
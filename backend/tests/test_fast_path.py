@@ -0,0 +1,117 @@
+"""Orchestrator fast path: parse_intent slots and confidence."""
+
+import pytest
+
+from agents.orchestrator import fast_path
+from config import settings
+
+
+@pytest.fixture(autouse=True)
+def places():
+    """Known places without a database."""
+    fast_path._places.set("places", sorted(
+        [
+            ("france", "country", "France"),
+            ("spain", "country", "Spain"),
+            ("espagne", "country", "Spain"),
+            ("japon", "country", "Japan"),
+            ("japan", "country", "Japan"),
+            ("bali", "destination", "Bali"),
+        ],
+        key=lambda p: len(p[0]),
+        reverse=True,
+    ))
+    yield
+    fast_path._places.clear()
+
+
+def confident(message):
+    intent = fast_path.parse_intent(message)
+    return intent is not None and intent.confidence >= settings.fast_path_min_confidence
+
+
+@pytest.mark.parametrize("message, amount", [
+    ("show me beach packages under 1000€ in France", 1000),
+    ("beach trips in Spain less than 2 000 euros", 2000),
+    ("je cherche des vacances a la plage en France a moins de 1000€", 1000),
+    ("voyages en Espagne pas plus de 1500 euros", 1500),
+    ("packages in Spain 1200€ max", 1200),
+    ("packages in Spain under 1.5k", 1500),
+])
+def test_max_budget(message, amount):
+    intent = fast_path.parse_intent(message)
+    assert intent.name == "search_packages"
+    assert intent.slots["budget_max"] == amount
+    assert "budget_min" not in intent.slots
+    assert confident(message)
+
+
+@pytest.mark.parametrize("message, amount", [
+    ("show me beach packages above 1000€ in France", 1000),
+    ("je cherche des vacances a la plage en France a plus de 1000€", 1000),
+    ("beach trips in Spain at least 2000 euros", 2000),
+    ("show me packages in Spain from 1000€", 1000),
+    ("voyages au Japon à partir de 3000€", 3000),
+    ("packages in Spain over 800 eur", 800),
+    ("packages in Spain 1200€ minimum", 1200),
+])
+def test_min_budget(message, amount):
+    intent = fast_path.parse_intent(message)
+    assert intent.name == "search_packages"
+    assert intent.slots["budget_min"] == amount
+    assert "budget_max" not in intent.slots
+
+
+def test_min_and_max_budget():
+    intent = fast_path.parse_intent("packages in Spain above 500€ and under 1500€")
+    assert intent.slots["budget_min"] == 500
+    assert intent.slots["budget_max"] == 1500
+
+
+@pytest.mark.parametrize("message", [
+    "show me packages in Spain not under 1000€",
+    "beach packages in France but not in Bali",
+    "voyages en Espagne sauf la plage",
+    "vacances en France sans plage",
+    "il n y a pas de voyages en Espagne sous 1000€",
+])
+def test_negations_go_to_the_agents(message):
+    assert not confident(message)
+
+
+@pytest.mark.parametrize("message", [
+    "I want to book a trip to Japan",
+    "I want to cancel my trip to Japan",
+    "je veux reserver un voyage au Japon",
+    "je veux réserver un voyage au Japon",
+    "what is the cheapest trip to Japan",
+    "add the beach packages in Bali to my favorites",
+    "compare packages in Spain",
+    "les voyages les moins chers en Espagne",
+])
+def test_actions_and_rankings_go_to_the_agents(message):
+    assert not confident(message)
+
+
+@pytest.mark.parametrize("message", [
+    "show me packages in Spain 1000€",
+    "beach trips in France for 2000",
+])
+def test_bare_amount_is_not_a_budget(message):
+    intent = fast_path.parse_intent(message)
+    assert intent is None or not {"budget_min", "budget_max"} & set(intent.slots)
+    assert not confident(message)
+
+
+def test_duration_and_budget():
+    intent = fast_path.parse_intent("beach packages in Bali under 1000€ 7 days")
+    assert intent.slots == {
+        "travel_type": "beach", "destination": "Bali", "budget_max": 1000, "duration_days": 7,
+    }
+    assert confident("beach packages in Bali under 1000€ 7 days")
+
+
+def test_destinations_listing():
+    intent = fast_path.parse_intent("liste des destinations au Japon")
+    assert intent.name == "list_destinations"
+    assert intent.slots == {"country": "Japan"}
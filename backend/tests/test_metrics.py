@@ -0,0 +1,22 @@
+"""Metrics routes answer before the database engine is initialized."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import database.session as db_session
+from api.routes import metrics
+
+
+def test_db_pool_metrics_before_init_engine(monkeypatch):
+    monkeypatch.setattr(db_session, "engine", None)
+    monkeypatch.setattr(db_session.pool_metrics, "_engine", None)
+    app = FastAPI()
+    app.include_router(metrics.router, prefix="/api/metrics")
+    client = TestClient(app)
+
+    response = client.get("/api/metrics/db-pool")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["timeouts"] == 0
+    assert "size" not in body  # no pool yet
+    assert "db_pool" in client.get("/api/metrics/").json()
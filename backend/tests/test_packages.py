@@ -0,0 +1,47 @@
+"""GET /api/packages pagination."""
+
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes import packages
+from database.models import Destination, Package
+from database.session import get_db
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def test_cursor_pages_report_the_applied_offset(sessions):
+    db = sessions()
+    db.add(Destination(id="d1", name="Dest", country="France", created_at=NOW, updated_at=NOW))
+    for p in range(6):
+        db.add(Package(
+            id=f"p{p}", destination_id="d1", name=f"Package {p}", price_per_person=100 + p,
+            duration_days=7, is_active=True, created_at=NOW, updated_at=NOW,
+        ))
+    db.commit()
+    db.close()
+
+    app = FastAPI()
+    app.include_router(packages.router, prefix="/api/packages")
+
+    def override_db():
+        session = sessions()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_db
+    client = TestClient(app)
+
+    first = client.get("/api/packages/", params={"limit": 2, "offset": 1}).json()
+    assert first["offset"] == 1
+    assert [p["id"] for p in first["packages"]] == ["p1", "p2"]
+
+    second = client.get(
+        "/api/packages/", params={"limit": 2, "offset": 1, "cursor": first["next_cursor"]}
+    ).json()
+    assert second["offset"] == 0
+    assert [p["id"] for p in second["packages"]] == ["p3", "p4"]
@@ -0,0 +1,193 @@
+"""Route queries vs declared indexes.
+
+Runs the hot routes against seeded SQLite, captures every statement
+(before_cursor_execute) and asserts, with EXPLAIN QUERY PLAN, that none
+scans packages, bookings, reviews, favorites or the TripAdvisor
+photo/review tables in full. The same shapes are checked statically
+against the index prefixes declared on the models. On Oracle, run
+scripts/check_index_plans.py (EXPLAIN PLAN, TABLE ACCESS FULL).
+"""
+
+import uuid
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import UniqueConstraint, event
+
+from api.routes import bookings, favorites, packages, reviews, tripadvisor
+from auth.middleware import get_current_user
+from database.models import (
+    Base, Booking, Destination, Favorite, Package, Review, TripAdvisorLocation,
+    TripAdvisorPhoto, TripAdvisorReview, User,
+)
+from database.session import get_db
+
+WATCHED_TABLES = {
+    "packages", "bookings", "reviews", "favorites", "tripadvisor_photos", "tripadvisor_reviews",
+}
+
+# (table, equality columns then sort columns) used by the routes
+QUERY_SHAPES = [
+    ("packages", ["is_active", "destination_id", "price_per_person", "id"]),
+    ("packages", ["is_active", "price_per_person", "id"]),
+    ("packages", ["price_per_person"]),  # price ranges without is_active
+    ("bookings", ["user_id", "created_at", "id"]),
+    ("bookings", ["user_id", "status", "created_at", "id"]),
+    ("reviews", ["package_id", "created_at", "id"]),
+    ("favorites", ["user_id", "package_id"]),
+    ("tripadvisor_photos", ["location_id"]),
+    ("tripadvisor_reviews", ["location_id", "created_at", "id"]),
+    ("a2a_tasks", ["state", "updated_at"]),  # finished-task purge
+]
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def _index_columns(table):
+    for index in table.indexes:
+        yield [c.name for c in index.columns]
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            yield [c.name for c in constraint.columns]
+
+
+@pytest.mark.parametrize("table_name, columns", QUERY_SHAPES)
+def test_query_shape_has_index_prefix(table_name, columns):
+    table = Base.metadata.tables[table_name]
+    assert any(cols[:len(columns)] == columns for cols in _index_columns(table)), (
+        f"no index on {table_name} starting with {columns}"
+    )
+
+
+def _seed(db):
+    user = User(id="u1", email="u1@example.com", password_hash="x", created_at=NOW, updated_at=NOW)
+    db.add(user)
+    for d in range(5):
+        db.add(Destination(id=f"d{d}", name=f"Dest {d}", country=f"Country {d}", created_at=NOW, updated_at=NOW))
+        for p in range(20):
+            db.add(Package(
+                id=f"p{d}-{p:02d}", destination_id=f"d{d}", name=f"Package {p}",
+                price_per_person=500 + 37 * p, duration_days=3 + p % 10, is_active=p % 7 != 0,
+                available_from=date(2026, 1, 1), available_to=date(2026, 12, 31),
+                created_at=NOW, updated_at=NOW,
+            ))
+    for b in range(40):
+        db.add(Booking(
+            id=f"b{b:02d}", user_id="u1", package_id=f"p{b % 5}-{b % 20:02d}",
+            start_date=date(2026, 6, 1), end_date=date(2026, 6, 8), num_persons=2, total_price=1000,
+            status="completed" if b % 2 else "pending",
+            created_at=NOW + timedelta(minutes=b), updated_at=NOW,
+        ))
+        db.add(Review(
+            id=f"r{b:02d}", user_id="u1", package_id="p0-01", rating=1 + b % 5,
+            created_at=NOW + timedelta(minutes=b), updated_at=NOW,
+        ))
+    for f in range(10):
+        db.add(Favorite(id=str(uuid.uuid4()), user_id="u1", package_id=f"p1-{f:02d}", created_at=NOW))
+    for loc in range(10):
+        db.add(TripAdvisorLocation(
+            id=f"L{loc}", location_id=f"{loc}", name=f"Hotel {loc}", search_country="France",
+            created_at=NOW, updated_at=NOW,
+        ))
+        for i in range(8):
+            db.add(TripAdvisorPhoto(id=f"ph{loc}-{i}", location_id=f"{loc}", created_at=NOW + timedelta(minutes=i)))
+            db.add(TripAdvisorReview(
+                id=f"tr{loc}-{i}", location_id=f"{loc}", rating=4, text="...",
+                published_date=NOW - timedelta(days=i), created_at=NOW + timedelta(minutes=i),
+            ))
+    db.commit()
+
+
+ROUTE_CALLS = [
+    ("/api/packages", {}),
+    ("/api/packages", {"destination_id": "d1"}),
+    ("/api/packages", {"destination_id": "d1", "sort_by": "price_desc", "limit": 5}),
+    ("/api/packages", {"limit": 5, "cursor": "next"}),
+    ("/api/packages/p0-01", {}),
+    ("/api/reviews/package/p0-01", {"limit": 5, "cursor": "next"}),
+    ("/api/bookings", {}),
+    ("/api/bookings", {"status": "completed", "limit": 5}),
+    ("/api/bookings", {"limit": 5, "cursor": "next"}),
+    ("/api/favorites", {}),
+    ("/api/favorites/check/p1-01", {}),
+    ("/api/tripadvisor/locations/3/photos", {}),
+    ("/api/tripadvisor/locations/3/reviews", {"limit": 3, "cursor": "next"}),
+    ("/api/tripadvisor/locations-with-details", {"max_photos": 1, "max_reviews": 2}),
+    ("/api/tripadvisor/locations-with-details", {}),
+]
+
+
+@pytest.fixture
+def client(sessions):
+    db = sessions()
+    _seed(db)
+    db.close()
+
+    app = FastAPI()
+    app.include_router(packages.router, prefix="/api/packages")
+    app.include_router(bookings.router, prefix="/api/bookings")
+    app.include_router(reviews.router, prefix="/api/reviews")
+    app.include_router(favorites.router, prefix="/api/favorites")
+    app.include_router(tripadvisor.router, prefix="/api/tripadvisor")
+
+    def override_db():
+        session = sessions()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id="u1")
+    return TestClient(app), sessions.kw["bind"]
+
+
+def _call(test_client, path, params):
+    """GET the route; "next" cursors are replaced by the first page's next_cursor."""
+    if params.get("cursor") == "next":
+        first = test_client.get(path, params={k: v for k, v in params.items() if k != "cursor"})
+        assert first.status_code == 200, first.text
+        params = {**params, "cursor": first.json()["next_cursor"]}
+        assert params["cursor"], f"{path} returned a single page"
+    response = test_client.get(path, params=params)
+    assert response.status_code == 200, response.text
+
+
+def _full_scans(engine, statement, parameters):
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    scans = []
+    for row in plan:
+        detail = row[-1]
+        words = detail.split()
+        # "SCAN <table>" without "USING [COVERING] INDEX" reads the whole table
+        if words[:1] == ["SCAN"] and len(words) > 1 and words[1] in WATCHED_TABLES and "INDEX" not in words:
+            scans.append(detail)
+    return scans
+
+
+@pytest.mark.parametrize("path, params", ROUTE_CALLS)
+def test_route_queries_use_indexes(client, path, params):
+    test_client, engine = client
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        _call(test_client, path, params)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert captured
+    offenders = {}
+    for statement, parameters in captured:
+        scans = _full_scans(engine, statement, parameters)
+        if scans:
+            offenders[statement] = scans
+    assert not offenders, offenders
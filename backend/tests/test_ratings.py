@@ -0,0 +1,49 @@
+"""Rating reconciliation rewrites only drifted aggregates."""
+
+from datetime import datetime
+
+from database import change_events
+from database.models import Destination, Package, Review, User
+from database.ratings import reconcile_ratings
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def _seed(db):
+    db.add(User(id="u1", email="u1@example.com", password_hash="x", created_at=NOW, updated_at=NOW))
+    for d in range(2):
+        db.add(Destination(
+            id=f"d{d}", name=f"Dest {d}", country="France", created_at=NOW, updated_at=NOW,
+            rating_sum=0, total_reviews=0, average_rating=0,
+        ))
+        for p in range(3):
+            db.add(Package(
+                id=f"p{d}{p}", destination_id=f"d{d}", name=f"Package {p}", price_per_person=500,
+                duration_days=7, created_at=NOW, updated_at=NOW, rating_sum=0, total_reviews=0,
+            ))
+    for i, rating in enumerate((4, 5, 3)):
+        db.add(Review(id=f"r{i}", user_id="u1", package_id="p00", rating=rating, created_at=NOW, updated_at=NOW))
+    db.commit()
+
+
+def test_reconcile_rewrites_only_drifted_rows(sessions, monkeypatch):
+    changes = []
+    monkeypatch.setattr(change_events, "_listeners", {})
+    change_events.on_tables_changed(["packages", "destinations"], changes.append)
+
+    db = sessions()
+    _seed(db)
+    changes.clear()
+
+    assert reconcile_ratings(db) == {"packages": 1, "destinations": 1}
+    package = db.get(Package, "p00")
+    assert (package.rating_sum, package.total_reviews) == (12, 3)
+    destination = db.get(Destination, "d0")
+    assert (destination.rating_sum, destination.total_reviews) == (12, 3)
+    assert len(changes) == 1
+
+    # Nothing drifted: no row rewritten, no cache invalidated
+    changes.clear()
+    assert reconcile_ratings(db) == {"packages": 0, "destinations": 0}
+    assert changes == []
+    db.close()
@@ -0,0 +1,48 @@
+"""Agent tool runner: read tools time out, write tools never do."""
+
+import asyncio
+import time
+
+from langchain_core.messages import AIMessage
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from agents import tool_runner
+from agents.base import async_tool
+
+writes = []
+
+
+@async_tool
+def slow_search(query: str) -> str:
+    """Search slowly."""
+    time.sleep(0.3)
+    return "results"
+
+
+@async_tool(writes=True)
+def slow_booking(package_id: str) -> str:
+    """Book slowly."""
+    time.sleep(0.3)
+    writes.append(package_id)
+    return "booked"
+
+
+def test_write_tools_are_never_cut_off(monkeypatch):
+    monkeypatch.setattr(tool_runner.settings, "agent_tool_timeout_seconds", 0.05)
+    graph = StateGraph(MessagesState)
+    graph.add_node("tools", tool_runner.build_tool_node([slow_search, slow_booking]))
+    graph.add_edge(START, "tools")
+    graph.add_edge("tools", END)
+    step = AIMessage(content="", tool_calls=[
+        {"name": "slow_search", "args": {"query": "beach"}, "id": "call-1"},
+        {"name": "slow_booking", "args": {"package_id": "p1"}, "id": "call-2"},
+    ])
+
+    result = asyncio.run(graph.compile().ainvoke({"messages": [step]}))
+    replies = {m.tool_call_id: m for m in result["messages"][1:]}
+
+    assert replies["call-1"].status == "error"
+    assert "timed out" in replies["call-1"].content
+    assert replies["call-2"].status == "success"
+    assert replies["call-2"].content == "booked"
+    assert writes == ["p1"]
@@ -264,10 +264,17 @@ export const ChatWidget: React.FC = () => {
                         className={`max-w-[80%] rounded-lg px-4 py-2 ${
                           msg.role === 'user'
                             ? 'bg-blue-600 text-white'
-                            : 'bg-gray-100 text-gray-800'
+                            : msg.failed
+                              ? 'bg-gray-100 text-gray-500 border border-red-300'
+                              : 'bg-gray-100 text-gray-800'
                         }`}
                       >
                         <p className="text-sm whitespace-pre-wrap">{msg.content}</p>
+                        {msg.failed && (
+                          <p className="text-xs text-red-500 mt-1">
+                            Réponse interrompue, veuillez réessayer.
+                          </p>
+                        )}
                       </div>
                     </div>
                     {packages.length > 0 && (
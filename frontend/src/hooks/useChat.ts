@@ -19,6 +19,9 @@ export const useChat = ({ conversationId, onUIAction }: UseChatOptions) => {
   const isMountedRef = useRef(true);
   const retriesRef = useRef(0);
   const onUIActionRef = useRef(onUIAction);
+  // Assistant message being streamed (token frames) and UI actions already applied
+  const streamingRef = useRef(false);
+  const appliedActionsRef = useRef(0);
 
   // Keep the ref in sync with the latest callback without triggering effect re-runs
   useEffect(() => {
@@ -41,6 +44,17 @@ export const useChat = ({ conversationId, onUIAction }: UseChatOptions) => {
     const wsHost = apiUrl.replace(/^https?:\/\//, '');
     const wsUrl = `${wsProtocol}//${wsHost}/api/conversations/ws/${conversationId}`;
 
+    // Flag the streamed assistant message as cut short so it does not read as a full answer
+    const failStreamedMessage = () => {
+      appliedActionsRef.current = 0;
+      if (!streamingRef.current) return;
+      streamingRef.current = false;
+      setMessages((prev) => {
+        const last = prev[prev.length - 1];
+        return [...prev.slice(0, -1), { ...last, failed: true }];
+      });
+    };
+
     const connect = () => {
       if (!isMountedRef.current) return;
 
@@ -60,6 +74,8 @@ export const useChat = ({ conversationId, onUIAction }: UseChatOptions) => {
 
       ws.onclose = () => {
         setIsConnected(false);
+        setIsTyping(false);
+        failStreamedMessage();
         traceChat('chat.disconnect', { conversationId });
         console.log('Chat disconnected');
 
@@ -92,15 +108,50 @@ export const useChat = ({ conversationId, onUIAction }: UseChatOptions) => {
           return;
         }
 
+        // Streaming frames: token / tool_start / ui_action, then done
+        if (data.type === 'token') {
+          setIsTyping(false);
+          const chunk = data.content as string;
+          if (streamingRef.current) {
+            setMessages((prev) => {
+              const last = prev[prev.length - 1];
+              return [...prev.slice(0, -1), { ...last, content: last.content + chunk }];
+            });
+          } else {
+            streamingRef.current = true;
+            setMessages((prev) => [
+              ...prev,
+              { role: 'assistant', content: chunk, timestamp: new Date().toISOString() },
+            ]);
+          }
+          return;
+        }
+
+        if (data.type === 'tool_start') {
+          return;
+        }
+
+        if (data.type === 'ui_action') {
+          appliedActionsRef.current += 1;
+          onUIActionRef.current?.(data.action as UIAction);
+          return;
+        }
+
         setIsTyping(false);
         traceChat('chat.receive', { conversationId, hasError: !!data.error });
 
         if (data.error) {
           console.error('Chat error:', data.error);
+          failStreamedMessage();
           return;
         }
 
-        // Add assistant message
+        const wasStreaming = streamingRef.current;
+        const alreadyApplied = appliedActionsRef.current;
+        streamingRef.current = false;
+        appliedActionsRef.current = 0;
+
+        // Add (or finalize the streamed) assistant message
         const assistantMessage: ChatMessage = {
           role: 'assistant',
           content: data.response as string,
@@ -108,11 +159,13 @@ export const useChat = ({ conversationId, onUIAction }: UseChatOptions) => {
           ui_actions: data.ui_actions as UIAction[],
         };
 
-        setMessages((prev) => [...prev, assistantMessage]);
+        setMessages((prev) =>
+          wasStreaming ? [...prev.slice(0, -1), assistantMessage] : [...prev, assistantMessage]
+        );
 
-        // Handle UI actions via ref (avoids stale closure)
+        // Handle UI actions not already applied from ui_action frames (ref avoids stale closure)
         if (data.ui_actions && onUIActionRef.current) {
-          (data.ui_actions as UIAction[]).forEach((action: UIAction) => {
+          (data.ui_actions as UIAction[]).slice(alreadyApplied).forEach((action: UIAction) => {
             onUIActionRef.current!(action);
           });
         }
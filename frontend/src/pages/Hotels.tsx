@@ -16,6 +16,8 @@ interface HotelWithDetails {
   search_country: string;
   photos: TripAdvisorPhoto[];
   reviews: TripAdvisorReview[];
+  photo_count: number;
+  review_count: number;
   average_rating: number;
 }
 
@@ -42,7 +44,11 @@ export const Hotels: React.FC = () => {
     const fetchHotels = async () => {
       setLoading(true);
       try {
-        const data = await tripadvisorApi.getLocationsWithDetails(selectedCountry || undefined);
+        // Cards only show the first photo and the counts
+        const data = await tripadvisorApi.getLocationsWithDetails(selectedCountry || undefined, {
+          max_photos: 1,
+          max_reviews: 0,
+        });
         setHotels(data as unknown as HotelWithDetails[]);
       } catch (error) {
         console.error('Error fetching hotels:', error);
@@ -190,8 +196,8 @@ export const Hotels: React.FC = () => {
                       </div>
 
                       <div className="flex items-center gap-4 mt-3 text-sm text-gray-500">
-                        <span>{hotel.photos.length} photos</span>
-                        <span>{hotel.reviews.length} avis</span>
+                        <span>{hotel.photo_count} photos</span>
+                        <span>{hotel.review_count} avis</span>
                       </div>
 
                       <div className="mt-auto pt-4 flex items-end justify-between">
@@ -8,7 +8,7 @@ import { packagesApi, bookingsApi } from '../services/api';
 import { useAuth } from '../contexts/AuthContext';
 import { useSetPageContext } from '../contexts/PageContext';
 import { PageTransition, FadeIn, AnimatedButton } from '../components/animations';
-import type { Package } from '../types';
+import type { Package, Review } from '../types';
 
 export const PackageDetail: React.FC = () => {
   const { id } = useParams<{ id: string }>();
@@ -21,6 +21,11 @@ export const PackageDetail: React.FC = () => {
   const [error, setError] = useState('');
   const [selectedImage, setSelectedImage] = useState(0);
 
+  // Reviews beyond the newest ones embedded in the package
+  const [moreReviews, setMoreReviews] = useState<Review[]>([]);
+  const [reviewsCursor, setReviewsCursor] = useState<string | null>(null);
+  const [loadingReviews, setLoadingReviews] = useState(false);
+
   // Booking form
   const [startDate, setStartDate] = useState('');
   const [numPersons, setNumPersons] = useState(1);
@@ -35,6 +40,8 @@ export const PackageDetail: React.FC = () => {
       try {
         const data = await packagesApi.get(id);
         setPkg(data);
+        setMoreReviews([]);
+        setReviewsCursor(data.reviews_next_cursor ?? null);
       } catch {
         setError('Package introuvable');
       } finally {
@@ -44,6 +51,20 @@ export const PackageDetail: React.FC = () => {
     fetchPackage();
   }, [id]);
 
+  const loadMoreReviews = async () => {
+    if (!id || !reviewsCursor) return;
+    setLoadingReviews(true);
+    try {
+      const page = await packagesApi.reviews(id, reviewsCursor);
+      setMoreReviews((prev) => [...prev, ...page.reviews]);
+      setReviewsCursor(page.next_cursor);
+    } finally {
+      setLoadingReviews(false);
+    }
+  };
+
+  const reviews = [...(pkg?.reviews ?? []), ...moreReviews];
+
   useEffect(() => {
     if (pkg) {
       setPageContext({
@@ -287,14 +308,19 @@ export const PackageDetail: React.FC = () => {
               )}
 
               {/* Reviews */}
-              {pkg.reviews && pkg.reviews.length > 0 && (
+              {reviews.length > 0 && (
                 <FadeIn delay={0.4}>
                   <div className="bg-white/90 backdrop-blur-sm rounded-xl shadow p-6">
                     <h2 className="text-lg font-semibold text-gray-900 mb-4">
-                      Avis ({pkg.reviews.length})
+                      Avis ({pkg.review_stats?.count ?? reviews.length})
+                      {pkg.review_stats?.average != null && (
+                        <span className="ml-2 text-sm font-normal text-gray-500">
+                          {pkg.review_stats.average.toFixed(1)} / 5
+                        </span>
+                      )}
                     </h2>
                     <div className="space-y-4">
-                      {pkg.reviews.map((review) => (
+                      {reviews.map((review) => (
                         <div key={review.id} className="border-b last:border-b-0 pb-4 last:pb-0">
                           <div className="flex items-center justify-between mb-2">
                             <span className="font-medium text-gray-800">
@@ -320,6 +346,15 @@ export const PackageDetail: React.FC = () => {
                         </div>
                       ))}
                     </div>
+                    {reviewsCursor && (
+                      <button
+                        onClick={loadMoreReviews}
+                        disabled={loadingReviews}
+                        className="mt-4 text-sm font-medium text-blue-600 hover:text-blue-700 disabled:opacity-50"
+                      >
+                        {loadingReviews ? 'Chargement...' : "Voir plus d'avis"}
+                      </button>
+                    )}
                   </div>
                 </FadeIn>
               )}
@@ -1,5 +1,5 @@
 import axios from 'axios';
-import type { Package, Destination, Booking, AuthResponse, User, TripAdvisorLocation, TripAdvisorPhoto, TripAdvisorReview } from '../types';
+import type { Package, Destination, Booking, Review, AuthResponse, User, TripAdvisorLocation, TripAdvisorPhoto, TripAdvisorReview } from '../types';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8080';
 
@@ -138,9 +138,10 @@ export const packagesApi = {
     sort_by?: string;
     limit?: number;
     offset?: number;
+    cursor?: string;
   }) => {
     const { data } = await api.get('/api/packages', { params });
-    return data as { packages: Package[]; total: number };
+    return data as { packages: Package[]; total: number; next_cursor: string | null };
   },
 
   featured: async (limit = 6): Promise<Package[]> => {
@@ -153,6 +154,13 @@ export const packagesApi = {
     return data;
   },
 
+  reviews: async (id: string, cursor: string, limit = 10) => {
+    const { data } = await api.get(`/api/reviews/package/${id}`, {
+      params: { cursor, limit },
+    });
+    return data as { reviews: Review[]; next_cursor: string | null };
+  },
+
   checkAvailability: async (
     id: string,
     startDate: string,
@@ -255,13 +263,18 @@ export const tripadvisorApi = {
     return data.locations;
   },
 
-  getLocationsWithDetails: async (country?: string) => {
+  getLocationsWithDetails: async (
+    country?: string,
+    caps?: { max_photos?: number; max_reviews?: number }
+  ) => {
     const { data } = await api.get('/api/tripadvisor/locations-with-details', {
-      params: country ? { country } : {},
+      params: { ...(country ? { country } : {}), ...caps },
     });
     return data.locations as (TripAdvisorLocation & {
       photos: TripAdvisorPhoto[];
       reviews: TripAdvisorReview[];
+      photo_count: number;
+      review_count: number;
       average_rating: number;
     })[];
   },
@@ -45,10 +45,21 @@ export interface Package {
   is_active: boolean;
   images: string[];
   hotel_category?: number;
+  average_rating?: number | null;
+  total_reviews?: number;
   created_at: string;
   // Joined data
   destinations?: Destination;
   reviews?: Review[];
+  // Package detail only: newest reviews above, stats over all of them
+  review_stats?: ReviewStats;
+  reviews_next_cursor?: string | null;
+}
+
+export interface ReviewStats {
+  count: number;
+  average: number | null;
+  histogram: Record<string, number>;
 }
 
 export interface PackageIncludes {
@@ -105,6 +116,8 @@ export interface ChatMessage {
   content: string;
   timestamp?: string;
   ui_actions?: UIAction[];
+  // The stream ended in an error: `content` is only the partial answer
+  failed?: boolean;
 }
 
 export interface UIAction {
@@ -0,0 +1,78 @@
+"""
+Benchmark the orchestrator fast path against the LLM agents.
+
+Sends the same catalog queries through process_request twice, with the
+fast path on and off (response cache off in both runs), and prints
+p50/p95 latency and how many messages the fast path answered.
+
+Usage (from the repo root, with Oracle and GOOGLE_API_KEY configured
+as for the backend):
+    python scripts/bench_fast_path.py [--rounds 5]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from config import settings  # noqa: E402
+from database.session import init_engine, init_db_workers, close_engine  # noqa: E402
+from agents.orchestrator.agent import process_request  # noqa: E402
+
+MESSAGES = [
+    "show me beach packages under 1500€",
+    "liste des destinations",
+    "voyages au Japon à moins de 3000€",
+    "mountain trips 7 days",
+    "je cherche des vacances à la plage à partir de 1000€",
+    "list all destinations in France",
+]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def run(fast_path: bool, rounds: int):
+    settings.fast_path_enabled = fast_path
+    latencies = []
+    answered = 0
+    for _ in range(rounds):
+        for message in MESSAGES:
+            started = time.perf_counter()
+            result = await process_request(message)
+            latencies.append((time.perf_counter() - started) * 1000)
+            answered += "fast_path" in result["metadata"]
+    return latencies, answered
+
+
+def report(label, latencies, answered):
+    print(
+        f"{label:<12} n={len(latencies):<4} p50={statistics.median(latencies):8.1f} ms"
+        f"  p95={percentile(latencies, 95):8.1f} ms  fast-path answers={answered}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=5, help="passes over the message set per mode")
+    args = parser.parse_args()
+
+    init_engine()
+    init_db_workers()
+    settings.response_cache_enabled = False
+    try:
+        report("agents", *await run(False, args.rounds))
+        report("fast path", *await run(True, args.rounds))
+    finally:
+        close_engine()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
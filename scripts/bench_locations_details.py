@@ -0,0 +1,102 @@
+"""
+Compare query and row counts of /api/tripadvisor/locations-with-details.
+
+Loads the locations three ways against the configured database:
+  - joined:   the former joinedload(photos, reviews) query (one row per
+              photo x review of each hotel),
+  - IN lists: the route without caps (one IN-list query per table),
+  - capped:   the route as the Hotels page calls it (max_photos=1,
+              max_reviews=0).
+For each it prints the number of statements, the rows they return (each
+captured statement re-run as SELECT COUNT(*)), median time and the size
+of the JSON response.
+
+Usage (from the repo root, with the backend's Oracle settings):
+    python scripts/bench_locations_details.py [--country France] [--rounds 5]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+os.environ.setdefault("GOOGLE_API_KEY", "unused")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.orm import joinedload  # noqa: E402
+
+import database.session as db_session  # noqa: E402
+from api.routes.tripadvisor import list_locations_with_details  # noqa: E402
+from database.models import TripAdvisorLocation  # noqa: E402
+
+
+def joined(db, country):
+    query = db.query(TripAdvisorLocation).options(
+        joinedload(TripAdvisorLocation.photos),
+        joinedload(TripAdvisorLocation.reviews),
+    )
+    if country:
+        query = query.filter(TripAdvisorLocation.search_country == country)
+    rows = query.order_by(TripAdvisorLocation.name).all()
+    return {"locations": [r.to_dict_with_details() for r in rows]}
+
+
+def in_lists(db, country):
+    return list_locations_with_details(country=country, max_photos=None, max_reviews=None, db=db)
+
+
+def capped(db, country):
+    return list_locations_with_details(country=country, max_photos=1, max_reviews=0, db=db)
+
+
+def measure(engine, load, country, rounds):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    timings = []
+    size = 0
+    for i in range(rounds):
+        db = db_session.create_session()
+        if i == 0:
+            event.listen(engine, "before_cursor_execute", capture)
+        try:
+            started = time.perf_counter()
+            body = load(db, country)
+            timings.append((time.perf_counter() - started) * 1000)
+            size = len(json.dumps(body, default=str))
+        finally:
+            if i == 0:
+                event.remove(engine, "before_cursor_execute", capture)
+            db.close()
+
+    rows = 0
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows += conn.exec_driver_sql(f"SELECT COUNT(*) FROM ({statement}) counted", parameters).scalar()
+    return len(statements), rows, statistics.median(timings), size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--country", help="search_country filter (all locations if omitted)")
+    parser.add_argument("--rounds", type=int, default=5, help="timed runs per variant")
+    args = parser.parse_args()
+
+    db_session.init_engine()
+    engine = db_session.engine
+    try:
+        print(f"{'variant':<10} {'queries':>7} {'rows':>9} {'median ms':>10} {'JSON bytes':>11}")
+        for label, load in (("joined", joined), ("IN lists", in_lists), ("capped", capped)):
+            queries, rows, median_ms, size = measure(engine, load, args.country, args.rounds)
+            print(f"{label:<10} {queries:>7} {rows:>9} {median_ms:>10.1f} {size:>11}")
+    finally:
+        db_session.close_engine()
+
+
+if __name__ == "__main__":
+    main()
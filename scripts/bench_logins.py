@@ -0,0 +1,109 @@
+"""
+Benchmark concurrent logins through the bcrypt pool.
+
+Creates (or reuses) one account, then fires parallel POST /api/auth/login
+requests in-process (httpx ASGITransport, no server needed). Reports the
+status codes (503 + Retry-After once PASSWORD_HASH_MAX_QUEUE verifications
+are already waiting), login latency p50/p95, event loop lag while bcrypt
+runs, and the password_hashing metrics (queue wait, hash time, rejected).
+
+Usage (from the repo root, with the backend's Oracle settings):
+    python scripts/bench_logins.py [--logins 200] [--workers 2] [--max-queue 64]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+os.environ.setdefault("GOOGLE_API_KEY", "unused")
+
+import httpx  # noqa: E402
+
+from api.main import app  # noqa: E402
+from auth import jwt_service  # noqa: E402
+from database.session import init_engine, init_db_workers, close_engine  # noqa: E402
+
+EMAIL = "bench-logins@vacanceai.com"
+PASSWORD = "bench-logins-password"
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def loop_lag(samples, interval=0.01):
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        samples.append(max(0.0, loop.time() - expected) * 1000)
+
+
+async def login(client, latencies, statuses, retry_after):
+    started = time.perf_counter()
+    response = await client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    latencies.append((time.perf_counter() - started) * 1000)
+    statuses[response.status_code] += 1
+    if response.status_code == 503:
+        retry_after.add(response.headers.get("Retry-After"))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200, help="parallel login requests")
+    parser.add_argument("--workers", type=int, help="bcrypt threads (PASSWORD_HASH_WORKERS)")
+    parser.add_argument("--max-queue", type=int, help="waiting verifications before 503 (PASSWORD_HASH_MAX_QUEUE)")
+    args = parser.parse_args()
+
+    hasher = jwt_service.password_hasher
+    if args.workers or args.max_queue is not None:
+        hasher = jwt_service.PasswordHasher(
+            workers=args.workers or hasher.workers,
+            max_queue=hasher.max_queue if args.max_queue is None else args.max_queue,
+        )
+        jwt_service.password_hasher = hasher
+
+    init_engine()
+    init_db_workers()
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            signup = await client.post("/api/auth/signup", json={
+                "email": EMAIL, "password": PASSWORD, "first_name": "Bench", "last_name": "Logins",
+            })
+            if signup.status_code not in (200, 400):
+                signup.raise_for_status()
+
+            latencies, statuses, retry_after, lag = [], Counter(), set(), []
+            sampling = asyncio.create_task(loop_lag(lag))
+            started = time.perf_counter()
+            await asyncio.gather(*(
+                login(client, latencies, statuses, retry_after) for _ in range(args.logins)
+            ))
+            elapsed = time.perf_counter() - started
+            sampling.cancel()
+    finally:
+        close_engine()
+
+    stats = hasher.stats()
+    print(
+        f"{args.logins} parallel logins in {elapsed:.2f} s "
+        f"(bcrypt workers {stats['workers']}, max queue {stats['max_queue']}, rounds {stats['bcrypt_rounds']})"
+    )
+    print(f"status codes    {dict(statuses)}" + (f"  Retry-After {sorted(retry_after)}" if retry_after else ""))
+    print(f"latency         p50={statistics.median(latencies):.1f} ms  p95={percentile(latencies, 95):.1f} ms")
+    print(f"queue wait      avg={stats['wait_ms']['avg']} ms  max={stats['wait_ms']['max']} ms")
+    print(f"bcrypt          avg={stats['hash_ms']['avg']} ms over {stats['hash_ms']['count']} calls, rejected {stats['rejected']}")
+    if lag:
+        print(f"event loop lag  p50={statistics.median(lag):.1f} ms  max={max(lag):.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
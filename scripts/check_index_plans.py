@@ -0,0 +1,143 @@
+"""
+Check the route queries against Oracle execution plans.
+
+Calls the package, booking, review, favorite and TripAdvisor routes
+in-process against the configured database, captures every SELECT they
+send (before_cursor_execute), runs EXPLAIN PLAN on each and reports the
+ones whose plan contains TABLE ACCESS FULL on one of the indexed tables.
+Exits 1 if any does. Uses the busiest user, package and location already
+in the database, so run it after scripts/seed_oracle.py.
+
+backend/tests/test_query_indexes.py runs the same check on SQLite.
+
+Usage (from the repo root, with the backend's Oracle settings):
+    python scripts/check_index_plans.py
+"""
+
+import os
+import sys
+import uuid
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+os.environ.setdefault("GOOGLE_API_KEY", "unused")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, func  # noqa: E402
+
+from api.main import app  # noqa: E402
+from auth.middleware import get_current_user  # noqa: E402
+import database.session as db_session  # noqa: E402
+from database.models import Booking, Package, Review, TripAdvisorReview  # noqa: E402
+
+WATCHED_TABLES = {
+    "PACKAGES", "BOOKINGS", "REVIEWS", "FAVORITES", "TRIPADVISOR_PHOTOS", "TRIPADVISOR_REVIEWS",
+}
+
+
+def busiest(db, column):
+    row = db.query(column, func.count()).group_by(column).order_by(func.count().desc()).first()
+    return row[0] if row else None
+
+
+def route_calls(user_id, package_id, location_id, destination_id):
+    calls = [
+        ("/api/packages", {}),
+        ("/api/packages", {"sort_by": "price_desc", "limit": 5}),
+        ("/api/packages", {"limit": 5, "cursor": "next"}),
+        ("/api/bookings", {}),
+        ("/api/bookings", {"status": "confirmed", "limit": 5}),
+        ("/api/bookings", {"limit": 5, "cursor": "next"}),
+        ("/api/favorites", {}),
+        ("/api/tripadvisor/locations-with-details", {"max_photos": 1, "max_reviews": 2}),
+    ]
+    if destination_id:
+        calls.append(("/api/packages", {"destination_id": destination_id}))
+    if package_id:
+        calls += [
+            (f"/api/packages/{package_id}", {}),
+            (f"/api/reviews/package/{package_id}", {"limit": 5, "cursor": "next"}),
+            (f"/api/favorites/check/{package_id}", {}),
+        ]
+    if location_id:
+        calls += [
+            (f"/api/tripadvisor/locations/{location_id}/photos", {}),
+            (f"/api/tripadvisor/locations/{location_id}/reviews", {"limit": 3, "cursor": "next"}),
+        ]
+    return calls
+
+
+def call(client, path, params):
+    if params.get("cursor") == "next":
+        first = client.get(path, params={k: v for k, v in params.items() if k != "cursor"})
+        first.raise_for_status()
+        cursor = first.json().get("next_cursor")
+        if not cursor:
+            return
+        params = {**params, "cursor": cursor}
+    client.get(path, params=params).raise_for_status()
+
+
+def full_scans(conn, statement, parameters):
+    statement_id = uuid.uuid4().hex[:30]
+    cursor = conn.cursor()
+    cursor.execute(f"EXPLAIN PLAN SET STATEMENT_ID = '{statement_id}' FOR {statement}", parameters)
+    cursor.execute(
+        "SELECT object_name FROM plan_table"
+        " WHERE statement_id = :sid AND operation = 'TABLE ACCESS' AND options = 'FULL'",
+        sid=statement_id,
+    )
+    tables = {row[0] for row in cursor.fetchall()} & WATCHED_TABLES
+    cursor.execute("DELETE FROM plan_table WHERE statement_id = :sid", sid=statement_id)
+    return tables
+
+
+def main():
+    db_session.init_engine()
+    db_session.init_db_workers()
+    engine = db_session.engine
+
+    db = db_session.create_session()
+    try:
+        user_id = busiest(db, Booking.user_id)
+        package_id = busiest(db, Review.package_id)
+        location_id = busiest(db, TripAdvisorReview.location_id)
+        destination_id = busiest(db, Package.destination_id)
+    finally:
+        db.close()
+
+    app.dependency_overrides[get_current_user] = lambda: SimpleNamespace(id=user_id)
+    client = TestClient(app)
+
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        for path, params in route_calls(user_id, package_id, location_id, destination_id):
+            call(client, path, params)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    offenders = 0
+    raw = engine.raw_connection()
+    try:
+        for statement, parameters in captured:
+            tables = full_scans(raw.driver_connection, statement, parameters)
+            if tables:
+                offenders += 1
+                print(f"TABLE ACCESS FULL on {', '.join(sorted(tables))}:\n  {' '.join(statement.split())}\n")
+        raw.rollback()
+    finally:
+        raw.close()
+
+    print(f"{len(captured)} statements checked, {offenders} with full scans")
+    db_session.close_engine()
+    sys.exit(1 if offenders else 0)
+
+
+if __name__ == "__main__":
+    main()
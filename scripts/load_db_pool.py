@@ -0,0 +1,171 @@
+"""
+Load-test the DB worker pool against the former on-loop DB access.
+
+Sends the same concurrent requests to DB-backed routes in-process (httpx
+ASGITransport, no server needed) in two modes:
+  - on loop: every thread-pool hop (sync routes, get_db, run_db) runs
+    inline on the event loop, as the async handlers did before DB work
+    moved to the worker pool; requests serialize behind each query,
+  - pooled:  the current setup, DB work on DB_WORKER_THREADS threads.
+For each mode it reports throughput, latency p50/p95, status codes, peak
+DB worker threads, peak pool checkouts, checkout timeouts and event loop
+lag (which stays low only when no DB call blocks the loop).
+
+--db-latency adds a blocking sleep before every statement, to mimic the
+network round trip of a remote database when running against a local one.
+
+Usage (from the repo root, with the backend's Oracle settings):
+    python scripts/load_db_pool.py [--concurrency 64] [--requests 2000] [--threads 16] [--db-latency 0]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+os.environ.setdefault("GOOGLE_API_KEY", "unused")
+
+import anyio.to_thread  # noqa: E402
+import httpx  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from config import settings  # noqa: E402
+from api.main import app  # noqa: E402
+from database.pool_metrics import pool_metrics  # noqa: E402
+import database.session as db_session  # noqa: E402
+
+PATHS = [
+    "/api/packages/?limit=20",
+    "/api/packages/?sort_by=price_asc&limit=20",
+    "/api/destinations/",
+    "/api/tripadvisor/locations",
+    "/api/tripadvisor/countries",
+]
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@contextmanager
+def on_event_loop():
+    """Run every anyio.to_thread.run_sync call inline, blocking the loop."""
+    run_sync = anyio.to_thread.run_sync
+
+    async def inline(func, *args, **kwargs):
+        return func(*args)
+
+    anyio.to_thread.run_sync = inline
+    try:
+        yield
+    finally:
+        anyio.to_thread.run_sync = run_sync
+
+
+class Sampler:
+    """Samples limiter/pool usage and event loop lag every `interval` seconds."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.peak_threads = 0
+        self.peak_checked_out = 0
+        self.lag_ms = []
+        self._expected = None
+
+    async def run(self):
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        loop = asyncio.get_running_loop()
+        while True:
+            self._expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag_ms.append(max(0.0, loop.time() - self._expected) * 1000)
+            self.peak_threads = max(self.peak_threads, limiter.borrowed_tokens)
+            self.peak_checked_out = max(self.peak_checked_out, pool_metrics.snapshot().get("checked_out", 0))
+
+    def stop(self):
+        """Count the sleep still pending: a loop blocked until now never woke it."""
+        if self._expected is not None:
+            self.lag_ms.append(max(0.0, asyncio.get_running_loop().time() - self._expected) * 1000)
+
+
+async def worker(client, paths, latencies, statuses):
+    while paths:
+        path = paths.pop()
+        started = time.perf_counter()
+        try:
+            response = await client.get(path)
+            statuses[response.status_code] += 1
+        except Exception as e:
+            statuses[type(e).__name__] += 1
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def run(concurrency: int, requests: int) -> dict:
+    paths = [PATHS[i % len(PATHS)] for i in range(requests)]
+    latencies, statuses = [], Counter()
+    sampler = Sampler()
+    sampling = asyncio.create_task(sampler.run())
+    timeouts = pool_metrics.snapshot()["timeouts"]
+
+    started = time.perf_counter()
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            await asyncio.gather(*(worker(client, paths, latencies, statuses) for _ in range(concurrency)))
+    finally:
+        elapsed = time.perf_counter() - started
+        sampling.cancel()
+        sampler.stop()
+
+    return {
+        "req/s": f"{requests / elapsed:.0f}",
+        "p50 ms": f"{statistics.median(latencies):.1f}",
+        "p95 ms": f"{percentile(latencies, 95):.1f}",
+        "status codes": " ".join(f"{code}x{n}" for code, n in sorted(statuses.items(), key=str)),
+        "peak DB threads": str(sampler.peak_threads),
+        "peak checkouts": str(sampler.peak_checked_out),
+        "pool timeouts": str(pool_metrics.snapshot()["timeouts"] - timeouts),
+        "loop lag p95 ms": f"{percentile(sampler.lag_ms, 95):.1f}",
+        "loop lag max ms": f"{max(sampler.lag_ms):.1f}",
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=64, help="requests in flight")
+    parser.add_argument("--requests", type=int, default=2000, help="total requests per mode")
+    parser.add_argument("--threads", type=int, default=settings.db_worker_threads, help="DB_WORKER_THREADS")
+    parser.add_argument("--db-latency", type=float, default=0.0, help="extra ms per statement (simulated round trip)")
+    args = parser.parse_args()
+
+    settings.db_worker_threads = args.threads
+    db_session.init_engine()
+    db_session.init_db_workers()
+    if args.db_latency:
+        @event.listens_for(db_session.engine, "before_cursor_execute")
+        def round_trip(conn, cursor, statement, parameters, context, executemany):
+            time.sleep(args.db_latency / 1000)
+    try:
+        with on_event_loop():
+            baseline = await run(args.concurrency, args.requests)
+        pooled = await run(args.concurrency, args.requests)
+    finally:
+        db_session.close_engine()
+
+    print(
+        f"{args.requests} requests per mode, concurrency {args.concurrency}, "
+        f"{args.threads} DB worker threads, +{args.db_latency:g} ms per statement\n"
+    )
+    print(f"{'':<18}{'on loop':>16}{'pooled':>16}")
+    for key in baseline:
+        print(f"{key:<18}{baseline[key]:>16}{pooled[key]:>16}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -24,6 +24,10 @@ from datetime import datetime, date
 import oracledb
 import requests
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from database.models import normalize_tags  # noqa: E402
+
 # ============================================
 # Configuration
 # ============================================
@@ -454,6 +458,25 @@ def seed_destinations(conn, country_photos):
         for e in errors:
             print(f"    Destination batch error at row {e.offset}: {e.message}")
     print(f"  Inserted {len(rows) - len(errors)} / {len(rows)} destinations")
+
+    # Normalized tags (destination_tags) used by the API tag filters,
+    # lowercased before de-duplication like the model listener does
+    tag_rows = [
+        {"destination_id": dest_map[country], "tag": tag}
+        for country in COUNTRIES
+        for tag in normalize_tags(COUNTRY_DATA[country]["tags"])
+    ]
+    cursor.executemany(
+        "INSERT INTO destination_tags (destination_id, tag) VALUES (:destination_id, :tag)",
+        tag_rows,
+        batcherrors=True,
+    )
+    errors = cursor.getbatcherrors()
+    conn.commit()
+    if errors:
+        for e in errors:
+            print(f"    Destination tag batch error at row {e.offset}: {e.message}")
+    print(f"  Inserted {len(tag_rows) - len(errors)} / {len(tag_rows)} destination tags")
     return dest_map
 
 
@@ -545,6 +568,7 @@ def verify(conn):
         "tripadvisor_photos",
         "tripadvisor_reviews",
         "destinations",
+        "destination_tags",
         "packages",
     ]
     cursor = conn.cursor()
@@ -274,6 +274,7 @@ $manifests = @(
     "secrets.yaml",
     "jaeger.yaml",
     "backend.yaml",
+    "rating-reconciler.yaml",
     "frontend.yaml",
     "langgraph-studio.yaml",
     "ingress.yaml"